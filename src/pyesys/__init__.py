@@ -1,13 +1,65 @@
-from .handler import EventHandler, ErrorHandler, default_error_handler
-from .event import Event, create_event
+from .handler import (
+    EventHandler,
+    ErrorHandler,
+    CircuitBreaker,
+    default_error_handler,
+    batch_handler,
+    vectorized_handler,
+)
+from .event import (
+    Event,
+    create_event,
+    signature_cache_info,
+    clear_signature_cache,
+    set_default_executor,
+    get_default_executor,
+    set_default_error_handler,
+    get_default_error_handler,
+)
+from .errors import QueuedErrorHandler
+from .timing import LatencyHistogram
+from .metrics import (
+    EventMetrics,
+    MetricsRegistry,
+    get_metrics_registry,
+    render_prometheus,
+)
+from .sharded import ShardedEvent, create_sharded_event
 from .prop import event, EventDescriptor
+from .dispatcher import (
+    AsyncDispatcher,
+    get_dispatcher,
+    configure_dispatcher,
+    shutdown_dispatcher,
+)
 
 __all__ = [
     "EventHandler",
     "ErrorHandler",
+    "CircuitBreaker",
     "default_error_handler",
+    "batch_handler",
+    "vectorized_handler",
     "Event",
     "create_event",
+    "signature_cache_info",
+    "clear_signature_cache",
+    "set_default_executor",
+    "get_default_executor",
+    "set_default_error_handler",
+    "get_default_error_handler",
+    "QueuedErrorHandler",
+    "LatencyHistogram",
+    "EventMetrics",
+    "MetricsRegistry",
+    "get_metrics_registry",
+    "render_prometheus",
+    "ShardedEvent",
+    "create_sharded_event",
     "event",
     "EventDescriptor",
+    "AsyncDispatcher",
+    "get_dispatcher",
+    "configure_dispatcher",
+    "shutdown_dispatcher",
 ]
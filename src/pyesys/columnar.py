@@ -0,0 +1,74 @@
+from typing import Any, List, Sequence, Tuple
+
+try:  # Optional extra: pip install pyesys[numpy]
+    import numpy as _np
+except ImportError:  # pragma: no cover - exercised only without NumPy
+    _np = None
+
+
+def has_numpy() -> bool:
+    """
+    Check whether NumPy is available for columnar emission.
+
+    :return: True if vectorized handlers receive NumPy arrays.
+    """
+    return _np is not None
+
+
+def to_column(values: Any) -> Any:
+    """
+    Convert one column of samples to the type handed to vectorized handlers.
+
+    With NumPy installed this is ``numpy.asarray`` (no copy for arrays).
+    Without it, buffer-backed columns (``array.array``, ``bytes`` ...) become
+    a ``memoryview`` and anything else a tuple.
+
+    :param values: Sequence or buffer of samples.
+    :return: NumPy array, memoryview or tuple.
+    """
+    if _np is not None:
+        return _np.asarray(values)
+    try:
+        return memoryview(values)
+    except TypeError:
+        return tuple(values)
+
+
+def normalize_columns(columns: Sequence[Any]) -> Tuple[Tuple[Any, ...], int]:
+    """
+    Convert columns for vectorized handlers and check they line up.
+
+    :param columns: One sequence of samples per event parameter.
+    :return: Tuple of (converted columns, number of rows).
+    :raises ValueError: If the columns differ in length.
+    """
+    converted = tuple(to_column(c) for c in columns)
+    lengths = {len(c) for c in converted}
+    if len(lengths) > 1:
+        raise ValueError(f"All columns must have the same length, got {sorted(lengths)}")
+    return converted, lengths.pop() if lengths else 0
+
+
+def rows_from_columns(columns: Sequence[Any]) -> List[Tuple[Any, ...]]:
+    """
+    Transpose columns into per-row argument tuples for scalar handlers.
+
+    NumPy arrays and memoryviews are unpacked with ``tolist()`` so scalar
+    handlers see plain Python values.
+
+    :param columns: Converted columns of equal length.
+    :return: One argument tuple per row.
+    """
+    return list(
+        zip(*(c.tolist() if hasattr(c, "tolist") else c for c in columns))
+    )
+
+
+def columns_from_rows(rows: Sequence[Tuple[Any, ...]]) -> Tuple[Any, ...]:
+    """
+    Transpose per-row argument tuples into columns for vectorized handlers.
+
+    :param rows: Non-empty sequence of argument tuples of equal length.
+    :return: One converted column per parameter.
+    """
+    return tuple(to_column(c) for c in zip(*rows))
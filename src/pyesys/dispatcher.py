@@ -0,0 +1,272 @@
+import asyncio
+import atexit
+import threading
+from concurrent.futures import Future
+from typing import Any, Coroutine, Optional
+
+
+class AsyncDispatcher:
+    """
+    A long-lived asyncio event loop on a dedicated daemon thread.
+
+    Sync emitters use it to run async handlers without creating and tearing
+    down an event loop per emission. Work is handed over with
+    ``asyncio.run_coroutine_threadsafe`` and at most ``max_concurrency``
+    submitted coroutines run at once; the rest wait their turn on the loop.
+
+    The loop thread is started lazily on the first submission. A running
+    dispatcher is shut down at interpreter exit, letting submitted coroutines
+    finish for up to ``exit_timeout`` seconds.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_concurrency: int = 64,
+        name: str = "PyESys-Dispatcher",
+        exit_timeout: Optional[float] = 5.0,
+    ):
+        """
+        Initialize a dispatcher without starting its thread.
+
+        :param max_concurrency: Maximum number of submitted coroutines running at once.
+        :param name: Name of the loop thread.
+        :param exit_timeout: Maximum seconds to wait for pending coroutines at
+                             interpreter exit, or None to wait indefinitely.
+        :raises ValueError: If max_concurrency is less than 1.
+        """
+        if max_concurrency < 1:
+            raise ValueError(f"max_concurrency must be >= 1, got {max_concurrency}")
+
+        self._max_concurrency = max_concurrency
+        self._name = name
+        self._exit_timeout = exit_timeout
+        self._lock = threading.Lock()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._closed = False
+        # Counters: submitted is guarded by _lock, the others are only
+        # written from the loop thread
+        self._submitted = 0
+        self._started = 0
+        self._completed = 0
+
+    @property
+    def max_concurrency(self) -> int:
+        """
+        Maximum number of submitted coroutines running at once.
+
+        :return: The concurrency limit.
+        """
+        return self._max_concurrency
+
+    def _ensure_started(self) -> asyncio.AbstractEventLoop:
+        """
+        Start the loop thread if needed. Must be called with lock held.
+
+        :return: The running dispatcher loop.
+        """
+        if self._loop is None:
+            loop = asyncio.new_event_loop()
+            ready = threading.Event()
+            thread = threading.Thread(
+                target=self._run_loop, args=(loop, ready), name=self._name, daemon=True
+            )
+            thread.start()
+            ready.wait()
+            self._loop, self._thread = loop, thread
+            # The thread is a daemon so it cannot block exit forever; drain it
+            # explicitly instead of dropping pending handlers
+            atexit.register(self._shutdown_at_exit)
+        return self._loop
+
+    def _shutdown_at_exit(self) -> None:
+        """
+        Drain the dispatcher at interpreter exit.
+        """
+        self.shutdown(wait=True, timeout=self._exit_timeout)
+
+    def _on_loop_thread(self) -> bool:
+        """
+        :return: True if called from the dispatcher's own loop thread.
+        """
+        thread = self._thread
+        return thread is not None and thread is threading.current_thread()
+
+    def _run_loop(self, loop: asyncio.AbstractEventLoop, ready: threading.Event) -> None:
+        """
+        Body of the loop thread.
+
+        :param loop: Loop to run until stopped.
+        :param ready: Set once the loop is about to run.
+        """
+        asyncio.set_event_loop(loop)
+        self._semaphore = asyncio.Semaphore(self._max_concurrency)
+        loop.call_soon(ready.set)
+        try:
+            loop.run_forever()
+        finally:
+            try:
+                loop.run_until_complete(loop.shutdown_asyncgens())
+                loop.run_until_complete(loop.shutdown_default_executor())
+            finally:
+                loop.close()
+
+    async def _run_limited(self, coro: Coroutine[Any, Any, Any]) -> Any:
+        """
+        Run a coroutine once a concurrency slot is free.
+
+        :param coro: Coroutine to run.
+        :return: The coroutine's result.
+        """
+        async with self._semaphore:
+            self._started += 1
+            try:
+                return await coro
+            finally:
+                self._completed += 1
+
+    def submit(self, coro: Coroutine[Any, Any, Any]) -> Future:
+        """
+        Schedule a coroutine on the dispatcher loop from any thread.
+
+        :param coro: Coroutine to run.
+        :return: A concurrent.futures.Future for the coroutine's result.
+        :raises RuntimeError: If the dispatcher has been shut down.
+        """
+        with self._lock:
+            if self._closed:
+                coro.close()
+                raise RuntimeError("Cannot submit to a dispatcher that was shut down")
+            loop = self._ensure_started()
+            self._submitted += 1
+            # Scheduled under the lock, so a concurrent shutdown() queues its
+            # drain after this coroutine and awaits it
+            return asyncio.run_coroutine_threadsafe(self._run_limited(coro), loop)
+
+    def stats(self) -> dict[str, int]:
+        """
+        Snapshot of dispatcher metrics.
+
+        ``queue_depth`` counts submissions still waiting for a concurrency slot
+        (including ones not yet picked up by the loop) and ``running`` counts
+        those currently executing.
+
+        :return: Dictionary with submitted, completed, running, queue_depth
+                 and max_concurrency.
+        """
+        with self._lock:
+            submitted = self._submitted
+        started, completed = self._started, self._completed
+        return {
+            "submitted": submitted,
+            "completed": completed,
+            "running": started - completed,
+            "queue_depth": max(0, submitted - started),
+            "max_concurrency": self._max_concurrency,
+        }
+
+    def shutdown(self, wait: bool = True, timeout: Optional[float] = None) -> None:
+        """
+        Stop the dispatcher loop and join its thread.
+
+        Further submissions raise RuntimeError. Calling this more than once is
+        harmless.
+
+        :param wait: If True, let submitted coroutines finish first; otherwise
+                     cancel them.
+        :param timeout: Maximum seconds to wait for pending work and for the
+                        thread to exit, or None to wait indefinitely.
+        :raises RuntimeError: If called from a coroutine running on this
+                              dispatcher, which would wait for itself.
+        """
+        if self._on_loop_thread():
+            raise RuntimeError("Cannot shut down a dispatcher from its own loop thread")
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            loop, thread = self._loop, self._thread
+
+        if loop is None:
+            return
+        atexit.unregister(self._shutdown_at_exit)
+
+        async def finish_pending() -> None:
+            current = asyncio.current_task()
+            pending = [t for t in asyncio.all_tasks() if t is not current]
+            if not wait:
+                for task in pending:
+                    task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+
+        try:
+            asyncio.run_coroutine_threadsafe(finish_pending(), loop).result(timeout)
+        except TimeoutError:
+            pass
+        finally:
+            loop.call_soon_threadsafe(loop.stop)
+            thread.join(timeout)
+
+
+_default_dispatcher: Optional[AsyncDispatcher] = None
+_default_max_concurrency = 64
+_default_lock = threading.Lock()
+
+
+def get_dispatcher() -> AsyncDispatcher:
+    """
+    Return the process-wide dispatcher used by sync emitters, creating it if needed.
+
+    :return: The shared AsyncDispatcher.
+    """
+    global _default_dispatcher
+    dispatcher = _default_dispatcher
+    if dispatcher is None:
+        with _default_lock:
+            dispatcher = _default_dispatcher
+            if dispatcher is None:
+                dispatcher = _default_dispatcher = AsyncDispatcher(
+                    max_concurrency=_default_max_concurrency
+                )
+    return dispatcher
+
+
+def configure_dispatcher(*, max_concurrency: int) -> None:
+    """
+    Set the concurrency limit of the process-wide dispatcher.
+
+    Takes effect for the next dispatcher created; an already running
+    dispatcher is shut down gracefully and replaced on next use.
+
+    :param max_concurrency: Maximum number of async handler emissions running at once.
+    :raises ValueError: If max_concurrency is less than 1.
+    """
+    global _default_max_concurrency
+    if max_concurrency < 1:
+        raise ValueError(f"max_concurrency must be >= 1, got {max_concurrency}")
+    with _default_lock:
+        _default_max_concurrency = max_concurrency
+    shutdown_dispatcher()
+
+
+def shutdown_dispatcher(wait: bool = True, timeout: Optional[float] = None) -> None:
+    """
+    Shut down the process-wide dispatcher, if one was started.
+
+    A fresh dispatcher is created on next use.
+
+    :param wait: If True, let pending async handlers finish; otherwise cancel them.
+    :param timeout: Maximum seconds to wait, or None to wait indefinitely.
+    :raises RuntimeError: If called from an async handler running on the
+                          dispatcher, which would wait for itself.
+    """
+    global _default_dispatcher
+    with _default_lock:
+        dispatcher = _default_dispatcher
+        if dispatcher is not None and dispatcher._on_loop_thread():
+            raise RuntimeError("Cannot shut down the dispatcher from its own loop thread")
+        _default_dispatcher = None
+    if dispatcher is not None:
+        dispatcher.shutdown(wait=wait, timeout=timeout)
@@ -0,0 +1,294 @@
+import queue
+import sys
+import threading
+import time
+from typing import Any, Callable, Dict, Hashable, List, Optional, TextIO, Tuple
+
+
+class _Marker:
+    """
+    Queue item asking the reporter thread to signal once it got this far.
+    """
+
+    __slots__ = ("done", "stop")
+
+    def __init__(self, stop: bool) -> None:
+        """
+        :param stop: If True, the reporter thread exits after the marker.
+        """
+        self.done = threading.Event()
+        self.stop = stop
+
+
+def _handler_key(handler: Optional[Callable[..., Any]]) -> Hashable:
+    """
+    Identity of a reported handler that survives rebuilding bound methods.
+
+    :param handler: Callback passed to the error handler, or None.
+    :return: Hashable key.
+    """
+    if handler is None:
+        return None
+    owner = getattr(handler, "__self__", None)
+    func = getattr(handler, "__func__", handler)
+    return (func, id(owner) if owner is not None else None)
+
+
+class QueuedErrorHandler:
+    """
+    Error handler that reports from a background thread without blocking
+    emitters.
+
+    Calling it only enqueues the exception; a daemon thread formats and writes
+    the reports. Repeats of the same (handler, exception type) pair within
+    ``window`` seconds are not written individually: the first one is, and
+    the number of suppressed repeats is written when the window closes. Once
+    a window is open, repeats are counted by the caller without being queued
+    at all. When more than ``max_pending`` exceptions wait in the queue, new
+    ones are dropped and counted instead.
+
+    The thread starts on the first reported exception. Use :meth:`close` (for
+    example at shutdown) to write outstanding reports; the handler restarts
+    on the next exception.
+
+    Usage:
+    .. code-block:: python
+        from pyesys import QueuedErrorHandler, set_default_error_handler
+
+        set_default_error_handler(QueuedErrorHandler(window=5.0))
+    """
+
+    def __init__(
+        self,
+        *,
+        window: float = 1.0,
+        max_pending: int = 10_000,
+        stream: Optional[TextIO] = None,
+        name: str = "PyESys-Errors",
+    ):
+        """
+        Initialize a reporter without starting its thread.
+
+        :param window: Seconds during which repeats of a (handler, exception
+                       type) pair are counted instead of written.
+        :param max_pending: Maximum number of exceptions waiting to be reported.
+        :param stream: Text stream to write to, or None for the current ``sys.stderr``.
+        :param name: Name of the reporter thread.
+        :raises ValueError: If window is negative or max_pending is less than 1.
+        """
+        if window < 0:
+            raise ValueError(f"window must be >= 0, got {window}")
+        if max_pending < 1:
+            raise ValueError(f"max_pending must be >= 1, got {max_pending}")
+
+        self._window = window
+        self._max_pending = max_pending
+        self._stream = stream
+        self._name = name
+        self._queue: "queue.SimpleQueue[Any]" = queue.SimpleQueue()
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        # Open windows: (handler key, exception type) -> [window end, repeats,
+        # handler description]. Entries are added and removed by the reporter
+        # thread; callers only bump the repeat count
+        self._windows: Dict[Tuple[Hashable, type], List[Any]] = {}
+        # Counters: dropped is guarded by _lock, the others are only written
+        # from the reporter thread
+        self._dropped = 0
+        self._written = 0
+        self._suppressed = 0
+
+    def __call__(
+        self, exception: Exception, handler: Optional[Callable[..., None]]
+    ) -> None:
+        """
+        Queue an exception for reporting; never blocks.
+
+        :param exception: The exception that was raised.
+        :param handler: The handler that raised it (may be None).
+        """
+        key = (_handler_key(handler), type(exception))
+        stamp = time.monotonic()
+        entry = self._windows.get(key)
+        if entry is not None and stamp < entry[0]:
+            entry[1] += 1
+            return
+        if self._queue.qsize() >= self._max_pending:
+            with self._lock:
+                self._dropped += 1
+            return
+        if self._thread is None:
+            self._ensure_started()
+        self._queue.put((key, exception, handler, stamp))
+
+    def _ensure_started(self) -> None:
+        """
+        Start the reporter thread if it is not running.
+        """
+        with self._lock:
+            if self._thread is None:
+                thread = threading.Thread(target=self._run, name=self._name, daemon=True)
+                thread.start()
+                self._thread = thread
+
+    def _write(self, line: str) -> None:
+        """
+        Write one report line, ignoring failures of the stream.
+
+        :param line: Text without trailing newline.
+        """
+        stream = self._stream if self._stream is not None else sys.stderr
+        try:
+            print(line, file=stream)
+        except Exception:
+            pass
+
+    def _write_repeats(self, desc: str, exc_type: type, count: int) -> None:
+        """
+        Write how often a reported exception was repeated within its window.
+
+        :param desc: Handler description.
+        :param exc_type: Exception type.
+        :param count: Number of suppressed repeats.
+        """
+        self._write(
+            f"[PyESys] Handler {desc} raised {exc_type.__name__} {count} more "
+            f"time{'s' if count != 1 else ''} within {self._window:g}s"
+        )
+
+    def _run(self) -> None:
+        """
+        Body of the reporter thread.
+        """
+        windows = self._windows
+        while True:
+            timeout = None
+            if windows:
+                timeout = max(0.0, min(w[0] for w in windows.values()) - time.monotonic())
+            try:
+                item = self._queue.get(timeout=timeout)
+            except queue.Empty:
+                item = None
+
+            if isinstance(item, _Marker):
+                if item.stop:
+                    self._close_windows(None)
+                    self._report_dropped()
+                    item.done.set()
+                    return
+                item.done.set()
+            elif item is not None:
+                key, exception, handler, stamp = item
+                entry = windows.get(key)
+                if entry is not None and stamp < entry[0]:
+                    # Queued before the caller could see the window
+                    entry[1] += 1
+                else:
+                    if entry is not None:
+                        self._close_window(key)
+                    desc = repr(handler) if handler else "<unavailable>"
+                    self._write(
+                        f"[PyESys] Handler {desc} raised exception: {exception!r}"
+                    )
+                    self._written += 1
+                    windows[key] = [stamp + self._window, 0, desc]
+
+            self._close_windows(time.monotonic())
+            self._report_dropped()
+
+    def _close_window(self, key: Tuple[Hashable, type]) -> None:
+        """
+        Forget a window and write its repeat count.
+
+        :param key: (handler key, exception type) of the window.
+        """
+        _end, repeats, desc = self._windows.pop(key)
+        if repeats:
+            self._suppressed += repeats
+            self._write_repeats(desc, key[1], repeats)
+
+    def _close_windows(self, now: Optional[float]) -> None:
+        """
+        Close every window that has expired.
+
+        :param now: Current time, or None to close every window.
+        """
+        expired = [
+            k for k, w in list(self._windows.items()) if now is None or w[0] <= now
+        ]
+        for k in expired:
+            self._close_window(k)
+
+    def _report_dropped(self) -> None:
+        """
+        Write how many exceptions were dropped since the last report.
+        """
+        if not self._dropped:
+            return
+        with self._lock:
+            dropped, self._dropped = self._dropped, 0
+        self._write(
+            f"[PyESys] {dropped} handler exception{'s' if dropped != 1 else ''} "
+            f"dropped: error queue full"
+        )
+
+    def _send_marker(self, stop: bool, timeout: Optional[float]) -> bool:
+        """
+        Queue a marker and wait until the reporter thread reaches it.
+
+        :param stop: If True, the thread exits after the marker.
+        :param timeout: Maximum seconds to wait, or None to wait indefinitely.
+        :return: True if the marker was reached in time.
+        """
+        with self._lock:
+            thread = self._thread
+            if thread is None:
+                return True
+            marker = _Marker(stop)
+            self._queue.put(marker)
+        reached = marker.done.wait(timeout)
+        if stop and reached:
+            thread.join(timeout)
+            with self._lock:
+                if self._thread is thread:
+                    self._thread = None
+            if self._queue.qsize():
+                # Exceptions reported while closing
+                self._ensure_started()
+        return reached
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait until every exception queued so far has been processed.
+
+        Repeat counts of windows still open are not written yet.
+
+        :param timeout: Maximum seconds to wait, or None to wait indefinitely.
+        :return: True if the queue was processed in time.
+        """
+        return self._send_marker(False, timeout)
+
+    def close(self, timeout: Optional[float] = None) -> bool:
+        """
+        Write all outstanding reports, including open repeat counts, and stop
+        the reporter thread. A later exception starts it again.
+
+        :param timeout: Maximum seconds to wait, or None to wait indefinitely.
+        :return: True if the thread finished in time.
+        """
+        return self._send_marker(True, timeout)
+
+    def stats(self) -> dict[str, int]:
+        """
+        Snapshot of reporter metrics.
+
+        :return: Dictionary with written (individually written exceptions),
+                 suppressed (repeats of closed windows), dropped (not yet
+                 reported as dropped) and pending (still queued).
+        """
+        return {
+            "written": self._written,
+            "suppressed": self._suppressed,
+            "dropped": self._dropped,
+            "pending": self._queue.qsize(),
+        }
@@ -1,12 +1,615 @@
 import threading
 import inspect
 import asyncio
+import time
 import weakref
-import gc
-from typing import Callable, List, Tuple, Optional, Union, Iterable, Coroutine, Any
-from concurrent.futures import Future
+from functools import lru_cache
+from types import FunctionType
+from typing import (
+    Callable,
+    List,
+    Tuple,
+    Optional,
+    Union,
+    Iterable,
+    Coroutine,
+    Any,
+    Dict,
+    Hashable,
+    Literal,
+)
+from concurrent.futures import Executor, Future
+
+from .handler import (
+    CircuitBreaker,
+    EventHandler,
+    ErrorHandler,
+    default_error_handler,
+    P,
+)
+from .metrics import (
+    EventMetrics,
+    get_metrics_registry,
+    _ASYNC_PENDING,
+    _EMISSIONS,
+    _ERRORS,
+    _EVICTIONS,
+)
+from .registry import HandlerRegistry
+from .ranges import RangeRegistry
+from .columnar import (
+    columns_from_rows,
+    normalize_columns,
+    rows_from_columns,
+    to_column,
+)
+
+
+class _SignatureCache:
+    """
+    Bounded cache of handler signature compatibility verdicts.
+
+    Keys are ``(code object, is_bound_method, expected parameter kinds)``. For
+    plain Python functions the code object fully determines the parameter
+    count and kinds, so two functions sharing a code object (e.g. the same
+    method bound to many instances) always get the same verdict. Values are
+    None for a compatible handler, or the formatted handler signature for an
+    incompatible one so the error message can be rebuilt without inspecting.
+
+    When full, the oldest entry is dropped (FIFO). Lookups read the dict
+    without locking; only storing a verdict takes the lock. Hits and misses
+    are counted in per-thread shards, merged by :meth:`info`.
+    """
+
+    __slots__ = ("_entries", "_maxsize", "_lock", "_counts")
+
+    _MISSING = object()
+
+    def __init__(self, maxsize: int = 1024):
+        """
+        Initialize an empty cache.
+
+        :param maxsize: Maximum number of verdicts kept.
+        """
+        self._entries: dict[tuple, Optional[str]] = {}
+        self._maxsize = maxsize
+        self._lock = threading.Lock()
+        # Thread identifier -> [hits, misses]
+        self._counts: Dict[int, List[int]] = {}
+
+    @staticmethod
+    def key_for(handler: Callable[..., Any], expected_kinds: tuple) -> Optional[tuple]:
+        """
+        Build a cache key for a handler, or None if it is not cacheable.
+
+        Only plain functions and methods bound to plain functions qualify;
+        functions carrying ``__wrapped__`` or ``__signature__`` are skipped
+        because ``inspect.signature`` does not derive their shape from code.
+
+        :param handler: Handler being validated.
+        :param expected_kinds: Parameter kinds of the expected signature.
+        :return: Hashable key, or None.
+        """
+        func = getattr(handler, "__func__", handler)
+        if type(func) is not FunctionType:
+            return None
+        attrs = func.__dict__
+        if attrs and ("__wrapped__" in attrs or "__signature__" in attrs):
+            return None
+        return (func.__code__, func is not handler, expected_kinds)
+
+    def get(self, key: tuple) -> Any:
+        """
+        Look up a verdict, counting hits and misses.
+
+        :param key: Key from :meth:`key_for`.
+        :return: The cached verdict, or ``_SignatureCache._MISSING``.
+        """
+        verdict = self._entries.get(key, self._MISSING)
+        counts = self._counts.get(threading.get_ident())
+        if counts is None:
+            counts = self._counts[threading.get_ident()] = [0, 0]
+        counts[verdict is self._MISSING] += 1
+        return verdict
+
+    def put(self, key: tuple, verdict: Optional[str]) -> None:
+        """
+        Store a verdict unless another thread already did, evicting the
+        oldest entry when full.
+
+        :param key: Key from :meth:`key_for`.
+        :param verdict: None if compatible, otherwise the handler signature text.
+        """
+        with self._lock:
+            entries = self._entries
+            if key in entries:
+                return
+            if len(entries) >= self._maxsize:
+                del entries[next(iter(entries))]
+            entries[key] = verdict
+
+    def info(self) -> dict[str, int]:
+        """
+        Snapshot of cache statistics.
+
+        :return: Dictionary with hits, misses, size and maxsize.
+        """
+        hits = misses = 0
+        for counts in list(self._counts.values()):
+            hits += counts[0]
+            misses += counts[1]
+        return {
+            "hits": hits,
+            "misses": misses,
+            "size": len(self._entries),
+            "maxsize": self._maxsize,
+        }
+
+    def clear(self) -> None:
+        """
+        Drop all verdicts and reset the counters.
+        """
+        with self._lock:
+            self._entries = {}
+            self._counts = {}
+
+
+_signature_cache = _SignatureCache()
 
-from .handler import EventHandler, ErrorHandler, default_error_handler, P
+
+class _DispatchPlan:
+    """
+    Immutable view of an Event's handlers, precomputed for emission.
+
+    Handlers are classified once when the plan is built, using the
+    ``EventHandler._is_async`` and ``_is_batch`` flags computed at subscription
+    time, so emitters never inspect callables or rebuild bound methods. A new
+    plan is built only after subscriptions change.
+
+    ``sync`` and ``async_`` hold per-emission handlers; ``batch_sync`` and
+    ``batch_async`` hold batch-capable ones and ``vector`` the vectorized ones
+    of columnar events. ``all_async`` holds every async handler in
+    subscription order.
+
+    Handlers suspended by their circuit breaker are left out of every group
+    and of ``active``, but kept in ``handlers``; ``retry_at`` is then the
+    ``time.monotonic()`` at which the first of them may be retried, and None
+    otherwise.
+    """
+
+    __slots__ = (
+        "handlers",
+        "active",
+        "retry_at",
+        "sync",
+        "async_",
+        "batch_sync",
+        "batch_async",
+        "vector",
+        "all_async",
+    )
+
+    def __init__(self, handlers: Tuple[EventHandler, ...]):
+        """
+        Partition handlers into sync/async and per-emission/batch/vectorized groups.
+
+        :param handlers: All handlers in subscription order.
+        """
+        self.handlers = handlers
+        self.retry_at: Optional[float] = None
+        sync, async_, batch_sync, batch_async, vector = [], [], [], [], []
+        active = []
+        now = None
+        for h in handlers:
+            if h._breaker is not None:
+                if now is None:
+                    now = time.monotonic()
+                until = h._suspended_until(now)
+                if until is not None:
+                    if self.retry_at is None or until < self.retry_at:
+                        self.retry_at = until
+                    continue
+            active.append(h)
+            if h._is_vectorized:
+                vector.append(h)
+            elif h._is_batch:
+                (batch_async if h._is_async else batch_sync).append(h)
+            else:
+                (async_ if h._is_async else sync).append(h)
+        self.sync = tuple(sync)
+        self.async_ = tuple(async_)
+        self.batch_sync = tuple(batch_sync)
+        self.batch_async = tuple(batch_async)
+        self.vector = tuple(vector)
+        self.active = handlers if len(active) == len(handlers) else tuple(active)
+        self.all_async = (
+            tuple(h for h in self.active if h._is_async)
+            if async_ or batch_async
+            else ()
+        )
+
+
+_EMPTY_PLAN = _DispatchPlan(())
+
+# Merged plans cached per range index before it is flushed; stale entries
+# pile up when unkeyed or keyed subscriptions change but ranges do not
+_RANGE_PLANS_MAX = 256
+
+# Expected shape of batch-capable handlers: a single batch parameter
+_BATCH_SIG = inspect.signature(lambda batch: None)
+_BATCH_KINDS = tuple(p.kind for p in _BATCH_SIG.parameters.values())
+
+
+
+def _error_group(errors: List[Exception]) -> ExceptionGroup:
+    """
+    Wrap the exceptions collected during one emission.
+
+    The list is emptied: the tracebacks of the exceptions reference the
+    dispatch frames holding it, and the resulting reference cycles would
+    otherwise leave every failed emission to the cyclic garbage collector.
+
+    :param errors: Exceptions raised by handlers, in completion order.
+    :return: ExceptionGroup holding them.
+    """
+    count = len(errors)
+    group = ExceptionGroup(
+        f"{count} event handler{'s' if count != 1 else ''} failed", errors
+    )
+    errors.clear()
+    return group
+
+
+def _first_argument(*args: Any, **kwargs: Any) -> Any:
+    """
+    Default routing key extractor of events without a signature: the first
+    positional argument.
+
+    :param args: Emitted positional arguments.
+    :param kwargs: Emitted keyword arguments (ignored).
+    :return: The first positional argument.
+    :raises TypeError: If the emission has no positional arguments.
+    """
+    if not args:
+        raise TypeError(
+            "Routing key is the first positional argument, but none was emitted; "
+            "emit it positionally or create the event with a key_extractor"
+        )
+    return args[0]
+
+
+@lru_cache(maxsize=None)
+def _first_parameter(name: str) -> Callable[..., Any]:
+    """
+    Default routing key extractor of events with a signature: the first
+    parameter, whether emitted positionally or by keyword. Extractors are
+    shared by all events whose first parameter has the same name.
+
+    :param name: Name of the event's first parameter.
+    :return: Key extractor.
+    """
+
+    def extract(*args: Any, **kwargs: Any) -> Any:
+        if args:
+            return args[0]
+        try:
+            return kwargs[name]
+        except KeyError:
+            raise TypeError(f"Routing key parameter '{name}' was not emitted") from None
+
+    return extract
+
+
+SyncPolicy = Literal["executor", "inline", "batched"]
+_SYNC_POLICIES = ("executor", "inline", "batched")
+
+# Keyword options of the emit methods; they are never passed on to handlers
+_RESERVED_KWARGS = frozenset({"collect_errors", "max_concurrency", "ordered"})
+
+
+def _check_reserved(sig: inspect.Signature) -> None:
+    """
+    Refuse event signatures whose parameters could be passed by a keyword
+    that the emit methods reserve for their own options.
+
+    :param sig: Event signature.
+    :raises TypeError: If a keyword-capable parameter has a reserved name.
+    """
+    for p in sig.parameters.values():
+        if p.name in _RESERVED_KWARGS and p.kind in (
+            inspect.Parameter.POSITIONAL_OR_KEYWORD,
+            inspect.Parameter.KEYWORD_ONLY,
+        ):
+            raise TypeError(
+                f"Event parameter '{p.name}' clashes with an emit option; "
+                f"reserved names are {', '.join(sorted(_RESERVED_KWARGS))}"
+            )
+
+# Eager task starts (Python 3.12+): run a coroutine's first step immediately
+# and only schedule it on the loop if it actually suspends
+_eager_task_factory = getattr(asyncio, "eager_task_factory", None)
+
+# Process-wide executor for sync handlers in emit_async; None means the
+# running loop's default executor
+_default_executor: Optional[Executor] = None
+
+
+def set_default_executor(executor: Optional[Executor]) -> None:
+    """
+    Set the process-wide executor used for sync handlers during ``emit_async``.
+
+    Events created without an explicit ``executor=`` use this executor. Pass a
+    bounded pool (e.g. ``ThreadPoolExecutor(max_workers=8)``) to keep event
+    handlers from starving other users of the loop's default executor, or None
+    to go back to the loop's default executor.
+
+    :param executor: Executor to use, or None.
+    """
+    global _default_executor
+    _default_executor = executor
+
+
+def get_default_executor() -> Optional[Executor]:
+    """
+    Return the process-wide executor for sync handlers, if one was set.
+
+    :return: The executor, or None for the loop's default executor.
+    """
+    return _default_executor
+
+
+# Process-wide error handler for events created without error_handler=
+_default_error_handler: ErrorHandler = default_error_handler
+
+
+def set_default_error_handler(handler: Optional[ErrorHandler]) -> None:
+    """
+    Set the process-wide error handler for events created without an explicit
+    ``error_handler=``, including existing ones.
+
+    Pass a :class:`~pyesys.errors.QueuedErrorHandler` to report from a
+    background thread instead of writing to stderr inside ``emit``, or None
+    to go back to :func:`~pyesys.handler.default_error_handler`.
+
+    :param handler: Error handler to use, or None.
+    :raises TypeError: If handler is not callable.
+    """
+    global _default_error_handler
+    if handler is not None and not callable(handler):
+        raise TypeError(f"Error handler must be callable, got {type(handler)}")
+    _default_error_handler = handler or default_error_handler
+
+
+def get_default_error_handler() -> ErrorHandler:
+    """
+    Return the process-wide error handler.
+
+    :return: The current default error handler.
+    """
+    return _default_error_handler
+
+
+def _report_to_default(
+    exception: Exception, handler: Optional[Callable[..., None]]
+) -> None:
+    """
+    Error handler of events created without ``error_handler=``: forwards to the
+    process-wide default, looked up per call so changes apply to existing events.
+
+    :param exception: The exception that was raised.
+    :param handler: The handler that raised it (may be None).
+    """
+    _default_error_handler(exception, handler)
+
+
+def signature_cache_info() -> dict[str, int]:
+    """
+    Return hit/miss statistics of the shared signature validation cache.
+
+    :return: Dictionary with ``hits``, ``misses``, ``size`` and ``maxsize``.
+    """
+    return _signature_cache.info()
+
+
+def clear_signature_cache() -> None:
+    """
+    Clear the shared signature validation cache and reset its counters.
+    """
+    _signature_cache.clear()
+
+
+# Guard the lazy creation of per-event locks, listeners and eviction
+# queues. Striped by event identity, so unrelated events rarely share one;
+# each is only held for a double-checked assignment.
+_INIT_STRIPES = 64
+_init_locks = tuple(threading.Lock() for _ in range(_INIT_STRIPES))
+
+
+def _init_lock(obj: Any) -> threading.Lock:
+    """
+    :param obj: Object whose attributes are being created lazily.
+    :return: The stripe lock guarding that object.
+    """
+    return _init_locks[(id(obj) >> 4) % _INIT_STRIPES]
+
+
+# Guards the creation of thread-checked subclasses
+_thread_checked_lock = threading.Lock()
+
+
+class _NoLock:
+    """
+    Stand-in for the lock of events created with ``threadsafe=False``.
+
+    Supports the subset of the lock interface Event uses, without locking.
+    Non-blocking acquisition fails on any thread but the event's owner, so
+    weakref callbacks run by the garbage collector on a foreign thread defer
+    their eviction to the owning thread instead of mutating the registry
+    concurrently.
+    """
+
+    __slots__ = ("_owner",)
+
+    def __init__(self) -> None:
+        """
+        Bind the lock to the current thread.
+        """
+        self._owner = threading.get_ident()
+
+    def __enter__(self) -> bool:
+        """
+        :return: True, as if the lock was acquired.
+        """
+        return True
+
+    def __exit__(self, *exc_info: Any) -> None:
+        """
+        Do nothing; exceptions propagate.
+        """
+        return None
+
+    def acquire(self, blocking: bool = True, timeout: float = -1) -> bool:
+        """
+        :return: True, as if the lock was acquired; False for a non-blocking
+                 attempt from a thread other than the owner.
+        """
+        return blocking or threading.get_ident() == self._owner
+
+    def release(self) -> None:
+        """
+        Do nothing.
+        """
+
+
+class _ThreadCheckLock(_NoLock):
+    """
+    Stand-in lock for ``threadsafe=False, thread_check=True``: instead of
+    locking, it raises when used from a thread other than the event's owner.
+    The event's public methods check the thread too (see
+    :func:`_thread_checked_class`), so the check does not depend on whether
+    an operation happens to need the lock.
+    """
+
+    __slots__ = ("_owner_name",)
+
+    def __init__(self) -> None:
+        """
+        Bind the lock to the current thread.
+        """
+        super().__init__()
+        self._owner_name = threading.current_thread().name
+
+    def _check(self) -> None:
+        """
+        Verify the caller runs on the owning thread.
+
+        :raises RuntimeError: If called from a thread other than the owner.
+        """
+        if threading.get_ident() != self._owner:
+            raise RuntimeError(
+                f"Event created with threadsafe=False in thread "
+                f"{self._owner_name!r} was used from thread "
+                f"{threading.current_thread().name!r}"
+            )
+
+    def __enter__(self) -> bool:
+        """
+        :return: True.
+        :raises RuntimeError: If called from a thread other than the owner.
+        """
+        self._check()
+        return True
+
+    def acquire(self, blocking: bool = True, timeout: float = -1) -> bool:
+        """
+        :return: True on the owning thread; False for a non-blocking attempt
+                 from another thread.
+        :raises RuntimeError: For a blocking attempt from another thread.
+        """
+        if blocking:
+            self._check()
+            return True
+        return threading.get_ident() == self._owner
+
+
+# Public Event methods that check the calling thread on events created with
+# threadsafe=False, thread_check=True
+_THREAD_CHECKED_METHODS = (
+    "subscribe_one",
+    "unsubscribe_one",
+    "subscribe_range",
+    "unsubscribe_range",
+    "emit",
+    "emit_columns",
+    "emit_many",
+    "emit_many_async",
+    "emit_async",
+    "emit_async_only",
+    "has_async_handlers",
+    "clear",
+    "enable_timing",
+    "disable_timing",
+    "handler_timings",
+    "reset_timings",
+    "handler_count",
+)
+
+# Event class -> its thread-checked subclass
+_thread_checked_classes: Dict[type, type] = {}
+
+
+def _thread_checked(name: str, method: Callable[..., Any]) -> Callable[..., Any]:
+    """
+    Wrap an Event method so it verifies the calling thread first.
+
+    Coroutine methods are wrapped by a plain function returning the
+    coroutine, so the thread is checked when they are called, not awaited.
+
+    :param name: Method name.
+    :param method: The method to wrap.
+    :return: The checking method.
+    """
+
+    def checked(self: "Event", *args: Any, **kwargs: Any) -> Any:
+        self._rlock._check()
+        return method(self, *args, **kwargs)
+
+    checked.__name__ = checked.__qualname__ = name
+    checked.__doc__ = method.__doc__
+    return checked
+
+
+def _thread_checked_class(cls: type) -> type:
+    """
+    Return the thread-checked subclass of an Event class, creating it once.
+
+    Like the timed subclasses of :mod:`pyesys.timing`, it keeps the name of
+    ``cls`` and adds no slots, so only events created with ``thread_check``
+    pay for the check.
+
+    :param cls: Event class.
+    :return: The subclass.
+    """
+    checked = _thread_checked_classes.get(cls)
+    if checked is None:
+        with _thread_checked_lock:
+            checked = _thread_checked_classes.get(cls)
+            if checked is None:
+                namespace: Dict[str, Any] = {
+                    name: _thread_checked(name, getattr(cls, name))
+                    for name in _THREAD_CHECKED_METHODS
+                }
+                handlers = cls.handlers.fget
+                namespace["handlers"] = property(
+                    _thread_checked("handlers", handlers), doc=cls.handlers.__doc__
+                )
+                namespace.update(
+                    __slots__=(), __module__=cls.__module__, __qualname__=cls.__qualname__
+                )
+                checked = _thread_checked_classes[cls] = type(
+                    cls.__name__, (cls,), namespace
+                )
+    return checked
 
 
 class Event:
@@ -19,7 +622,16 @@ class Event:
     - Introspection: handler_count, handlers list
     - Duplicate subscription control
     - Mixed sync/async support with proper resource management
-    - Performance optimizations with lazy cleanup
+    - Dead bound-method handlers evicted by weakref callbacks (no GC sweeps)
+    - Lock-free emission from an immutable, copy-on-write handler tuple
+    - O(1) subscribe/unsubscribe via a hash-indexed handler registry
+    - Opt-in columnar emission with vectorized handlers (NumPy optional)
+    - Keyed routing: handlers subscribed with a key run only for matching emissions
+    - Range subscriptions matched through a sorted interval index
+    - Compact layout: slotted, with the lock, listener and handler storage
+      allocated on first use
+    - Optional lock-free mode for events confined to one thread, with a debug
+      check for cross-thread use
 
     Generic P: parameter specification for handler arguments.
     """
@@ -70,27 +682,79 @@ class Event:
             self._outer -= handler
             return self
 
-        def subscribe(self, handler: Union[Callable[P, None], Iterable[Callable[P, None]]]) -> None:
+        def subscribe(
+            self,
+            handler: Union[Callable[P, None], Iterable[Callable[P, None]]],
+            key: Optional[Hashable] = None,
+        ) -> None:
             """
             Alternative to += operator for subscribing handlers.
 
             Supports single callables or iterables (list, tuple, set).  
 
+            With a ``key``, the handlers only run for emissions whose routing key
+            (see the event's ``key_extractor``) equals it.
+
             :param handler: Callable or iterable of callables to subscribe.
+            :param key: Routing key, or None to receive every emission.
             :raises TypeError: If handler is not callable.
             """
-            self._outer += handler
+            if key is None:
+                self._outer += handler
+            elif isinstance(handler, (list, tuple, set)):
+                for h in handler:
+                    self._outer.subscribe_one(h, key=key)
+            else:
+                self._outer.subscribe_one(handler, key=key)
 
-        def unsubscribe(self, handler: Union[Callable[P, None], Iterable[Callable[P, None]]]) -> None:
+        def unsubscribe(
+            self,
+            handler: Union[Callable[P, None], Iterable[Callable[P, None]]],
+            key: Optional[Hashable] = None,
+        ) -> None:
             """
             Alternative to -= operator for unsubscribing handlers.
 
             Supports single callables or iterables (list, tuple, set).
 
             :param handler: Callable or iterable of callables to unsubscribe.
+            :param key: Routing key the handlers were subscribed with, or None.
             :raises TypeError: If handler is not callable.
             """
-            self._outer -= handler
+            if key is None:
+                self._outer -= handler
+            elif isinstance(handler, (list, tuple, set)):
+                for h in handler:
+                    self._outer.unsubscribe_one(h, key=key)
+            else:
+                self._outer.unsubscribe_one(handler, key=key)
+
+        def subscribe_range(
+            self, handler: Callable[P, None], low: float, high: float
+        ) -> None:
+            """
+            Subscribe a handler for emissions whose key lies in ``[low, high]``.
+
+            :param handler: Callable to subscribe.
+            :param low: Inclusive lower bound.
+            :param high: Inclusive upper bound.
+            :raises TypeError: If handler is invalid or incompatible.
+            :raises ValueError: If low is greater than high.
+            """
+            self._outer.subscribe_range(handler, low, high)
+
+        def unsubscribe_range(
+            self, handler: Callable[P, None], low: float, high: float
+        ) -> None:
+            """
+            Unsubscribe a handler from a range it was subscribed with.
+
+            :param handler: Callable previously subscribed.
+            :param low: Lower bound it was subscribed with.
+            :param high: Upper bound it was subscribed with.
+            :raises TypeError: If handler is not callable.
+            """
+            self._outer.unsubscribe_range(handler, low, high)
 
         def handler_count(self) -> int:
             """
@@ -100,25 +764,229 @@ class Event:
             """
             return self._outer.handler_count()
 
+    __slots__ = (
+        "_registry",
+        "_plan",
+        "_held",
+        "_rlock",
+        "_listener",
+        "_sig",
+        "_sig_kinds",
+        "_allow_duplicates",
+        "_error_handler",
+        "_breaker_policy",
+        "_executor",
+        "_sync_policy",
+        "_eager",
+        "_columnar",
+        "_key_extractor",
+        "_keyed",
+        "_handler_keys",
+        "_routed",
+        "_keyed_count",
+        "_keyed_async",
+        "_ranges",
+        "_routing",
+        "_pending_evictions",
+        "_evict_weak",
+        "_timings",
+        "_metrics",
+        "__weakref__",
+    )
+
     def __init__(
         self,
         *,
         allow_duplicates: bool = True,
         error_handler: Optional[ErrorHandler] = None,
+        executor: Optional[Executor] = None,
+        sync_policy: SyncPolicy = "executor",
+        eager: bool = False,
+        columnar: bool = False,
+        key_extractor: Optional[Callable[..., Hashable]] = None,
+        threadsafe: bool = True,
+        thread_check: bool = False,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        name: Optional[str] = None,
     ):
         """
         Initialize an Event with no handlers.
 
         :param allow_duplicates: If True, the same handler can be added multiple times.
-        :param error_handler: Custom error handler, or None for default behavior.
+        :param error_handler: Custom error handler, or None for the process-wide
+                              default (see :func:`set_default_error_handler`).
+        :param executor: Executor for sync handlers during emit_async, or None for
+                         the process-wide default (see :func:`set_default_executor`).
+        :param sync_policy: How emit_async runs sync handlers: ``"executor"`` submits
+                            one executor job per handler, ``"inline"`` calls them
+                            directly on the loop thread (for cheap handlers), and
+                            ``"batched"`` runs all of them in a single executor job.
+        :param eager: If True, emit_async starts each async handler eagerly: it runs
+                      until its first suspension inside the emit call, and only
+                      handlers that actually suspend become scheduled tasks.
+                      Requires Python 3.12+; ignored on older interpreters.
+        :param columnar: If True, accept vectorized handlers (see
+                         :func:`~pyesys.handler.vectorized_handler`) and enable
+                         :meth:`emit_columns`.
+        :param key_extractor: Called with the emitted arguments to get the routing
+                              key for handlers subscribed with ``key=``; defaults
+                              to the first argument (positional, or by keyword
+                              for events with an example signature).
+        :param threadsafe: If False, skip locking entirely. Only for events that
+                           are subscribed to, unsubscribed from and emitted on a
+                           single thread (e.g. one asyncio loop or GUI thread).
+        :param thread_check: With ``threadsafe=False``, raise RuntimeError when
+                             any public method (subscription changes,
+                             emission, queries) is called on a thread other
+                             than the one that created the event. Meant for
+                             debugging; ignored for thread-safe events.
+        :param circuit_breaker: If given, handlers that keep failing are skipped
+                                for a cool-off period; see :class:`CircuitBreaker`.
+        :param name: If given, the event reports emissions, errors, evictions,
+                     its handler high-water mark and pending async dispatches
+                     under this name to the process-wide metrics registry
+                     (see :func:`~pyesys.metrics.render_prometheus`). Events
+                     sharing a name share their metrics.
+        :raises ValueError: If sync_policy is unknown.
         """
-        self._handlers: List[EventHandler] = []
-        self._lock = threading.RLock()  # RLock for potential recursive calls
-        self.listener = Event.Listener(self)
+        if sync_policy not in _SYNC_POLICIES:
+            raise ValueError(
+                f"sync_policy must be one of {_SYNC_POLICIES}, got {sync_policy!r}"
+            )
+
+        # Unkeyed handlers, created on first subscription
+        self._registry: Optional[HandlerRegistry] = None
+        # Published dispatch plan, or None after a change; emitters read it
+        # without locking and republish from the registry when it is None
+        self._plan: Optional[_DispatchPlan] = _EMPTY_PLAN
+        # Plan built while circuit breakers suspend handlers. It is not
+        # published, so emitters keep calling _publish, which returns it until
+        # its retry_at and then rebuilds it
+        self._held: Optional[_DispatchPlan] = None
+        # Created on first use, see the _lock and listener properties
+        self._rlock: Optional[threading.RLock] = None
+        if not threadsafe:
+            if thread_check:
+                self._rlock = _ThreadCheckLock()
+                self.__class__ = _thread_checked_class(type(self))
+            else:
+                self._rlock = _NoLock()
+        self._listener: Optional[Event.Listener] = None
         self._sig: Optional[inspect.Signature] = None
+        self._sig_kinds: tuple = ()  # Parameter kinds of _sig, for cache keys
         self._allow_duplicates = allow_duplicates
-        self._error_handler = error_handler or default_error_handler
-        self._cleanup_counter = 0  # For optimized cleanup
+        self._error_handler = error_handler or _report_to_default
+        self._breaker_policy = circuit_breaker
+        self._executor = executor
+        self._sync_policy = sync_policy
+        self._eager = eager and _eager_task_factory is not None
+        self._columnar = columnar
+        # Keyed routing: key -> registry of the handlers subscribed with that
+        # key, the keys each canonical keyed handler is subscribed under, and
+        # per-key plans merged with the unkeyed plan they were built from; all
+        # three are created on the first keyed subscription
+        self._key_extractor = key_extractor or _first_argument
+        self._keyed: Optional[Dict[Hashable, HandlerRegistry]] = None
+        self._handler_keys: Optional[Dict[EventHandler, Dict[Hashable, None]]] = None
+        self._routed: Optional[Dict[Hashable, Tuple[_DispatchPlan, _DispatchPlan]]] = None
+        self._keyed_count = 0
+        self._keyed_async = 0
+        # Range subscriptions, created on first use
+        self._ranges: Optional[RangeRegistry] = None
+        # True when keyed or range subscriptions exist, so emitters must route
+        self._routing = False
+        # Handlers whose instance died while another thread held the lock,
+        # created when first needed
+        self._pending_evictions: Optional[List[EventHandler]] = None
+        self._evict_weak: Optional[weakref.WeakMethod] = None
+        # Handler -> LatencyHistogram, created by enable_timing
+        self._timings: Optional[Dict[EventHandler, Any]] = None
+        # Metrics of named events; None means the event is not metered
+        self._metrics: Optional[EventMetrics] = (
+            get_metrics_registry().event_metrics(name) if name is not None else None
+        )
+
+    @property
+    def _lock(self) -> threading.RLock:
+        """
+        Lock guarding mutation, created on first use; reentrant for recursive
+        calls. Events created with ``threadsafe=False`` use a no-op stand-in.
+
+        :return: The event's lock.
+        """
+        lock = self._rlock
+        if lock is None:
+            with _init_lock(self):
+                lock = self._rlock
+                if lock is None:
+                    lock = self._rlock = threading.RLock()
+        return lock
+
+    @property
+    def listener(self) -> "Event.Listener":
+        """
+        Restricted subscribe/unsubscribe interface to this Event, created on first use.
+
+        :return: The event's Listener.
+        """
+        listener = self._listener
+        if listener is None:
+            with _init_lock(self):
+                listener = self._listener
+                if listener is None:
+                    listener = self._listener = Event.Listener(self)
+        return listener
+
+    @property
+    def _evict_ref(self) -> weakref.WeakMethod:
+        """
+        Weak reference to :meth:`_evict_handler`, registered as a watcher on
+        bound-method handlers; created on first use.
+
+        :return: The watcher reference.
+        """
+        ref = self._evict_weak
+        if ref is None:
+            with _init_lock(self):
+                ref = self._evict_weak
+                if ref is None:
+                    ref = self._evict_weak = weakref.WeakMethod(self._evict_handler)
+        return ref
+
+    def _watch(self, handler: EventHandler) -> bool:
+        """
+        Have a newly subscribed handler evicted when its bound instance dies.
+
+        The watcher reference is only created for bound methods; free
+        functions never die.
+
+        :param handler: Canonical handler just subscribed.
+        :return: False if the bound instance is already dead, True otherwise.
+        """
+        return handler._self_ref is None or handler._add_watcher(self._evict_ref)
+
+    def _unwatch(self, handler: EventHandler) -> None:
+        """
+        Undo :meth:`_watch` after a handler's last subscription is removed.
+
+        :param handler: Canonical handler no longer subscribed.
+        """
+        ref = self._evict_weak
+        if ref is not None:
+            handler._remove_watcher(ref)
+
+    def _ensure_registry(self) -> HandlerRegistry:
+        """
+        Return the unkeyed handler registry, creating it if needed.
+
+        Must be called with lock held.
+
+        :return: The registry.
+        """
+        registry = self._registry
+        if registry is None:
+            registry = self._registry = HandlerRegistry()
+        return registry
 
     @staticmethod
     def _is_signature_compatible(
@@ -143,92 +1011,417 @@ class Event:
                 return False
         return True
 
-    def _cleanup_dead_handlers(self, force: bool = False) -> None:
+    def _evict_handler(self, handler: EventHandler) -> None:
+        """
+        Remove every occurrence of a handler whose bound instance has died.
+
+        Called from the handler's weakref callback, which may run on any thread
+        and at any allocation point. To avoid lock-order deadlocks the lock is
+        only tried; if it is busy the eviction is deferred to the next locked
+        operation.
+
+        :param handler: The dead EventHandler to remove.
+        """
+        if not self._lock.acquire(blocking=False):
+            pending = self._pending_evictions
+            if pending is None:
+                with _init_lock(self):
+                    pending = self._pending_evictions
+                    if pending is None:
+                        pending = self._pending_evictions = []
+            pending.append(handler)
+            return
+        try:
+            self._remove_evicted(handler)
+        finally:
+            self._lock.release()
+
+    def _remove_evicted(self, handler: EventHandler) -> None:
+        """
+        Drop all entries identical to a dead handler. Must be called with lock held.
+
+        :param handler: The dead EventHandler to remove.
+        """
+        evicted = 0
+        registry = self._registry
+        if registry is not None:
+            evicted = registry.evict(handler)
+            if evicted:
+                self._invalidate()
+        keys = self._handler_keys.pop(handler, None) if self._handler_keys else None
+        if keys:
+            for key in keys:
+                bucket = self._keyed[key]
+                removed = bucket.evict(handler)
+                self._keyed_count -= removed
+                if handler._is_async:
+                    self._keyed_async -= removed
+                evicted += removed
+                self._drop_route(key, bucket)
+        if self._ranges is not None:
+            evicted += self._ranges.evict(handler)
+        self._update_routing()
+        if evicted and self._metrics is not None:
+            self._metrics.add(_EVICTIONS)
+
+    def _update_routing(self) -> None:
         """
-        Remove dead handlers from the internal list with performance optimization.
+        Recompute whether emissions need per-emission routing.
 
-        Uses lazy cleanup strategy to avoid overhead on every operation.
         Must be called with lock held.
+        """
+        self._routing = bool(self._keyed) or bool(self._ranges)
 
-        :param force: If True, always perform cleanup regardless of counter.
+    def _drop_route(self, key: Hashable, bucket: HandlerRegistry) -> None:
         """
-        if not force:
-            self._cleanup_counter += 1
+        Invalidate the merged plan of a key after its bucket changed.
 
-        # Perform cleanup every 10 operations, on first operation, or when forced
-        should_cleanup = force or (
-            self._cleanup_counter == 1 or self._cleanup_counter % 10 == 0
-        )
+        Must be called with lock held.
+
+        :param key: Routing key whose handlers changed.
+        :param bucket: Registry of that key, dropped if now empty.
+        """
+        self._routed.pop(key, None)
+        if not len(bucket):
+            del self._keyed[key]
+
+    def _find_canonical(self, handler: EventHandler) -> Optional[EventHandler]:
+        """
+        Find the canonical object of a handler subscribed anywhere on this event.
+
+        Must be called with lock held.
+
+        :param handler: Handler to look up.
+        :return: The canonical handler, or None if not subscribed.
+        """
+        registry = self._registry
+        canonical = registry.canonical(handler) if registry is not None else None
+        if canonical is None and self._handler_keys:
+            keys = self._handler_keys.get(handler)
+            if keys:
+                canonical = self._keyed[next(iter(keys))].canonical(handler)
+        if canonical is None and self._ranges:
+            canonical = self._ranges.canonical(handler)
+        return canonical
+
+    def _route(
+        self, plan: _DispatchPlan, args: Tuple[Any, ...], kwargs: Dict[str, Any]
+    ) -> _DispatchPlan:
+        """
+        Select the dispatch plan for one emission on an event with keyed or
+        range subscriptions.
+
+        Emissions whose key has subscribers use a plan merging the unkeyed
+        handlers with that key's handlers; all others use ``plan``. Merged
+        plans are cached per key and rebuilt when either side changes, so a
+        lookup is one key extraction plus a dict probe. Range subscriptions
+        containing the key are then looked up in the interval index and
+        appended; those merged plans are cached on the index per base plan
+        and match set, so they are only built once per distinct set.
+
+        :param plan: The published unkeyed plan.
+        :param args: Emitted positional arguments.
+        :param kwargs: Emitted keyword arguments.
+        :return: The plan to dispatch with.
+        """
+        routed = plan
+        try:
+            key = self._key_extractor(*args, **kwargs)
+            if self._keyed and key in self._keyed:
+                routed = self._route_key(plan, key)
+
+            ranges = self._ranges
+            if ranges:
+                index = ranges._built
+                if index is None:
+                    with self._lock:
+                        index = ranges.build()
+                matches = index.match(key)
+                if matches:
+                    plans = index.plans
+                    merged = plans.get((routed, matches))
+                    if merged is None:
+                        merged = _DispatchPlan(self._merge(routed.handlers, matches))
+                        if merged.retry_at is None:
+                            # Plans with suspended handlers are rebuilt per emission
+                            if len(plans) >= _RANGE_PLANS_MAX:
+                                plans.clear()
+                            plans[(routed, matches)] = merged
+                    routed = merged
+        except Exception as e:
+            try:
+                self._error_handler(e, None)
+            except Exception:
+                pass
+        return routed
+
+    def _merge(
+        self, handlers: Tuple[EventHandler, ...], extra: Tuple[EventHandler, ...]
+    ) -> Tuple[EventHandler, ...]:
+        """
+        Append routed handlers to a plan's handlers for one emission.
+
+        Unless duplicates are allowed, a handler subscribed both unkeyed and
+        under a key or range runs once, in its first position. Only called
+        when a merged plan is built, not per emission.
 
-        if should_cleanup:
-            original_count = len(self._handlers)
+        :param handlers: Handlers of the plan being routed.
+        :param extra: Keyed or range handlers to append.
+        :return: The merged handlers.
+        """
+        if self._allow_duplicates or not handlers:
+            return handlers + extra
+        seen = set(handlers)
+        return handlers + tuple(h for h in extra if h not in seen)
+
+    def _route_key(self, plan: _DispatchPlan, key: Hashable) -> _DispatchPlan:
+        """
+        Return the cached plan merging ``plan`` with the handlers of ``key``.
 
-            # Force multiple garbage collection cycles for more reliable cleanup
-            if original_count > 0:
-                for _ in range(3):  # Multiple cycles for thorough cleanup
-                    gc.collect()
+        :param plan: The published unkeyed plan.
+        :param key: Routing key with subscribers.
+        :return: The merged plan, or ``plan`` if the key lost its subscribers.
+        """
+        routed = self._routed.get(key)
+        if routed is not None and routed[0] is plan:
+            return routed[1]
 
-            # Filter out dead handlers
-            alive_handlers = []
-            for h in self._handlers:
-                if h.is_alive():
-                    alive_handlers.append(h)
+        with self._lock:
+            bucket = self._keyed.get(key)
+            if bucket is None:
+                return plan
+            merged = _DispatchPlan(self._merge(plan.handlers, bucket.snapshot()))
+            if merged.retry_at is None:
+                # Plans with suspended handlers are rebuilt per emission
+                self._routed[key] = (plan, merged)
+        return merged
+
+    def _publish(self) -> _DispatchPlan:
+        """
+        Rebuild and publish the dispatch plan after subscriptions changed.
 
-            self._handlers[:] = alive_handlers
+        Consecutive subscription changes only pay for one rebuild, on the next
+        emission or query. While circuit breakers suspend handlers the plan is
+        held instead of published, and rebuilt once the first of them may be
+        retried.
 
-            # Reset counter if we actually cleaned up something
-            if len(self._handlers) < original_count:
-                self._cleanup_counter = 0
+        :return: The published dispatch plan.
+        """
+        held = self._held
+        if held is not None and time.monotonic() < held.retry_at:
+            return held
+        with self._lock:
+            self._drain_evictions()
+            plan = self._plan
+            if plan is None:
+                registry = self._registry
+                plan = (
+                    _DispatchPlan(registry.snapshot())
+                    if registry is not None
+                    else _EMPTY_PLAN
+                )
+                self._install(plan)
+        return plan
+
+    def _install(self, plan: _DispatchPlan) -> None:
+        """
+        Publish a freshly built plan, or hold it if it suspends handlers.
+        Must be called with lock held.
+
+        :param plan: The new dispatch plan.
+        """
+        if plan.retry_at is None:
+            self._held = None
+            self._plan = plan
+        else:
+            self._held = plan
+
+    def _invalidate(self) -> None:
+        """
+        Drop the published or held plan after subscriptions or breaker states
+        changed; the next emission rebuilds it.
+        """
+        self._held = None
+        self._plan = None
+
+    def _drain_evictions(self) -> None:
+        """
+        Apply evictions that were deferred because the lock was busy.
+
+        Must be called with lock held.
+        """
+        while self._pending_evictions:
+            self._remove_evicted(self._pending_evictions.pop())
 
     def _validate_handler(self, handler: Callable[P, None]) -> None:
         """
         Validate that a handler is callable and has compatible signature.
 
+        Batch-capable handlers (see :func:`~pyesys.handler.batch_handler`) must
+        take a single batch parameter instead of the event's arguments.
+        Vectorized handlers share the event's signature, but are only accepted
+        by columnar events and must be synchronous.
+
         :param handler: Handler to validate.
         :raises TypeError: If handler is invalid or incompatible.
         """
+        if isinstance(handler, EventHandler):
+            # Validate the wrapped callable, not the wrapper
+            handler = handler.get_callback()
         if not callable(handler):
             raise TypeError(f"Handler must be callable, got {type(handler)}")
 
+        if getattr(handler, "__pyesys_vectorized__", False):
+            if not self._columnar:
+                raise TypeError(
+                    f"Vectorized handler {handler!r} requires an event created "
+                    f"with columnar=True"
+                )
+            if getattr(handler, "__pyesys_batch__", False):
+                raise TypeError(
+                    f"Handler {handler!r} cannot be both batch and vectorized"
+                )
+            func = getattr(handler, "__func__", handler)
+            if inspect.iscoroutinefunction(func):
+                raise TypeError(
+                    f"Vectorized handler {handler!r} must be synchronous"
+                )
+
         if self._sig:
-            try:
-                # Handle bound methods - drop their first parameter before comparing
-                if hasattr(handler, "__self__") and handler.__self__ is not None:
-                    full_sig = inspect.signature(handler.__func__)
-                    params = list(full_sig.parameters.values())[1:]  # drop 'self'
-                    handler_sig = full_sig.replace(parameters=params)
-                else:
-                    handler_sig = inspect.signature(handler)
+            if getattr(handler, "__pyesys_batch__", False):
+                self._check_signature(handler, _BATCH_SIG, _BATCH_KINDS)
+            else:
+                self._check_signature(handler, self._sig, self._sig_kinds)
 
-                if not Event._is_signature_compatible(handler_sig, self._sig):
-                    raise TypeError(
-                        f"Handler signature {handler_sig} is not compatible with "
-                        f"expected {self._sig}"
-                    )
-            except (ValueError, TypeError) as e:
-                raise TypeError(f"Cannot inspect handler signature: {e}")
+    @staticmethod
+    def _check_signature(
+        handler: Callable[..., Any],
+        expected_sig: inspect.Signature,
+        expected_kinds: tuple,
+    ) -> None:
+        """
+        Check a handler against an expected signature, using the verdict cache.
+
+        :param handler: Handler to check.
+        :param expected_sig: Expected signature, for comparison and error messages.
+        :param expected_kinds: Parameter kinds of expected_sig, for cache keys.
+        :raises TypeError: If the handler's signature is incompatible.
+        """
+        key = _SignatureCache.key_for(handler, expected_kinds)
+        if key is not None:
+            verdict = _signature_cache.get(key)
+            if verdict is None:
+                return
+            if verdict is not _SignatureCache._MISSING:
+                raise TypeError(
+                    f"Cannot inspect handler signature: Handler signature "
+                    f"{verdict} is not compatible with expected {expected_sig}"
+                )
 
-    def subscribe_one(self, handler: Callable[P, None]) -> None:
+        try:
+            # Handle bound methods - drop their first parameter before comparing
+            if hasattr(handler, "__self__") and handler.__self__ is not None:
+                full_sig = inspect.signature(handler.__func__)
+                params = list(full_sig.parameters.values())[1:]  # drop 'self'
+                handler_sig = full_sig.replace(parameters=params)
+            else:
+                handler_sig = inspect.signature(handler)
+
+            compatible = Event._is_signature_compatible(handler_sig, expected_sig)
+            if key is not None:
+                _signature_cache.put(key, None if compatible else str(handler_sig))
+            if not compatible:
+                raise TypeError(
+                    f"Handler signature {handler_sig} is not compatible with "
+                    f"expected {expected_sig}"
+                )
+        except (ValueError, TypeError) as e:
+            raise TypeError(f"Cannot inspect handler signature: {e}")
+
+    def subscribe_one(
+        self, handler: Callable[P, None], key: Optional[Hashable] = None
+    ) -> None:
         """ 
         Subscribe a single handler to this Event with validation and duplicate control.
 
         Performs runtime signature checking.
 
+        With a ``key``, the handler is stored in that key's bucket of the
+        routing index and only runs for emissions whose extracted key equals
+        it. Batch-capable and vectorized handlers cannot be keyed.
+
         :param handler: Callable to subscribe.
+        :param key: Routing key, or None to receive every emission.
         :raises TypeError: If handler is invalid or incompatible.
         """
         self._validate_handler(handler)
 
         h = handler if isinstance(handler, EventHandler) else EventHandler(handler)
+        if key is not None and (h._is_batch or h._is_vectorized):
+            raise TypeError(
+                f"Batch and vectorized handlers cannot be subscribed with a key, "
+                f"got {handler!r}"
+            )
+
         with self._lock:
-            if self._allow_duplicates or h not in self._handlers:
-                self._handlers.append(h)
+            self._drain_evictions()
+            if key is None and not self._routing:
+                registry = self._ensure_registry()
+                is_new, canonical = registry.add(h, self._allow_duplicates)
+                if is_new and not self._watch(canonical):
+                    # Instance died before we could watch it
+                    registry.evict(canonical)
+                self._invalidate()
+                self._observe_handlers()
+                return
+
+            # Equal handlers share one canonical object across the unkeyed
+            # registry, all key buckets and the range registry, so eviction
+            # finds every entry
+            existing = self._find_canonical(h)
+            if existing is not None:
+                h = existing
+            if key is None:
+                is_new, _ = self._ensure_registry().add(h, self._allow_duplicates)
+                added = is_new or self._allow_duplicates
+                self._invalidate()
+            else:
+                if self._keyed is None:
+                    self._keyed, self._handler_keys, self._routed = {}, {}, {}
+                bucket = self._keyed.get(key)
+                if bucket is None:
+                    bucket = self._keyed[key] = HandlerRegistry()
+                is_new, _ = bucket.add(h, self._allow_duplicates)
+                added = is_new or self._allow_duplicates
+                if added:
+                    self._handler_keys.setdefault(h, {})[key] = None
+                    self._keyed_count += 1
+                    if h._is_async:
+                        self._keyed_async += 1
+                    self._routed.pop(key, None)
+                    self._routing = True
+
+            if added and existing is None and not self._watch(h):
+                # Instance died before we could watch it
+                self._remove_evicted(h)
+            self._observe_handlers()
+
+    def _observe_handlers(self) -> None:
+        """
+        Update the handler high-water mark of a named event after a subscription.
+        """
+        metrics = self._metrics
+        if metrics is not None:
+            metrics.observe_handlers(self.handler_count())
 
-    def unsubscribe_one(self, handler: Callable[P, None]) -> None:
+    def unsubscribe_one(
+        self, handler: Callable[P, None], key: Optional[Hashable] = None
+    ) -> None:
         """
         Unsubscribe a single handler from this Event.
 
         :param handler: Callable previously subscribed.
+        :param key: Routing key the handler was subscribed with, or None.
         :raises TypeError: If handler is not callable.
         """
         if not callable(handler):
@@ -236,10 +1429,103 @@ class Event:
         
         h = handler if isinstance(handler, EventHandler) else EventHandler(handler)
         with self._lock:
-            try:
-                self._handlers.remove(h)
-            except ValueError:
-                pass # Handler not found, ignore silently
+            self._drain_evictions()
+            if key is None:
+                registry = self._registry
+                if registry is None or h not in registry:
+                    return  # Handler not found, ignore silently
+                last = registry.remove(h)
+                self._invalidate()
+            else:
+                bucket = self._keyed.get(key) if self._keyed else None
+                if bucket is None or h not in bucket:
+                    return
+                last = bucket.remove(h)
+                self._keyed_count -= 1
+                if h._is_async:
+                    self._keyed_async -= 1
+                if last is not None:
+                    keys = self._handler_keys[last]
+                    del keys[key]
+                    if not keys:
+                        del self._handler_keys[last]
+                self._drop_route(key, bucket)
+                self._update_routing()
+
+            if last is not None and self._find_canonical(last) is None:
+                self._unwatch(last)
+
+    def subscribe_range(
+        self, handler: Callable[P, None], low: float, high: float
+    ) -> None:
+        """
+        Subscribe a handler for emissions whose key lies in ``[low, high]``.
+
+        The key is obtained with the event's ``key_extractor`` (by default the
+        first argument) and must be a number. Ranges are kept in a
+        sorted interval index, so an emission only calls the handlers whose
+        range contains its key, in subscription order, after the unkeyed and
+        keyed handlers. Batch-capable and vectorized handlers cannot be
+        range-subscribed.
+
+        :param handler: Callable to subscribe.
+        :param low: Inclusive lower bound.
+        :param high: Inclusive upper bound.
+        :raises TypeError: If handler is invalid or incompatible.
+        :raises ValueError: If low is greater than high or a bound is NaN.
+        """
+        self._validate_handler(handler)
+        low, high = float(low), float(high)
+        if not low <= high:
+            raise ValueError(f"Range bounds must satisfy low <= high, got [{low}, {high}]")
+
+        h = handler if isinstance(handler, EventHandler) else EventHandler(handler)
+        if h._is_batch or h._is_vectorized:
+            raise TypeError(
+                f"Batch and vectorized handlers cannot be range-subscribed, "
+                f"got {handler!r}"
+            )
+
+        with self._lock:
+            self._drain_evictions()
+            existing = self._find_canonical(h)
+            if existing is not None:
+                h = existing
+            if self._ranges is None:
+                self._ranges = RangeRegistry()
+            if not self._ranges.add(h, low, high, self._allow_duplicates):
+                return
+            self._routing = True
+            if existing is None and not self._watch(h):
+                # Instance died before we could watch it
+                self._remove_evicted(h)
+            self._observe_handlers()
+
+    def unsubscribe_range(
+        self, handler: Callable[P, None], low: float, high: float
+    ) -> None:
+        """
+        Unsubscribe a handler from the range it was subscribed with.
+
+        :param handler: Callable previously subscribed with :meth:`subscribe_range`.
+        :param low: Lower bound it was subscribed with.
+        :param high: Upper bound it was subscribed with.
+        :raises TypeError: If handler is not callable.
+        """
+        if not callable(handler):
+            raise TypeError(f"Handler must be callable, got {type(handler)}")
+
+        h = handler if isinstance(handler, EventHandler) else EventHandler(handler)
+        with self._lock:
+            self._drain_evictions()
+            if self._ranges is None:
+                return
+            removed, last = self._ranges.remove(h, float(low), float(high))
+            if not removed:
+                return
+            self._update_routing()
+            if last is not None and self._find_canonical(last) is None:
+                self._unwatch(last)
 
     def __iadd__(self, handler: Union[Callable[P, None], Iterable[Callable[P, None]]]) -> "Event":
         """
@@ -279,129 +1565,644 @@ class Event:
             self.unsubscribe_one(handler)
         return self
 
-    def emit(self, *args: P.args, **kwargs: P.kwargs) -> None:
+    def emit(
+        self, *args: P.args, collect_errors: bool = False, **kwargs: P.kwargs
+    ) -> None:
         """
         Emit the event synchronously, invoking all subscribed handlers.
 
         Error handling isolates exceptions: one handler's exception does not
-        prevent others from running. Dead bound-method handlers are automatically
-        removed during cleanup.
-
-        Async handlers that return coroutines are silently ignored in sync emission.
+        prevent others from running. Dead bound-method handlers are removed
+        as soon as their instance is collected, so emission never triggers a
+        garbage collection. Emission reads the published handler tuple without
+        taking the lock, so concurrent emitters never contend.
+
+        Async handlers are skipped in sync emission. Batch-capable handlers
+        receive a one-item batch after the per-emission handlers have run.
+        Handlers subscribed with a key only run when the emission's routing
+        key matches, after the unkeyed handlers.
+
+        With ``collect_errors=True`` handler exceptions are not passed to the
+        error handler; they are gathered while every handler still runs, and
+        raised together as one ExceptionGroup at the end. ``collect_errors``
+        is a reserved keyword and is not passed on to handlers; events created
+        with an example signature refuse a parameter of that name.
 
         :param args: Positional arguments matching signature P.
+        :param collect_errors: If True, raise handler exceptions as an ExceptionGroup.
         :param kwargs: Keyword arguments matching signature P.
+        :raises ExceptionGroup: With collect_errors, if any handler raised.
         """
-        with self._lock:
-            # Optimized cleanup and snapshot for iteration
-            self._cleanup_dead_handlers()
-            handlers_snapshot = list(self._handlers)
+        metrics = self._metrics
+        if metrics is not None:
+            metrics.add(_EMISSIONS)
+        # The published plan is immutable, so no lock or copy is needed; a
+        # handler whose eviction is still pending is a harmless no-op.
+        plan = self._plan
+        if plan is None:
+            plan = self._publish()
+        if self._routing:
+            plan = self._route(plan, args, kwargs)
+
+        errors: Optional[List[Exception]] = [] if collect_errors else None
+        if plan.sync:
+            self._run_sync_batch(plan.sync, args, kwargs, errors)
+        if plan.batch_sync:
+            self._run_sync_batch(plan.batch_sync, ([args],), {}, errors)
+        if plan.vector:
+            self._run_sync_batch(
+                plan.vector, *self._one_row_columns(args, kwargs), errors
+            )
+        if errors:
+            raise _error_group(errors)
 
-        # Invoke each handler with consistent error handling
-        for h in handlers_snapshot:
-            try:
-                result = h(*args, **kwargs)
-                # If handler returned a coroutine, we can't await it in sync context
-                # Just ignore it - this is expected behavior for mixed sync/async events
-                if inspect.iscoroutine(result):
-                    result.close()  # Properly close the coroutine to avoid warnings
-            except Exception as e:
-                callback = h.get_callback()
-                if callback is not None:  # Only report errors for live handlers
-                    try:
-                        self._error_handler(e, callback)
-                    except Exception:
-                        # Prevent error handler exceptions from propagating
-                        pass
+    @staticmethod
+    def _one_row_columns(
+        args: Tuple[Any, ...], kwargs: Dict[str, Any]
+    ) -> Tuple[Tuple[Any, ...], Dict[str, Any]]:
+        """
+        Wrap a single payload as one-row columns for vectorized handlers.
+
+        :param args: Positional arguments of the payload.
+        :param kwargs: Keyword arguments of the payload.
+        :return: Tuple of (column args, column kwargs).
+        """
+        return (
+            tuple(to_column((a,)) for a in args),
+            {k: to_column((v,)) for k, v in kwargs.items()},
+        )
+
+    def emit_columns(self, *columns: Any) -> None:
+        """
+        Emit the event synchronously for a whole batch of samples in columnar form.
+
+        Takes one column per event parameter (NumPy arrays, buffers such as
+        ``array.array``, or plain sequences), all of the same length.
+        Vectorized handlers are called once with the columns, converted to
+        NumPy arrays when NumPy is installed. Scalar handlers fall back to one
+        call per row, and batch-capable handlers receive the rows as a single
+        batch. Async handlers are skipped, as in :meth:`emit`.
+
+        :param columns: One column of samples per event parameter.
+        :raises RuntimeError: If the event was not created with ``columnar=True``.
+        :raises ValueError: If the columns differ in length.
+        """
+        if not self._columnar:
+            raise RuntimeError("emit_columns() requires an event created with columnar=True")
+
+        columns, n_rows = normalize_columns(columns)
+        if n_rows == 0:
+            return
+        if self._metrics is not None:
+            self._metrics.add(_EMISSIONS, n_rows)
+
+        plan = self._plan
+        if plan is None:
+            plan = self._publish()
+
+        if plan.sync or plan.batch_sync or self._routing:
+            self._emit_rows(plan, rows_from_columns(columns))
+        if plan.vector:
+            self._run_sync_batch(plan.vector, columns, {})
+
+    def emit_many(self, items: Iterable[Tuple[Any, ...]]) -> None:
+        """
+        Emit the event synchronously once per payload in ``items``.
+
+        Equivalent to calling :meth:`emit` for each payload, but the handler
+        set is resolved once for the whole batch. Per-emission handlers are
+        invoked payload by payload, in order; batch-capable handlers (see
+        :func:`~pyesys.handler.batch_handler`) receive the whole batch in a
+        single call afterwards, and vectorized handlers the batch as columns.
+
+        :param items: Iterable of positional-argument tuples, one per emission.
+        """
+        batch = items if isinstance(items, list) else list(items)
+        if not batch:
+            return
+        if self._metrics is not None:
+            self._metrics.add(_EMISSIONS, len(batch))
 
-    async def emit_async(self, *args: P.args, **kwargs: P.kwargs) -> None:
+        plan = self._plan
+        if plan is None:
+            plan = self._publish()
+
+        self._emit_rows(plan, batch)
+        if plan.vector:
+            self._run_sync_batch(plan.vector, columns_from_rows(batch), {})
+
+    def _emit_rows(self, plan: _DispatchPlan, batch: List[Tuple[Any, ...]]) -> None:
+        """
+        Run the sync per-emission handlers for each row, then the batch handlers.
+
+        :param plan: Dispatch plan to emit with.
+        :param batch: Non-empty list of positional-argument tuples.
+        """
+        run = self._run_sync_batch
+        if self._routing:
+            for args in batch:
+                handlers = self._route(plan, args, {}).sync
+                if handlers:
+                    run(handlers, args, {})
+        elif plan.sync:
+            sync = plan.sync
+            for args in batch:
+                run(sync, args, {})
+
+        if plan.batch_sync:
+            self._run_sync_batch(plan.batch_sync, (batch,), {})
+
+    async def emit_many_async(self, items: Iterable[Tuple[Any, ...]]) -> None:
+        """
+        Asynchronously emit the event once per payload in ``items``.
+
+        The asynchronous counterpart of :meth:`emit_many`: payloads are streamed
+        one by one through the per-emission handlers as :meth:`emit_async`
+        would dispatch them, while batch-capable handlers receive the whole
+        batch in a single call, concurrently with the stream.
+
+        :param items: Iterable of positional-argument tuples, one per emission.
+        """
+        batch = items if isinstance(items, list) else list(items)
+        if not batch:
+            return
+        metrics = self._metrics
+        if metrics is not None:
+            metrics.add(_EMISSIONS, len(batch))
+
+        plan = self._plan
+        if plan is None:
+            plan = self._publish()
+
+        async def stream() -> None:
+            routing = self._routing
+            for args in batch:
+                p = self._route(plan, args, {}) if routing else plan
+                await self._dispatch_async(p.async_, p.sync, args, {})
+
+        dispatches = []
+        if plan.sync or plan.async_ or self._routing:
+            dispatches.append(stream())
+        if plan.batch_sync or plan.batch_async:
+            dispatches.append(
+                self._dispatch_async(plan.batch_async, plan.batch_sync, (batch,), {})
+            )
+        if plan.vector:
+            dispatches.append(
+                self._dispatch_async((), plan.vector, columns_from_rows(batch), {})
+            )
+
+        if metrics is not None:
+            metrics.add(_ASYNC_PENDING)
+        try:
+            if len(dispatches) == 1:
+                await dispatches[0]
+            elif dispatches:
+                await asyncio.gather(*dispatches)
+        finally:
+            if metrics is not None:
+                metrics.add(_ASYNC_PENDING, -1)
+
+    async def emit_async(
+        self,
+        *args: P.args,
+        max_concurrency: Optional[int] = None,
+        ordered: bool = False,
+        collect_errors: bool = False,
+        **kwargs: P.kwargs,
+    ) -> None:
         """
         Asynchronously emit the event, invoking all subscribed handlers concurrently.
 
         Handlers that are coroutine functions will be awaited; regular callables
-        will be scheduled on the default executor. All exceptions are consistently
-        routed to the configured error_handler.
+        are run according to the event's ``sync_policy``, by default on the
+        configured executor. All exceptions are consistently routed to the
+        configured error_handler.
+
+        By default every handler gets its own task or executor future at once.
+        For large fan-outs, ``max_concurrency`` runs handlers through a fixed
+        pool of worker slots instead, and ``ordered`` awaits them one by one in
+        subscription order without allocating tasks. In both modes the
+        ``"batched"`` sync policy behaves like ``"executor"``.
+
+        ``collect_errors`` works as in :meth:`emit`: exceptions are raised as
+        one ExceptionGroup once every handler has finished.
+
+        ``max_concurrency``, ``ordered`` and ``collect_errors`` are reserved
+        keywords and are not passed on to handlers; events created with an
+        example signature refuse parameters of these names.
 
         :param args: Positional arguments matching signature P.
+        :param max_concurrency: Maximum number of handlers running at once, or None.
+        :param ordered: If True, run handlers sequentially in subscription order.
+        :param collect_errors: If True, raise handler exceptions as an ExceptionGroup.
         :param kwargs: Keyword arguments matching signature P.
+        :raises ValueError: If max_concurrency is less than 1.
+        :raises ExceptionGroup: With collect_errors, if any handler raised.
         """
-        with self._lock:
-            self._cleanup_dead_handlers()
-            handlers_snapshot = list(self._handlers)
+        if max_concurrency is not None and max_concurrency < 1:
+            raise ValueError(f"max_concurrency must be >= 1, got {max_concurrency}")
+        metrics = self._metrics
+        if metrics is not None:
+            metrics.add(_EMISSIONS)
+        plan = self._plan
+        if plan is None:
+            plan = self._publish()
+        if self._routing:
+            plan = self._route(plan, args, kwargs)
+        if not plan.active:
+            return
 
-        if not handlers_snapshot:
+        errors: Optional[List[Exception]] = [] if collect_errors else None
+        if metrics is not None:
+            metrics.add(_ASYNC_PENDING)
+        try:
+            if ordered:
+                await self._dispatch_ordered(plan.active, args, kwargs, errors)
+            elif max_concurrency is not None:
+                await self._dispatch_limited(
+                    plan.active, args, kwargs, max_concurrency, errors
+                )
+            elif plan.batch_sync or plan.batch_async or plan.vector:
+                dispatches = [
+                    self._dispatch_async(plan.async_, plan.sync, args, kwargs, errors)
+                ]
+                if plan.batch_sync or plan.batch_async:
+                    dispatches.append(
+                        self._dispatch_async(
+                            plan.batch_async, plan.batch_sync, ([args],), {}, errors
+                        )
+                    )
+                if plan.vector:
+                    dispatches.append(
+                        self._dispatch_async(
+                            (), plan.vector, *self._one_row_columns(args, kwargs), errors
+                        )
+                    )
+                await asyncio.gather(*dispatches)
+            else:
+                await self._dispatch_async(plan.async_, plan.sync, args, kwargs, errors)
+        finally:
+            if metrics is not None:
+                metrics.add(_ASYNC_PENDING, -1)
+        if errors:
+            raise _error_group(errors)
+
+    async def emit_async_only(
+        self,
+        *args: P.args,
+        max_concurrency: Optional[int] = None,
+        ordered: bool = False,
+        **kwargs: P.kwargs,
+    ) -> None:
+        """
+        Asynchronously emit the event to its async handlers only.
+
+        This is the counterpart of :meth:`emit` for callers that have already run
+        the sync handlers, such as sync ``@event`` emitters dispatching async
+        handlers in the background. Sync handlers are not run again.
+
+        :param args: Positional arguments matching signature P.
+        :param max_concurrency: Maximum number of handlers running at once, or None.
+        :param ordered: If True, run handlers sequentially in subscription order.
+        :param kwargs: Keyword arguments matching signature P.
+        :raises ValueError: If max_concurrency is less than 1.
+        """
+        if max_concurrency is not None and max_concurrency < 1:
+            raise ValueError(f"max_concurrency must be >= 1, got {max_concurrency}")
+        plan = self._plan
+        if plan is None:
+            plan = self._publish()
+        if self._routing:
+            plan = self._route(plan, args, kwargs)
+        if not plan.all_async:
             return
 
+        metrics = self._metrics
+        if metrics is not None:
+            metrics.add(_ASYNC_PENDING)
+        try:
+            if ordered:
+                await self._dispatch_ordered(plan.all_async, args, kwargs)
+            elif max_concurrency is not None:
+                await self._dispatch_limited(
+                    plan.all_async, args, kwargs, max_concurrency
+                )
+            elif plan.batch_async:
+                await asyncio.gather(
+                    self._dispatch_async(plan.async_, (), args, kwargs),
+                    self._dispatch_async(plan.batch_async, (), ([args],), {}),
+                )
+            else:
+                await self._dispatch_async(plan.async_, (), args, kwargs)
+        finally:
+            if metrics is not None:
+                metrics.add(_ASYNC_PENDING, -1)
+
+    def has_async_handlers(self) -> bool:
+        """
+        Check whether any async handlers are subscribed, without allocating.
+
+        :return: True if at least one async handler is subscribed.
+        """
+        plan = self._plan
+        if plan is None:
+            plan = self._publish()
+        if plan.all_async or self._keyed_async:
+            return True
+        ranges = self._ranges
+        return ranges is not None and ranges.async_count > 0
+
+    async def _dispatch_async(
+        self,
+        async_handlers: Tuple[EventHandler, ...],
+        sync_handlers: Tuple[EventHandler, ...],
+        args: tuple[Any, ...],
+        kwargs: dict[str, Any],
+        errors: Optional[List[Exception]] = None,
+    ) -> None:
+        """
+        Run async handlers as tasks and sync handlers in the executor, then wait.
+
+        :param async_handlers: Handlers whose calls return coroutines.
+        :param sync_handlers: Handlers to run in the executor.
+        :param args: Positional arguments for the handlers.
+        :param kwargs: Keyword arguments for the handlers.
+        :param errors: List collecting handler exceptions, or None to report them.
+        """
         loop = asyncio.get_running_loop()
         tasks: List[Future] = []
 
-        for h in handlers_snapshot:
-            callback = h.get_callback()
-            if callback is None:
-                continue
+        if self._eager:
+            for h in async_handlers:
+                try:
+                    coroutine = h(*args, **kwargs)
+                except Exception as e:
+                    # e.g. arguments that do not bind to the handler
+                    self._report_error(e, h, errors)
+                    continue
+                if coroutine is not None:
+                    task = _eager_task_factory(
+                        loop, self._wrap_async_handler(coroutine, h, errors)
+                    )
+                    # Handlers that finished without suspending need no waiting
+                    if not task.done():
+                        tasks.append(task)
+        else:
+            for h in async_handlers:
+                # Calling the handler directly avoids rebuilding bound methods;
+                # it returns None if the bound instance has died
+                try:
+                    coroutine = h(*args, **kwargs)
+                except Exception as e:
+                    self._report_error(e, h, errors)
+                    continue
+                if coroutine is not None:
+                    tasks.append(
+                        loop.create_task(self._wrap_async_handler(coroutine, h, errors))
+                    )
 
-            if inspect.iscoroutinefunction(callback):
-                # Handle async functions (including bound async methods)
-                coroutine = callback(*args, **kwargs)
-                tasks.append(
-                    loop.create_task(self._wrap_async_handler(coroutine, callback))
-                )
-            elif hasattr(callback, "__func__") and inspect.iscoroutinefunction(
-                callback.__func__
-            ):
-                # Handle bound methods of async functions
-                coroutine = callback(*args, **kwargs)
-                tasks.append(
-                    loop.create_task(self._wrap_async_handler(coroutine, callback))
-                )
+        if sync_handlers:
+            policy = self._sync_policy
+            if policy == "inline":
+                # Cheap handlers: run on the loop thread, no executor round-trip
+                for h in sync_handlers:
+                    self._wrap_sync_handler(h, args, kwargs, errors)
             else:
-                # Handle sync functions in thread pool
-                tasks.append(
-                    loop.run_in_executor(
-                        None, self._wrap_sync_handler, callback, args, kwargs
+                executor = self._executor or _default_executor
+                if policy == "batched":
+                    # One executor job for the whole emission
+                    tasks.append(
+                        loop.run_in_executor(
+                            executor,
+                            self._run_sync_batch,
+                            sync_handlers,
+                            args,
+                            kwargs,
+                            errors,
+                        )
                     )
-                )
+                else:
+                    for h in sync_handlers:
+                        tasks.append(
+                            loop.run_in_executor(
+                                executor, self._wrap_sync_handler, h, args, kwargs, errors
+                            )
+                        )
 
         if tasks:
             # Wait for all tasks to complete with consistent error handling
             await asyncio.gather(*tasks, return_exceptions=True)
 
+    def _report_error(
+        self,
+        exception: Exception,
+        handler: EventHandler,
+        errors: Optional[List[Exception]] = None,
+    ) -> None:
+        """
+        Route a handler exception to the error handler, or collect it.
+
+        The callback is only rebuilt here, on the error path, and errors from
+        handlers whose instance has died are dropped. Collected exceptions skip
+        both. Either way the failure counts against the handler's circuit
+        breaker.
+
+        :param exception: The exception raised by the handler.
+        :param handler: The EventHandler that raised it.
+        :param errors: List collecting exceptions for an emission with
+                       ``collect_errors=True``, or None to report.
+        """
+        if errors is not None:
+            # list.append is atomic, so executor threads can share the list
+            errors.append(exception)
+        else:
+            callback = handler.get_callback()
+            if callback is not None:  # Only report errors for live handlers
+                try:
+                    self._error_handler(exception, callback)
+                except Exception:
+                    # Prevent error handler exceptions from propagating
+                    pass
+        if self._metrics is not None:
+            self._metrics.add(_ERRORS)
+        policy = self._breaker_policy
+        if policy is not None and handler._record_failure(policy, time.monotonic()):
+            # Not locked: failures may be reported from executor threads.
+            # Merged keyed and range plans are dropped too, as the unkeyed
+            # plan they are cached against may be rebuilt as the same (empty)
+            # object
+            self._invalidate()
+            if self._routed:
+                self._routed = {}
+            ranges = self._ranges
+            built = ranges._built if ranges is not None else None
+            if built is not None and built.plans:
+                built.plans = {}
+
     async def _wrap_async_handler(
-        self, coro: Coroutine, handler: Callable[P, None]
+        self,
+        coro: Coroutine,
+        handler: EventHandler,
+        errors: Optional[List[Exception]] = None,
     ) -> None:
         """
         Await a coroutine handler and route exceptions consistently.
 
         :param coro: Coroutine to await.
-        :param handler: Original handler function for error reporting.
+        :param handler: EventHandler that produced the coroutine, for error reporting.
+        :param errors: List collecting handler exceptions, or None to report them.
         """
         try:
             await coro
         except Exception as e:
-            try:
-                self._error_handler(e, handler)
-            except Exception:
-                # Prevent error handler exceptions from propagating
-                pass
+            self._report_error(e, handler, errors)
 
     def _wrap_sync_handler(
-        self, handler: Callable[P, None], args: tuple[Any, ...], kwargs: dict[str, Any]
+        self,
+        handler: EventHandler,
+        args: tuple[Any, ...],
+        kwargs: dict[str, Any],
+        errors: Optional[List[Exception]] = None,
     ) -> None:
         """
         Execute a synchronous handler and route exceptions consistently.
 
-        :param handler: Callable to run.
+        :param handler: EventHandler to run.
         :param args: Tuple of positional arguments for the handler.
         :param kwargs: Dictionary of keyword arguments for the handler.
+        :param errors: List collecting handler exceptions, or None to report them.
         """
         try:
             handler(*args, **kwargs)
         except Exception as e:
+            self._report_error(e, handler, errors)
+
+    async def _run_one(
+        self,
+        handler: EventHandler,
+        args: tuple[Any, ...],
+        kwargs: dict[str, Any],
+        errors: Optional[List[Exception]] = None,
+    ) -> None:
+        """
+        Run a single handler to completion from within the loop.
+
+        Async handlers are awaited directly (no task); sync handlers follow the
+        event's sync policy, with ``"batched"`` treated as ``"executor"``.
+        Batch-capable handlers receive the payload as a one-item batch.
+
+        :param handler: EventHandler to run.
+        :param args: Positional arguments for the handler.
+        :param kwargs: Keyword arguments for the handler.
+        :param errors: List collecting handler exceptions, or None to report them.
+        """
+        if handler._is_batch:
+            args, kwargs = ([args],), {}
+        elif handler._is_vectorized:
+            args, kwargs = self._one_row_columns(args, kwargs)
+
+        if handler._is_async:
             try:
-                self._error_handler(e, handler)
-            except Exception:
-                # Prevent error handler exceptions from propagating
-                pass
+                coroutine = handler(*args, **kwargs)
+            except Exception as e:
+                self._report_error(e, handler, errors)
+                return
+            if coroutine is not None:
+                await self._wrap_async_handler(coroutine, handler, errors)
+        elif self._sync_policy == "inline":
+            self._wrap_sync_handler(handler, args, kwargs, errors)
+        else:
+            await asyncio.get_running_loop().run_in_executor(
+                self._executor or _default_executor,
+                self._wrap_sync_handler,
+                handler,
+                args,
+                kwargs,
+                errors,
+            )
+
+    async def _dispatch_ordered(
+        self,
+        handlers: Tuple[EventHandler, ...],
+        args: tuple[Any, ...],
+        kwargs: dict[str, Any],
+        errors: Optional[List[Exception]] = None,
+    ) -> None:
+        """
+        Run handlers one after another in subscription order.
+
+        :param handlers: EventHandlers to run.
+        :param args: Positional arguments for the handlers.
+        :param kwargs: Keyword arguments for the handlers.
+        :param errors: List collecting handler exceptions, or None to report them.
+        """
+        for h in handlers:
+            await self._run_one(h, args, kwargs, errors)
+
+    async def _dispatch_limited(
+        self,
+        handlers: Tuple[EventHandler, ...],
+        args: tuple[Any, ...],
+        kwargs: dict[str, Any],
+        limit: int,
+        errors: Optional[List[Exception]] = None,
+    ) -> None:
+        """
+        Run handlers through at most ``limit`` worker tasks.
+
+        Workers pull handlers from a shared iterator, so only ``limit`` tasks and
+        at most ``limit`` handler coroutines exist at any time, regardless of
+        how many handlers are subscribed.
+
+        :param handlers: EventHandlers to run.
+        :param args: Positional arguments for the handlers.
+        :param kwargs: Keyword arguments for the handlers.
+        :param limit: Number of worker slots, at least 1; the public emitters
+                      validate it before dispatching.
+        :param errors: List collecting handler exceptions, or None to report them.
+        """
+        pending = iter(handlers)
+
+        async def worker() -> None:
+            for h in pending:
+                await self._run_one(h, args, kwargs, errors)
+
+        if limit == 1:
+            await worker()
+            return
+
+        loop = asyncio.get_running_loop()
+        workers = [loop.create_task(worker()) for _ in range(min(limit, len(handlers)))]
+        await asyncio.gather(*workers, return_exceptions=True)
+
+    def _run_sync_batch(
+        self,
+        handlers: Tuple[EventHandler, ...],
+        args: tuple[Any, ...],
+        kwargs: dict[str, Any],
+        errors: Optional[List[Exception]] = None,
+    ) -> None:
+        """
+        Run several sync handlers one after another, isolating their errors.
+
+        This is the single place synchronous emission invokes handlers, so
+        subclasses instrumenting handler calls (see :meth:`enable_timing`)
+        override it instead of the emit methods. A coroutine returned by a
+        handler cannot be awaited here and is closed.
+
+        :param handlers: EventHandlers to run in order.
+        :param args: Tuple of positional arguments for the handlers.
+        :param kwargs: Dictionary of keyword arguments for the handlers.
+        :param errors: List collecting handler exceptions, or None to report them.
+        """
+        for h in handlers:
+            try:
+                result = h(*args, **kwargs)
+                if inspect.iscoroutine(result):
+                    result.close()  # Avoid "never awaited" warnings
+            except Exception as e:
+                self._report_error(e, h, errors)
 
     def clear(self) -> None:
         """
@@ -410,35 +2211,125 @@ class Event:
         This is useful for cleanup or resetting event state.
         """
         with self._lock:
-            self._handlers.clear()
-            self._cleanup_counter = 0
+            self._pending_evictions = None
+            handlers = {}
+            if self._registry is not None:
+                handlers.update((id(h), h) for h in self._registry.clear())
+            if self._handler_keys:
+                handlers.update((id(h), h) for h in self._handler_keys)
+            if self._ranges is not None:
+                handlers.update((id(h), h) for h in self._ranges.handlers())
+            for h in handlers.values():
+                self._unwatch(h)
+            self._plan = _EMPTY_PLAN
+            self._held = None
+            self._registry = None
+            self._keyed = self._handler_keys = self._routed = None
+            self._keyed_count = self._keyed_async = 0
+            self._ranges = None
+            self._routing = False
+
+    def enable_timing(self) -> None:
+        """
+        Time every handler invocation into a per-handler latency histogram.
+
+        Covers ``emit``, ``emit_many``, ``emit_columns`` and every
+        ``emit_async`` mode. Timing is implemented by switching this event to
+        a timed subclass, so events without timing run exactly the untimed
+        code. Histograms recorded so far are kept; see
+        :meth:`handler_timings` and :meth:`reset_timings`.
+        """
+        from .timing import timed_class
+
+        with self._lock:
+            if self._timings is None:
+                self._timings = {}
+            self.__class__ = timed_class(type(self))
+
+    def disable_timing(self) -> None:
+        """
+        Stop timing handler invocations. Recorded histograms are kept.
+        """
+        with self._lock:
+            self.__class__ = getattr(type(self), "_untimed_class", type(self))
+
+    @property
+    def timing_enabled(self) -> bool:
+        """
+        :return: True if handler invocations are being timed.
+        """
+        return hasattr(type(self), "_untimed_class")
+
+    def handler_timings(self, reset: bool = False) -> Dict[EventHandler, Dict[str, Any]]:
+        """
+        Snapshot the latency histograms of this event's handlers.
+
+        :param reset: If True, start new histograms after taking the snapshot.
+        :return: Mapping of each timed EventHandler to a dictionary with its
+                 function_name (see :meth:`EventHandler.get_info`) and the
+                 fields of :meth:`~pyesys.timing.LatencyHistogram.snapshot`.
+        """
+        timings = self._timings
+        if timings is None:
+            return {}
+        if reset:
+            self._timings = {}
+        snapshot = {}
+        for handler, histogram in list(timings.items()):
+            entry = {"function_name": handler.get_info()["function_name"]}
+            entry.update(histogram.snapshot())
+            snapshot[handler] = entry
+        return snapshot
+
+    def reset_timings(self) -> None:
+        """
+        Discard all recorded latency histograms.
+        """
+        if self._timings is not None:
+            self._timings = {}
 
     def handler_count(self) -> int:
         """
         Number of currently alive handlers subscribed.
 
-        This property triggers cleanup of dead handlers for accurate counting.
+        Dead handlers are evicted when their instance is collected, so this
+        is a constant-time query.
 
         :return: Count of active handlers.
         """
-        with self._lock:
-            self._cleanup_dead_handlers(force=True)
-            return len(self._handlers)
+        if self._pending_evictions:
+            with self._lock:
+                self._drain_evictions()
+        registry, ranges = self._registry, self._ranges
+        return (
+            (len(registry) if registry is not None else 0)
+            + self._keyed_count
+            + (len(ranges) if ranges else 0)
+        )
 
     @property
     def handlers(self) -> List[Callable[P, None]]:
         """
         Return a list of currently alive handler callables.
 
-        This property triggers cleanup and reconstructs callable references.
+        This property reconstructs callable references for bound methods.
+        Unkeyed handlers come first, followed by keyed ones grouped by key and
+        then range-subscribed ones.
 
         :return: List of active handler functions or bound methods.
         """
-        with self._lock:
-            self._cleanup_dead_handlers(force=True)
-            return [
-                h.get_callback() for h in self._handlers if h.get_callback() is not None
-            ]
+        plan = self._plan
+        if plan is None or self._pending_evictions:
+            plan = self._publish()
+        handlers = plan.handlers
+        if self._routing:
+            with self._lock:
+                for bucket in (self._keyed or {}).values():
+                    handlers += bucket.snapshot()
+                if self._ranges is not None:
+                    handlers += self._ranges.handlers()
+        callbacks = [h.get_callback() for h in handlers]
+        return [cb for cb in callbacks if cb is not None]
 
     def __bool__(self) -> bool:
         """
@@ -463,6 +2354,15 @@ class Event:
         *,
         allow_duplicates: bool = True,
         error_handler: Optional[ErrorHandler] = None,
+        executor: Optional[Executor] = None,
+        sync_policy: SyncPolicy = "executor",
+        eager: bool = False,
+        columnar: bool = False,
+        key_extractor: Optional[Callable[..., Hashable]] = None,
+        threadsafe: bool = True,
+        thread_check: bool = False,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        name: Optional[str] = None,
     ) -> Tuple["Event", "Event.Listener"]:
         """
         Factory method to create an Event with runtime signature checking.
@@ -470,16 +2370,69 @@ class Event:
         :param example: Example function whose signature defines allowed handler signature.
         :param allow_duplicates: If True, same handler can be subscribed multiple times.
         :param error_handler: Custom error handler for exceptions during emission.
+        :param executor: Executor for sync handlers during emit_async, or None for
+                         the process-wide default.
+        :param sync_policy: ``"executor"``, ``"inline"`` or ``"batched"``; see :class:`Event`.
+        :param eager: If True, start async handlers eagerly in emit_async; see :class:`Event`.
+        :param columnar: If True, accept vectorized handlers and enable emit_columns.
+        :param key_extractor: Routing key extractor for keyed subscriptions; see :class:`Event`.
+        :param threadsafe: If False, skip locking for single-thread use; see :class:`Event`.
+        :param thread_check: With threadsafe=False, raise on cross-thread use; see :class:`Event`.
+        :param circuit_breaker: Suspend handlers that keep failing; see :class:`Event`.
+        :param name: Name under which the event reports metrics; see :class:`Event`.
         :return: Tuple of (Event instance, Listener interface).
-        :raises TypeError: If example is not callable.
+        :raises TypeError: If example is not callable or uses a reserved emit
+                           option as a parameter name.
+        :raises ValueError: If sync_policy is unknown.
         """
         if not callable(example):
             raise TypeError(f"Example must be callable, got {type(example)}")
 
-        e = cls(allow_duplicates=allow_duplicates, error_handler=error_handler)
-        e._sig = inspect.signature(example)
+        e = cls(
+            allow_duplicates=allow_duplicates,
+            error_handler=error_handler,
+            executor=executor,
+            sync_policy=sync_policy,
+            eager=eager,
+            columnar=columnar,
+            key_extractor=key_extractor,
+            threadsafe=threadsafe,
+            thread_check=thread_check,
+            circuit_breaker=circuit_breaker,
+            name=name,
+        )
+        e._set_signature(example)
         return e, e.listener
 
+    def _set_signature(self, example: Callable[P, None]) -> None:
+        """
+        Enable runtime signature checking against an example function.
+
+        :param example: Example function whose signature defines allowed handler signature.
+        :raises TypeError: If a parameter name is reserved for emit options.
+        """
+        sig = inspect.signature(example)
+        _check_reserved(sig)
+        self._use_signature(sig, tuple(p.kind for p in sig.parameters.values()))
+
+    def _use_signature(self, sig: inspect.Signature, kinds: tuple) -> None:
+        """
+        Enable runtime signature checking against a precomputed signature.
+
+        Lets many events share one signature object instead of each inspecting
+        its own example function.
+
+        :param sig: Expected handler signature.
+        :param kinds: Parameter kinds of sig.
+        """
+        self._sig = sig
+        self._sig_kinds = kinds
+        if self._key_extractor is _first_argument and kinds and kinds[0] in (
+            inspect.Parameter.POSITIONAL_OR_KEYWORD,
+            inspect.Parameter.KEYWORD_ONLY,
+        ):
+            self._key_extractor = _first_parameter(next(iter(sig.parameters)))
+
 
 # Factory alias for brevity (signature-checked events)
 create_event = Event.new
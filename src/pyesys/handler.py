@@ -1,10 +1,21 @@
 import weakref
 import inspect
+import threading
+import time
 from types import MethodType
 from typing import Callable, Optional, Protocol, ParamSpec, Any, Union, Coroutine
 
 P = ParamSpec("P")  # Parameter specification for handler arguments
 
+# Guard watcher bookkeeping. One EventHandler may be watched by several
+# events, each holding only its own lock, so handlers need a lock of their
+# own; they are striped by handler identity instead of allocating one per
+# handler. Reentrant because the weakref callback of another handler can run
+# on this thread while one is held. The callback itself takes no stripe, so
+# two threads collecting each other's instances cannot deadlock.
+_WATCHER_STRIPES = 64
+_watcher_locks = tuple(threading.RLock() for _ in range(_WATCHER_STRIPES))
+
 
 class ErrorHandler(Protocol):
     """
@@ -47,6 +58,167 @@ def default_error_handler(
     )
 
 
+def batch_handler(func: Callable[..., Any]) -> Callable[..., Any]:
+    """
+    Mark a handler as batch-capable.
+
+    A batch-capable handler takes a single parameter: a list of argument
+    tuples, one per emitted payload. ``Event.emit_many`` passes it the whole
+    batch in one call, and a plain ``emit`` passes a one-item batch. Batch
+    handlers receive positional arguments only.
+
+    Usage:
+    .. code-block:: python
+        @batch_handler
+        def store_rows(batch):
+            db.insert_many(row for (row,) in batch)
+
+    :param func: Function (or method) to mark.
+    :return: The same function, marked.
+    """
+    func.__pyesys_batch__ = True
+    return func
+
+
+def vectorized_handler(func: Callable[..., Any]) -> Callable[..., Any]:
+    """
+    Mark a handler as vectorized, for events created with ``columnar=True``.
+
+    A vectorized handler has the event's signature but receives one column
+    per parameter instead of one value: a NumPy array when NumPy is installed,
+    otherwise a ``memoryview`` for buffer-backed columns or a tuple.
+    ``Event.emit_columns`` passes it a whole batch of samples in one call, and
+    a plain ``emit`` passes one-row columns. Vectorized handlers must be
+    synchronous and receive positional arguments only.
+
+    Usage:
+    .. code-block:: python
+        @vectorized_handler
+        def on_samples(timestamps, values):
+            stats.update(values.mean(), values.max())
+
+    :param func: Function (or method) to mark.
+    :return: The same function, marked.
+    """
+    func.__pyesys_vectorized__ = True
+    return func
+
+
+class CircuitBreaker:
+    """
+    Policy suspending handlers that keep failing.
+
+    After ``failures`` exceptions within ``window`` seconds a handler is
+    skipped for ``cooloff`` seconds (the breaker is open). It is then called
+    again (half-open): a failure within the next ``window`` seconds suspends
+    it again at once, while a window without failure closes the breaker.
+
+    Usage:
+    .. code-block:: python
+        from pyesys import CircuitBreaker, create_event
+
+        event, listener = create_event(
+            example=lambda msg: None,
+            circuit_breaker=CircuitBreaker(failures=3, window=5.0, cooloff=60.0),
+        )
+    """
+
+    __slots__ = ("failures", "window", "cooloff")
+
+    def __init__(self, failures: int = 5, window: float = 10.0, cooloff: float = 30.0):
+        """
+        Initialize a breaker policy.
+
+        :param failures: Number of failures within a window that opens the breaker.
+        :param window: Seconds over which failures are counted.
+        :param cooloff: Seconds a handler is skipped once its breaker opened.
+        :raises ValueError: If failures is less than 1 or window or cooloff is
+                            not positive.
+        """
+        if failures < 1:
+            raise ValueError(f"failures must be >= 1, got {failures}")
+        if window <= 0:
+            raise ValueError(f"window must be > 0, got {window}")
+        if cooloff <= 0:
+            raise ValueError(f"cooloff must be > 0, got {cooloff}")
+        self.failures = failures
+        self.window = window
+        self.cooloff = cooloff
+
+    def __repr__(self) -> str:
+        return (
+            f"CircuitBreaker(failures={self.failures}, window={self.window:g}, "
+            f"cooloff={self.cooloff:g})"
+        )
+
+
+class _BreakerState:
+    """
+    Circuit breaker state of one EventHandler. Must be used with ``lock``
+    held; it is only taken on the error path and when dispatch plans are
+    rebuilt, never per emission.
+
+    ``window_end`` ends the current failure-counting window; once the breaker
+    opened it is the end of the half-open probation following the cool-off.
+    """
+
+    __slots__ = ("lock", "state", "count", "window_end", "open_until", "trips")
+
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.state = "closed"
+        self.count = 0
+        self.window_end = 0.0
+        self.open_until = 0.0
+        self.trips = 0
+
+    def _advance(self, now: float) -> None:
+        """
+        Apply the transitions that only depend on time.
+
+        :param now: Current ``time.monotonic()``.
+        """
+        if self.state == "open" and now >= self.open_until:
+            self.state = "half_open"
+        if self.state == "half_open" and now >= self.window_end:
+            self.state = "closed"
+            self.count = 0
+
+    def record(self, policy: CircuitBreaker, now: float) -> bool:
+        """
+        Count a failure.
+
+        :param policy: Breaker policy of the event the handler failed in.
+        :param now: Current ``time.monotonic()``.
+        :return: True if the handler is suspended now.
+        """
+        self._advance(now)
+        if self.state == "open":
+            # Called from a plan built before the breaker opened
+            return True
+        if self.state == "closed":
+            if now >= self.window_end:
+                self.count = 0
+                self.window_end = now + policy.window
+            self.count += 1
+            if self.count < policy.failures:
+                return False
+        self.state = "open"
+        self.open_until = now + policy.cooloff
+        self.window_end = self.open_until + policy.window
+        self.count = 0
+        self.trips += 1
+        return True
+
+    def suspended_until(self, now: float) -> Optional[float]:
+        """
+        :param now: Current ``time.monotonic()``.
+        :return: End of the cool-off if the breaker is open, otherwise None.
+        """
+        self._advance(now)
+        return self.open_until if self.state == "open" else None
+
+
 class EventHandler:
     """
     Wraps a callable handler with advanced features:
@@ -61,7 +233,16 @@ class EventHandler:
     while providing a simple callable interface.
     """
 
-    __slots__ = ("_func", "_self_ref", "_hash", "_is_async")
+    __slots__ = (
+        "_func",
+        "_self_ref",
+        "_hash",
+        "_is_async",
+        "_is_batch",
+        "_is_vectorized",
+        "_watchers",
+        "_breaker",
+    )
 
     def __init__(self, func: Callable[P, None]):
         """
@@ -89,6 +270,12 @@ class EventHandler:
             self._self_ref = None
             self._hash = hash((self._func, None))
             self._is_async = inspect.iscoroutinefunction(func)
+        self._is_batch = bool(getattr(self._func, "__pyesys_batch__", False))
+        self._is_vectorized = bool(getattr(self._func, "__pyesys_vectorized__", False))
+        self._watchers: Optional[list[weakref.WeakMethod]] = None
+        # Circuit breaker state, created on the first failure counted by an
+        # event with a CircuitBreaker
+        self._breaker: Optional[_BreakerState] = None
 
     def __call__(
         self, *args: P.args, **kwargs: P.kwargs
@@ -140,6 +327,114 @@ class EventHandler:
             return self._self_ref() is not None
         return True
 
+    def _add_watcher(self, watcher: weakref.WeakMethod) -> bool:
+        """
+        Register a weakly-referenced callback to be notified when the bound
+        instance dies.
+
+        The watcher is invoked exactly once with this handler as its only
+        argument, from the weakref callback of the instance. Free functions
+        never die, so watchers are not tracked for them.
+
+        :param watcher: WeakMethod pointing at the owner's eviction method.
+        :return: False if the bound instance is already dead, True otherwise.
+        """
+        if self._self_ref is None:
+            return True
+
+        with _watcher_locks[(id(self) >> 4) % _WATCHER_STRIPES]:
+            instance = self._self_ref()
+            if instance is None:
+                return False
+
+            if self._watchers is None:
+                self._watchers = []
+                # Swap in a reference that notifies us when the instance dies
+                self._self_ref = weakref.ref(instance, self._notify_watchers)
+            self._watchers.append(watcher)
+        return True
+
+    def _remove_watcher(self, watcher: weakref.WeakMethod) -> None:
+        """
+        Unregister a watcher previously added with :meth:`_add_watcher`.
+
+        When the last watcher goes away the notifying weak reference is replaced
+        by a plain one, breaking the reference cycle through the callback.
+
+        :param watcher: WeakMethod previously passed to :meth:`_add_watcher`.
+        """
+        if not self._watchers:
+            return  # Never watched, or the instance died and watchers were notified
+        with _watcher_locks[(id(self) >> 4) % _WATCHER_STRIPES]:
+            if not self._watchers:
+                return
+
+            try:
+                self._watchers.remove(watcher)
+            except ValueError:
+                return
+
+            if not self._watchers:
+                self._watchers = None
+                instance = self._self_ref()
+                if instance is not None:
+                    self._self_ref = weakref.ref(instance)
+
+    def _notify_watchers(self, _ref: weakref.ref) -> None:
+        """
+        Weakref callback fired when the bound instance is garbage-collected.
+
+        Takes no lock: the instance is dead, so :meth:`_add_watcher` can no
+        longer append, and a concurrent :meth:`_remove_watcher` at worst
+        removes from the detached list, whose copy is iterated here. Evicting
+        a handler twice is harmless.
+
+        :param _ref: The dead weak reference (unused).
+        """
+        watchers = self._watchers
+        self._watchers = None
+        if not watchers:
+            return
+
+        for watcher in tuple(watchers):
+            evict = watcher()
+            if evict is not None:
+                evict(self)
+
+    def _record_failure(self, policy: CircuitBreaker, now: float) -> bool:
+        """
+        Count a failure against this handler's circuit breaker.
+
+        :param policy: Breaker policy of the event the handler failed in.
+        :param now: Current ``time.monotonic()``.
+        :return: True if the handler is suspended, so dispatch plans including
+                 it must be rebuilt.
+        """
+        breaker = self._breaker
+        if breaker is None:
+            # The state is created once, under this handler's stripe
+            with _watcher_locks[(id(self) >> 4) % _WATCHER_STRIPES]:
+                breaker = self._breaker
+                if breaker is None:
+                    breaker = self._breaker = _BreakerState()
+        with breaker.lock:
+            return breaker.record(policy, now)
+
+    def _suspended_until(self, now: float) -> Optional[float]:
+        """
+        Check whether the circuit breaker currently suspends this handler.
+
+        An open breaker whose cool-off has elapsed becomes half-open here.
+
+        :param now: Current ``time.monotonic()``.
+        :return: End of the cool-off if suspended, otherwise None.
+        """
+        breaker = self._breaker
+        if breaker is None:
+            return None
+        with breaker.lock:
+            return breaker.suspended_until(now)
+
     def is_async(self) -> bool:
         """
         Check if this handler is async (coroutine function).
@@ -148,6 +443,22 @@ class EventHandler:
         """
         return self._is_async
 
+    def is_batch(self) -> bool:
+        """
+        Check if this handler was marked with :func:`batch_handler`.
+
+        :return: True if the handler receives whole batches of payloads.
+        """
+        return self._is_batch
+
+    def is_vectorized(self) -> bool:
+        """
+        Check if this handler was marked with :func:`vectorized_handler`.
+
+        :return: True if the handler receives columns of samples.
+        """
+        return self._is_vectorized
+
     def get_callback(self) -> Optional[Callable[P, None]]:
         """
         Return the current callable, reconstructing bound methods if necessary.
@@ -245,6 +556,9 @@ class EventHandler:
             "is_bound_method": self._self_ref is not None,
             "is_alive": self.is_alive(),
             "is_async": self._is_async,
+            "is_batch": self._is_batch,
+            "is_vectorized": self._is_vectorized,
+            "breaker": self._breaker_info(),
         }
 
         if self._self_ref is not None:
@@ -257,3 +571,27 @@ class EventHandler:
             )
 
         return info
+
+    def _breaker_info(self) -> dict[str, Any]:
+        """
+        Snapshot of the circuit breaker state for :meth:`get_info`.
+
+        :return: Dictionary with state (``"closed"``, ``"open"`` or
+                 ``"half_open"``), failures (counted in the current window),
+                 trips (times the breaker opened) and retry_in (seconds until
+                 a suspended handler is retried, or None).
+        """
+        breaker = self._breaker
+        if breaker is None:
+            return {"state": "closed", "failures": 0, "trips": 0, "retry_in": None}
+        with breaker.lock:
+            now = time.monotonic()
+            breaker._advance(now)
+            return {
+                "state": breaker.state,
+                "failures": breaker.count,
+                "trips": breaker.trips,
+                "retry_in": (
+                    breaker.open_until - now if breaker.state == "open" else None
+                ),
+            }
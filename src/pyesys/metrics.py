@@ -0,0 +1,198 @@
+import threading
+from threading import get_ident
+from typing import Dict, List, Optional, Tuple
+
+# Fields of each per-thread shard
+_EMISSIONS = 0
+_ERRORS = 1
+_EVICTIONS = 2
+_ASYNC_PENDING = 3  # Per-thread deltas; only their sum is meaningful
+_HANDLERS_MAX = 4
+_FIELDS = 5
+
+
+class EventMetrics:
+    """
+    Operational counters of one named event.
+
+    Every thread updates its own shard, so updates take no lock and lose no
+    increments; :meth:`collect` merges the shards. Per-instance events of an
+    :class:`~pyesys.prop.EventDescriptor` share one EventMetrics, so their
+    counters add up and the handler high-water mark is the largest handler
+    count any of them reached.
+    """
+
+    __slots__ = ("owner", "name", "_shards")
+
+    def __init__(self, owner: str, name: str):
+        """
+        :param owner: Qualified name of the owning class or module, or "".
+        :param name: Event name.
+        """
+        self.owner = owner
+        self.name = name
+        # Thread identifier -> counters indexed by the _FIELDS constants
+        self._shards: Dict[int, List[int]] = {}
+
+    def _shard(self) -> List[int]:
+        """
+        :return: The calling thread's shard, created on first use.
+        """
+        shard = self._shards.get(get_ident())
+        if shard is None:
+            shard = self._shards[get_ident()] = [0] * _FIELDS
+        return shard
+
+    def add(self, field: int, n: int = 1) -> None:
+        """
+        Add to a counter.
+
+        :param field: One of the field constants of this module.
+        :param n: Amount to add; negative for the async pending gauge.
+        """
+        shard = self._shards.get(get_ident())
+        if shard is None:
+            shard = self._shard()
+        shard[field] += n
+
+    def observe_handlers(self, count: int) -> None:
+        """
+        Raise the handler count high-water mark if ``count`` exceeds it.
+
+        :param count: Current number of subscribed handlers.
+        """
+        shard = self._shard()
+        if count > shard[_HANDLERS_MAX]:
+            shard[_HANDLERS_MAX] = count
+
+    def collect(self) -> Dict[str, int]:
+        """
+        Merge the per-thread shards.
+
+        :return: Dictionary with emissions, errors and evictions (totals),
+                 handlers_max (high-water mark) and async_pending (async
+                 dispatches queued or running).
+        """
+        totals = [0] * _FIELDS
+        for shard in list(self._shards.values()):
+            shard = list(shard)
+            for field in (_EMISSIONS, _ERRORS, _EVICTIONS, _ASYNC_PENDING):
+                totals[field] += shard[field]
+            totals[_HANDLERS_MAX] = max(totals[_HANDLERS_MAX], shard[_HANDLERS_MAX])
+        return {
+            "emissions": totals[_EMISSIONS],
+            "errors": totals[_ERRORS],
+            "evictions": totals[_EVICTIONS],
+            "handlers_max": totals[_HANDLERS_MAX],
+            "async_pending": totals[_ASYNC_PENDING],
+        }
+
+
+class MetricsRegistry:
+    """
+    Metrics of all named events, keyed by (owner, name).
+
+    Events are registered once, when created; scraping merges each event's
+    per-thread shards without stopping emitters.
+    """
+
+    def __init__(self) -> None:
+        self._events: Dict[Tuple[str, str], EventMetrics] = {}
+        self._lock = threading.Lock()
+
+    def event_metrics(self, name: str, owner: str = "") -> EventMetrics:
+        """
+        Return the metrics of a named event, creating them on first use.
+
+        :param name: Event name.
+        :param owner: Qualified name of the owning class or module, or "".
+        :return: The event's metrics, shared by all events with this identity.
+        """
+        key = (owner, name)
+        metrics = self._events.get(key)
+        if metrics is None:
+            with self._lock:
+                metrics = self._events.get(key)
+                if metrics is None:
+                    metrics = self._events[key] = EventMetrics(owner, name)
+        return metrics
+
+    def collect(self) -> List[Tuple[str, str, Dict[str, int]]]:
+        """
+        Snapshot every registered event.
+
+        :return: List of (owner, name, values) sorted by owner and name, where
+                 values is as returned by :meth:`EventMetrics.collect`.
+        """
+        with self._lock:
+            events = sorted(self._events.items())
+        return [(owner, name, m.collect()) for (owner, name), m in events]
+
+    def clear(self) -> None:
+        """
+        Forget all registered events. Existing events keep updating their
+        metrics objects, which are no longer reported.
+        """
+        with self._lock:
+            self._events = {}
+
+
+_registry = MetricsRegistry()
+
+
+def get_metrics_registry() -> MetricsRegistry:
+    """
+    Get the process-wide registry that named events report to.
+
+    :return: The registry.
+    """
+    return _registry
+
+
+# (metric name, collect() key, Prometheus type, help text)
+_FAMILIES = (
+    ("pyesys_event_emissions_total", "emissions", "counter",
+     "Emissions of the event."),
+    ("pyesys_event_handler_errors_total", "errors", "counter",
+     "Exceptions raised by the event's handlers."),
+    ("pyesys_event_evictions_total", "evictions", "counter",
+     "Handlers removed because their bound instance was garbage-collected."),
+    ("pyesys_event_handlers_max", "handlers_max", "gauge",
+     "Highest number of handlers subscribed to the event at once."),
+    ("pyesys_event_async_pending", "async_pending", "gauge",
+     "Async dispatches of the event queued or running."),
+)
+
+
+def _label_value(value: str) -> str:
+    """
+    Escape a label value for the Prometheus text format.
+
+    :param value: Raw value.
+    :return: Escaped value, without quotes.
+    """
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def render_prometheus(registry: Optional[MetricsRegistry] = None) -> str:
+    """
+    Render event metrics in the Prometheus text exposition format (0.0.4).
+
+    Each event is labelled with ``owner`` (qualified class or module name of
+    an :class:`~pyesys.prop.EventDescriptor` event, empty for events created
+    directly) and ``event`` (its name).
+
+    :param registry: Registry to render, or None for the process-wide one.
+    :return: Exposition text ending with a newline.
+    """
+    events = (registry or _registry).collect()
+    lines = []
+    for metric, key, kind, help_text in _FAMILIES:
+        lines.append(f"# HELP {metric} {help_text}")
+        lines.append(f"# TYPE {metric} {kind}")
+        for owner, name, values in events:
+            lines.append(
+                f'{metric}{{owner="{_label_value(owner)}",'
+                f'event="{_label_value(name)}"}} {values[key]}'
+            )
+    return "\n".join(lines) + "\n"
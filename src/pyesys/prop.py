@@ -1,31 +1,15 @@
 import inspect
-import asyncio
-import weakref
 import threading
-from concurrent.futures import ThreadPoolExecutor
-from typing import Callable, ParamSpec, Optional, Any, Dict, Tuple, List
-from .event import Event
+import weakref
+from types import MemberDescriptorType
+from typing import Callable, ParamSpec, Optional, Any, Dict, Tuple, List, Union, Iterable, Hashable
+from .event import Event, _check_reserved
+from .handler import CircuitBreaker
+from .dispatcher import get_dispatcher
+from .metrics import get_metrics_registry, _ASYNC_PENDING
 
 P = ParamSpec("P")  # Parameter spec for both module and class events
 
-# Shared thread pool for async handler execution in sync contexts
-_async_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="PyESys-Async")
-
-
-def _is_async_callable(func: Callable) -> bool:
-    """
-    Check if a callable is async, handling bound methods correctly.
-
-    :param func: Callable to check.
-    :return: True if the callable is async.
-    """
-    if inspect.iscoroutinefunction(func):
-        return True
-    # Handle bound methods - check the underlying function
-    if hasattr(func, "__func__"):
-        return inspect.iscoroutinefunction(func.__func__)
-    return False
-
 
 class EventDescriptor:
     """
@@ -38,103 +22,234 @@ class EventDescriptor:
     - Automatic signature detection and validation
     - Per-instance events for class usage
     - Global events for module usage
+    - Per-instance events stored on the instance itself where possible
+    - Per-instance events created lazily, on first subscription
     - Emitter decorator pattern
     - Mixed sync/async handler support with proper resource management
     """
 
-    def __init__(self, func: Callable[P, None]):
+    def __init__(
+        self,
+        func: Callable[P, None],
+        *,
+        threadsafe: bool = True,
+        thread_check: bool = False,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        metrics: bool = False,
+        key_extractor: Optional[Callable[..., Hashable]] = None,
+    ):
         """
         Initialize the EventDescriptor with a signature-defining function.
 
         :param func: Function whose signature defines the event parameters.
-        :raises TypeError: If func is not callable.
+        :param threadsafe: Passed to every Event created; see :class:`Event`.
+        :param thread_check: Passed to every Event created; see :class:`Event`.
+        :param circuit_breaker: Passed to every Event created; see :class:`Event`.
+        :param metrics: If True, the event reports to the metrics registry
+                        under its owner (defining class, or module for
+                        module-level events) and name. The Events of all
+                        instances share one set of metrics.
+        :param key_extractor: Passed to every Event created; see :class:`Event`.
+                              Per-instance events call it with the emitted
+                              arguments without ``self``.
+        :raises TypeError: If func is not callable or a parameter name is
+                           reserved for emit options.
         """
         if not callable(func):
             raise TypeError(f"Event signature must be callable, got {type(func)}")
 
         # Store optimized signature information instead of full signature object
         sig = inspect.signature(func)
+        _check_reserved(sig)
         self._param_kinds: List[inspect.Parameter.kind] = [
             p.kind for p in sig.parameters.values()
         ]
         self._param_count: int = len(sig.parameters)
         self._original_sig = sig  # Keep for error messages and complex validation
+        self._original_kinds = tuple(self._param_kinds)
+        # Handler signature of per-instance events ('self' dropped), computed
+        # once and shared by every instance's Event
+        params = list(sig.parameters.values())[1:]
+        self._instance_sig = sig.replace(parameters=params)
+        self._instance_kinds = tuple(p.kind for p in params)
+        self._threadsafe = threadsafe
+        self._thread_check = thread_check
+        self._circuit_breaker = circuit_breaker
+        self._key_extractor = key_extractor
+        self._metered = metrics
+        # Metrics identity; a class owner replaces it in __set_name__
+        self._metrics_owner: str = getattr(func, "__module__", None) or ""
+        self._metrics_name: str = getattr(func, "__qualname__", repr(func))
 
         self._name: Optional[str] = None
+        # Attribute holding each instance's Event, or None to use _per_instance
+        self._storage: Optional[str] = None
         self._per_instance: weakref.WeakKeyDictionary[Any, Event] = (
             weakref.WeakKeyDictionary()
         )
         self._global_event: Optional[Event] = None
-        self._cleanup_counter: int = 0
+        # Serializes Event creation so concurrent first accesses share one Event
+        self._create_lock = threading.Lock()
 
     def __set_name__(self, owner: type, name: str) -> None:
         """
         Called when class is created; switches to per-instance mode.
 
+        Each instance's Event is kept on the instance under
+        :meth:`storage_name` if instances have a ``__dict__`` or the class
+        declares that name in ``__slots__``, so lookups are plain attribute
+        reads. Otherwise the Event lives in a WeakKeyDictionary keyed by the
+        instance, which requires hashable, weak-referenceable instances.
+
         :param owner: The class that owns this descriptor.
         :param name: The attribute name.
         """
         self._name = name
+        self._metrics_owner = f"{owner.__module__}.{owner.__qualname__}"
+        self._metrics_name = name
+        # Reassigned on every call: dataclass(slots=True) rebuilds the class
+        # and calls this again on a class that may lack the first storage
+        storage = self.storage_name(name)
+        self._storage = (
+            storage
+            if owner.__dictoffset__
+            or isinstance(getattr(owner, storage, None), MemberDescriptorType)
+            else None
+        )
+
+    @staticmethod
+    def storage_name(name: str) -> str:
+        """
+        Attribute under which an instance keeps the Event of event ``name``.
+
+        Classes with ``__slots__`` and no ``__dict__`` can declare this name in
+        their slots to get instance storage instead of the weak-dict fallback.
+
+        :param name: Name of the event attribute.
+        :return: The storage attribute name.
+        """
+        return f"_pyesys_{name}"
+
+    @property
+    def storage(self) -> str:
+        """
+        How per-instance Events are stored: ``"instance"`` (in the instance
+        ``__dict__`` or a declared slot) or ``"weakref"`` (in a
+        WeakKeyDictionary). Module-level events report ``"global"``.
+
+        :return: The storage mode.
+        """
+        if self._name is None:
+            return "global"
+        return "instance" if self._storage is not None else "weakref"
+
+    def _instance_event(self, instance: Any) -> Optional[Event]:
+        """
+        Return the Event of an instance without creating it.
+
+        :param instance: Instance owning the event.
+        :return: Its Event, or None if it has none yet.
+        """
+        if self._storage is not None:
+            return getattr(instance, self._storage, None)
+        return self._per_instance.get(instance)
 
     def __get__(self, instance: Any, owner: type) -> Any:
         """
         Get the appropriate event listener based on access context.
 
+        Until a handler is subscribed the instance has no Event; a lightweight
+        listener stand-in answers queries and creates the Event on first
+        subscription.
+
         :param instance: Instance accessing the descriptor (None for class access).
         :param owner: Class owning the descriptor.
-        :return: Event.Listener for subscription operations.
+        :return: Event.Listener (or its stand-in) for subscription operations.
         """
         if instance is None:
             # Accessed on class: return this descriptor
             return self
 
-        # Accessed on instance: return (or create) that instance's Event listener
-        ev = self._per_instance.get(instance)
+        # Accessed on instance: return that instance's Event listener
+        storage = self._storage
+        if storage is not None:
+            ev = getattr(instance, storage, None)
+        else:
+            ev = self._per_instance.get(instance)
         if ev is None:
-            # For class-level events, create signature without 'self' parameter
-            if self._param_count > 0:
-                # Remove first parameter (self) for class events
-                class_param_kinds = self._param_kinds[1:]
-                class_param_count = self._param_count - 1
-            else:
-                class_param_kinds = []
-                class_param_count = 0
-
-            ev, listener = Event.new(
-                self._create_example_func(class_param_kinds, class_param_count)
-            )
-            self._per_instance[instance] = ev
+            return _PendingListener(self, instance)
+        return ev.listener
 
-            # Link the new listener back to the per-instance map for introspection
-            listener._per_instance = self._per_instance
-            return listener
+    def _ensure_instance_event(self, instance: Any) -> Event:
+        """
+        Return the Event of an instance, creating it if needed.
 
-        # Existing Event: get its listener and ensure proper linking
-        listener = ev.listener
-        listener._per_instance = self._per_instance
-        return listener
+        :param instance: Instance owning the event.
+        :return: Its Event.
+        """
+        ev = self._instance_event(instance)
+        if ev is not None:
+            return ev
+        with self._create_lock:
+            ev = self._instance_event(instance)
+            if ev is None:
+                ev = self._new_event(self._instance_sig, self._instance_kinds)
+                if self._storage is not None:
+                    # Bypasses custom __setattr__ (e.g. frozen dataclasses)
+                    object.__setattr__(instance, self._storage, ev)
+                else:
+                    self._per_instance[instance] = ev
+
+                # Link the new listener back to the per-instance map for introspection
+                ev.listener._per_instance = self._per_instance
+        return ev
 
-    def _create_example_func(
-        self, param_kinds: List[inspect.Parameter.kind], param_count: int
-    ) -> Callable:
+    def _new_event(
+        self, sig: inspect.Signature, kinds: Tuple[inspect.Parameter.kind, ...]
+    ) -> Event:
         """
-        Create a dummy function with the specified parameter signature.
+        Create an Event with this descriptor's options.
 
-        :param param_kinds: List of parameter kinds.
-        :param param_count: Number of parameters.
-        :return: Callable with matching signature.
+        :param sig: Handler signature.
+        :param kinds: Parameter kinds of sig.
+        :return: The new Event.
         """
-        if param_count == 0:
-            return lambda: None
-        elif param_count == 1:
-            return lambda a: None
-        elif param_count == 2:
-            return lambda a, b: None
-        elif param_count == 3:
-            return lambda a, b, c: None
-        else:
-            # For more complex signatures, fall back to *args
-            return lambda *args: None
+        ev = Event(
+            threadsafe=self._threadsafe,
+            thread_check=self._thread_check,
+            circuit_breaker=self._circuit_breaker,
+            key_extractor=self._key_extractor,
+        )
+        ev._use_signature(sig, kinds)
+        if self._metered:
+            ev._metrics = get_metrics_registry().event_metrics(
+                self._metrics_name, self._metrics_owner
+            )
+        return ev
+
+    def __set__(self, instance: Any, value: Any) -> None:
+        """
+        Accept the write-back of ``instance.event += handler``.
+
+        Augmented assignment stores the listener returned by ``__iadd__`` back
+        on the instance; that is a no-op here. Any other assignment is refused.
+
+        :param instance: Instance owning the event.
+        :param value: Value being assigned.
+        :raises AttributeError: If value is not the instance's own listener.
+        """
+        if (
+            isinstance(value, _PendingListener)
+            and value._descriptor is self
+            and value._instance is instance
+        ):
+            return  # -= before any subscription
+        ev = self._instance_event(instance) if self._name is not None else None
+        if ev is None or value is not ev.listener:
+            raise AttributeError(
+                f"Cannot assign to event '{self._name}'; "
+                f"use += and -= to change its handlers"
+            )
 
     def __iadd__(self, handler: Callable[P, None]) -> "EventDescriptor":
         """
@@ -151,10 +266,11 @@ class EventDescriptor:
         if self._name is None:
             # Module-level usage
             if self._global_event is None:
-                ev, _listener = Event.new(
-                    self._create_example_func(self._param_kinds, self._param_count)
-                )
-                self._global_event = ev
+                with self._create_lock:
+                    if self._global_event is None:
+                        self._global_event = self._new_event(
+                            self._original_sig, self._original_kinds
+                        )
             self._global_event += handler
             return self
 
@@ -192,30 +308,38 @@ class EventDescriptor:
         self, event: Event, args: Tuple[Any, ...], kwargs: Dict[str, Any]
     ) -> None:
         """
-        Handle async handlers in background with proper resource management.
+        Handle async handlers in background on the shared dispatcher loop.
+
+        Only the async handlers are dispatched: the sync ones have already run
+        in the preceding :meth:`Event.emit`.
 
         :param event: Event instance to emit on.
         :param args: Arguments for the event.
         :param kwargs: Keyword arguments for the event.
         """
-        async_handlers = [cb for cb in event.handlers if _is_async_callable(cb)]
-        if async_handlers:
-
-            def run_async() -> None:
+        if event.has_async_handlers():
+            metrics = event._metrics
+            if metrics is not None:
+                # Queued on the dispatcher; emit_async_only counts it while running
+                metrics.add(_ASYNC_PENDING)
+
+            async def run_async() -> None:
+                if metrics is not None:
+                    metrics.add(_ASYNC_PENDING, -1)
                 try:
-                    loop = asyncio.new_event_loop()
-                    asyncio.set_event_loop(loop)
-                    try:
-                        loop.run_until_complete(event.emit_async(*args, **kwargs))
-                    finally:
-                        loop.close()
+                    await event.emit_async_only(*args, **kwargs)
                 except Exception as e:
                     # Use the event's error handler for consistency
                     if hasattr(event, "_error_handler"):
                         event._error_handler(e, None)
 
-            # Use shared thread pool for better resource management
-            _async_executor.submit(run_async)
+            # A long-lived loop avoids creating an event loop per emission
+            try:
+                get_dispatcher().submit(run_async())
+            except Exception:
+                if metrics is not None:
+                    metrics.add(_ASYNC_PENDING, -1)
+                raise
 
     def emitter(self, fn: Callable[P, None]) -> Callable[P, None]:
         """
@@ -244,8 +368,7 @@ class EventDescriptor:
                 else:
                     # Class-level: pass args without sender to handlers
                     if args:  # Ensure we have at least one argument (self)
-                        inst = args[0]
-                        ev = self._per_instance.get(inst)
+                        ev = self._instance_event(args[0])
                         if ev is not None:
                             # For class events, handlers get args minus self
                             await ev.emit_async(*args[1:], **kwargs)
@@ -272,8 +395,7 @@ class EventDescriptor:
                 else:
                     # Class-level: pass args without sender to handlers
                     if args:  # Ensure we have at least one argument (self)
-                        inst = args[0]
-                        ev = self._per_instance.get(inst)
+                        ev = self._instance_event(args[0])
                         if ev is not None:
                             # For class events, handlers get args minus self
                             emit_args = args[1:]
@@ -288,7 +410,165 @@ class EventDescriptor:
             return sync_wrapped
 
 
-def event(func: Callable[P, None]) -> EventDescriptor:
+class _PendingListener:
+    """
+    Stand-in for the listener of an instance whose Event does not exist yet.
+
+    Queries are answered without creating the Event, unsubscribing is a
+    no-op, and the first subscription creates the Event and forwards to its
+    real listener.
+    """
+
+    __slots__ = ("_descriptor", "_instance")
+
+    def __init__(self, descriptor: EventDescriptor, instance: Any):
+        """
+        Initialize a stand-in listener.
+
+        :param descriptor: Descriptor of the event.
+        :param instance: Instance owning the event.
+        """
+        self._descriptor = descriptor
+        self._instance = instance
+
+    def _listener(self) -> "Event.Listener":
+        """
+        Create the instance's Event if needed and return its listener.
+
+        :return: The real listener.
+        """
+        return self._descriptor._ensure_instance_event(self._instance).listener
+
+    @staticmethod
+    def _check_callable(
+        handler: Union[Callable[P, None], Iterable[Callable[P, None]]]
+    ) -> None:
+        """
+        Validate handlers passed for removal, as :meth:`Event.unsubscribe_one` would.
+
+        :param handler: Callable or iterable of callables.
+        :raises TypeError: If a handler is not callable.
+        """
+        handlers = handler if isinstance(handler, (list, tuple, set)) else (handler,)
+        for h in handlers:
+            if not callable(h):
+                raise TypeError(f"Handler must be callable, got {type(h)}")
+
+    def __iadd__(
+        self, handler: Union[Callable[P, None], Iterable[Callable[P, None]]]
+    ) -> "Event.Listener":
+        """
+        Create the Event and subscribe one or more handlers.
+
+        :param handler: Callable or iterable of callables to subscribe.
+        :return: The real listener.
+        :raises TypeError: If handler is not callable.
+        """
+        listener = self._listener()
+        listener += handler
+        return listener
+
+    def __isub__(
+        self, handler: Union[Callable[P, None], Iterable[Callable[P, None]]]
+    ) -> "_PendingListener":
+        """
+        Unsubscribe handlers; nothing is subscribed yet, so this only validates.
+
+        :param handler: Callable or iterable of callables to unsubscribe.
+        :return: Self.
+        :raises TypeError: If handler is not callable.
+        """
+        ev = self._descriptor._instance_event(self._instance)
+        if ev is not None:  # Created by another thread meanwhile
+            listener = ev.listener
+            listener -= handler
+            return listener
+        self._check_callable(handler)
+        return self
+
+    def subscribe(
+        self,
+        handler: Union[Callable[P, None], Iterable[Callable[P, None]]],
+        key: Optional[Hashable] = None,
+    ) -> None:
+        """
+        Create the Event and subscribe handlers, see :meth:`Event.Listener.subscribe`.
+
+        :param handler: Callable or iterable of callables to subscribe.
+        :param key: Routing key, or None to receive every emission.
+        :raises TypeError: If handler is not callable.
+        """
+        self._listener().subscribe(handler, key=key)
+
+    def unsubscribe(
+        self,
+        handler: Union[Callable[P, None], Iterable[Callable[P, None]]],
+        key: Optional[Hashable] = None,
+    ) -> None:
+        """
+        Unsubscribe handlers, see :meth:`Event.Listener.unsubscribe`.
+
+        :param handler: Callable or iterable of callables to unsubscribe.
+        :param key: Routing key the handlers were subscribed with, or None.
+        :raises TypeError: If handler is not callable.
+        """
+        ev = self._descriptor._instance_event(self._instance)
+        if ev is not None:
+            ev.listener.unsubscribe(handler, key=key)
+        else:
+            self._check_callable(handler)
+
+    def subscribe_range(
+        self, handler: Callable[P, None], low: float, high: float
+    ) -> None:
+        """
+        Create the Event and subscribe a range handler, see
+        :meth:`Event.Listener.subscribe_range`.
+
+        :param handler: Callable to subscribe.
+        :param low: Inclusive lower bound.
+        :param high: Inclusive upper bound.
+        :raises TypeError: If handler is invalid or incompatible.
+        :raises ValueError: If low is greater than high.
+        """
+        self._listener().subscribe_range(handler, low, high)
+
+    def unsubscribe_range(
+        self, handler: Callable[P, None], low: float, high: float
+    ) -> None:
+        """
+        Unsubscribe a range handler, see :meth:`Event.Listener.unsubscribe_range`.
+
+        :param handler: Callable previously subscribed.
+        :param low: Lower bound it was subscribed with.
+        :param high: Upper bound it was subscribed with.
+        :raises TypeError: If handler is not callable.
+        """
+        ev = self._descriptor._instance_event(self._instance)
+        if ev is not None:
+            ev.listener.unsubscribe_range(handler, low, high)
+        else:
+            self._check_callable(handler)
+
+    def handler_count(self) -> int:
+        """
+        Number of currently alive handlers; always 0 before the first subscription.
+
+        :return: Count of active handlers.
+        """
+        ev = self._descriptor._instance_event(self._instance)
+        return ev.handler_count() if ev is not None else 0
+
+
+def event(
+    func: Optional[Callable[P, None]] = None,
+    *,
+    threadsafe: bool = True,
+    thread_check: bool = False,
+    circuit_breaker: Optional[CircuitBreaker] = None,
+    metrics: bool = False,
+    key_extractor: Optional[Callable[..., Hashable]] = None,
+) -> Any:
     """
     Decorator to create a module-level or class-level event.
 
@@ -312,8 +592,32 @@ def event(func: Callable[P, None]) -> EventDescriptor:
     In a class, this becomes a per-instance event; at module level,
     it's a single global event.
 
+    Options are passed by calling the decorator, e.g. for an event that is
+    only used on one thread:
+
+    .. code-block:: python
+        @event(threadsafe=False)
+        def on_changed(self, value):
+            pass
+
     :param func: Function defining the event signature.
-    :return: EventDescriptor that manages the event.
+    :param threadsafe: If False, the events skip locking; see :class:`Event`.
+    :param thread_check: With threadsafe=False, raise on cross-thread use; see :class:`Event`.
+    :param circuit_breaker: Suspend handlers that keep failing; see :class:`Event`.
+    :param metrics: Report to the metrics registry; see :class:`EventDescriptor`.
+    :param key_extractor: Routing key extractor for keyed subscriptions; see
+                          :class:`EventDescriptor`.
+    :return: EventDescriptor that manages the event, or a decorator returning
+             one when called with options only.
     :raises TypeError: If func is not callable.
     """
-    return EventDescriptor(func)
+    options = dict(
+        threadsafe=threadsafe,
+        thread_check=thread_check,
+        circuit_breaker=circuit_breaker,
+        metrics=metrics,
+        key_extractor=key_extractor,
+    )
+    if func is None:
+        return lambda f: EventDescriptor(f, **options)
+    return EventDescriptor(func, **options)
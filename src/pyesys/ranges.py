@@ -0,0 +1,268 @@
+import math
+from bisect import bisect_left, bisect_right
+from operator import itemgetter
+from typing import Any, Dict, List, Optional, Tuple
+
+from .handler import EventHandler
+from .columnar import _np
+
+
+# Width class of unbounded ranges
+_INF_CLASS = 1 << 16
+
+# Candidate windows larger than this are filtered with one NumPy compare
+_VECTOR_MIN = 64
+
+
+class RangeIndex:
+    """
+    Immutable interval index answering "which ranges contain this value".
+
+    Ranges are grouped into classes of similar width (by power of two, with
+    sparse narrow classes folded into the next wider one) and each class is
+    sorted by lower bound. A range of width at most ``w`` containing ``v`` must
+    start in ``[v - w, v]``, so two binary searches per class bound the
+    candidates, most of which match. Large candidate windows are filtered with
+    one vectorized NumPy compare when NumPy is installed. A lookup costs
+    O(classes * log n + matches), and matches are returned in subscription
+    order.
+
+    ``plans`` is left to the owning event to cache the dispatch plans it
+    merges with each match set; it is discarded with the index when ranges
+    change.
+    """
+
+    __slots__ = ("_classes", "plans")
+
+    def __init__(self, entries: List[Tuple[int, float, float, EventHandler]]):
+        """
+        Build the index from registry entries.
+
+        :param entries: Tuples of (sequence number, low, high, handler).
+        """
+        groups: Dict[int, list] = {}
+        for entry in entries:
+            width = entry[2] - entry[1]
+            exponent = math.frexp(width)[1] if width < math.inf else _INF_CLASS
+            groups.setdefault(exponent, []).append(entry)
+
+        # Every class costs two binary searches per lookup, so small classes
+        # are carried into the next wider one; unbounded ranges stay apart
+        min_size = max(_VECTOR_MIN, len(entries) // 16)
+        merged: List[list] = []
+        carry: list = []
+        for exponent in sorted(groups):
+            if exponent == _INF_CLASS:
+                if carry:
+                    merged.append(carry)
+                    carry = []
+                merged.append(groups[exponent])
+                continue
+            carry.extend(groups[exponent])
+            if len(carry) >= min_size:
+                merged.append(carry)
+                carry = []
+        if carry:
+            merged.append(carry)
+
+        classes = []
+        for group in merged:
+            group.sort(key=lambda e: e[1])
+            highs = [e[2] for e in group]
+            classes.append(
+                (
+                    [e[1] for e in group],
+                    highs,
+                    [e[0] for e in group],
+                    [e[3] for e in group],
+                    max(e[2] - e[1] for e in group),
+                    _np.array(highs) if _np is not None and len(group) > _VECTOR_MIN else None,
+                )
+            )
+        self._classes = classes
+        self.plans: Dict[Any, Any] = {}
+
+    def match(self, value: Any) -> Tuple[EventHandler, ...]:
+        """
+        Find the handlers whose range contains ``value`` (bounds inclusive).
+
+        :param value: Number to look up.
+        :return: Matching handlers in subscription order.
+        :raises TypeError: If value cannot be compared with numbers.
+        """
+        if value != value:  # NaN is in no range
+            return ()
+
+        hits = []
+        for lows, highs, seqs, handlers, max_width, highs_np in self._classes:
+            end = bisect_right(lows, value)
+            if not end:
+                continue
+            start = bisect_left(lows, value - max_width, 0, end)
+            if highs_np is not None and end - start > _VECTOR_MIN:
+                found = _np.flatnonzero(highs_np[start:end] >= value) + start
+                hits.extend((seqs[i], handlers[i]) for i in found.tolist())
+            else:
+                hits.extend(
+                    (seqs[i], handlers[i])
+                    for i in range(start, end)
+                    if highs[i] >= value
+                )
+
+        if len(hits) > 1:
+            hits.sort(key=itemgetter(0))
+        return tuple(h for _seq, h in hits)
+
+
+class RangeRegistry:
+    """
+    Storage for range subscriptions, the interval counterpart of
+    :class:`~pyesys.registry.HandlerRegistry`.
+
+    Entries map sequence numbers to (low, high, handler) and ``_index`` maps
+    each distinct handler to its sequence numbers, so removal and eviction are
+    cheap. The searchable :class:`RangeIndex` is rebuilt lazily after changes.
+
+    The registry is not synchronized; the owning Event serializes mutations
+    and index rebuilds.
+    """
+
+    __slots__ = ("_entries", "_index", "_next_seq", "_async_count", "_built")
+
+    def __init__(self) -> None:
+        """
+        Initialize an empty registry.
+        """
+        self._entries: Dict[int, Tuple[float, float, EventHandler]] = {}
+        self._index: Dict[EventHandler, List[int]] = {}
+        self._next_seq = 0
+        self._async_count = 0
+        self._built: Optional[RangeIndex] = None
+
+    def add(
+        self, handler: EventHandler, low: float, high: float, allow_duplicates: bool
+    ) -> bool:
+        """
+        Subscribe a handler for values in ``[low, high]``.
+
+        :param handler: Handler to subscribe; equal handlers share the first
+                        subscribed object.
+        :param low: Inclusive lower bound.
+        :param high: Inclusive upper bound.
+        :param allow_duplicates: If False, an identical range subscription is ignored.
+        :return: True if a subscription was added.
+        """
+        seqs = self._index.get(handler)
+        if seqs is None:
+            seqs = self._index[handler] = []
+        elif not allow_duplicates and any(
+            self._entries[s][:2] == (low, high) for s in seqs
+        ):
+            return False
+        else:
+            handler = self._entries[seqs[0]][2]
+
+        seq = self._next_seq
+        self._next_seq = seq + 1
+        seqs.append(seq)
+        self._entries[seq] = (low, high, handler)
+        if handler._is_async:
+            self._async_count += 1
+        self._built = None
+        return True
+
+    def remove(
+        self, handler: EventHandler, low: float, high: float
+    ) -> Tuple[bool, Optional[EventHandler]]:
+        """
+        Remove the earliest subscription of a handler for ``[low, high]``.
+
+        :param handler: Handler equal to a subscribed one.
+        :param low: Lower bound it was subscribed with.
+        :param high: Upper bound it was subscribed with.
+        :return: Tuple of (removed, canonical handler if this removed its last
+                 range subscription, else None).
+        """
+        seqs = self._index.get(handler)
+        if not seqs:
+            return False, None
+        for i, seq in enumerate(seqs):
+            if self._entries[seq][:2] == (low, high):
+                break
+        else:
+            return False, None
+
+        del seqs[i]
+        canonical = self._entries.pop(seq)[2]
+        if canonical._is_async:
+            self._async_count -= 1
+        self._built = None
+        if seqs:
+            return True, None
+        del self._index[canonical]
+        return True, canonical
+
+    def evict(self, handler: EventHandler) -> int:
+        """
+        Remove every range subscription of a canonical handler by identity.
+
+        :param handler: The canonical handler.
+        :return: Number of subscriptions removed.
+        """
+        seqs = self._index.pop(handler, None)
+        if not seqs:
+            return 0
+        for seq in seqs:
+            del self._entries[seq]
+        if handler._is_async:
+            self._async_count -= len(seqs)
+        self._built = None
+        return len(seqs)
+
+    def canonical(self, handler: EventHandler) -> Optional[EventHandler]:
+        """
+        Look up the canonical object of a subscribed handler.
+
+        :param handler: Handler equal to a subscribed one.
+        :return: The canonical handler, or None if not subscribed.
+        """
+        seqs = self._index.get(handler)
+        return self._entries[seqs[0]][2] if seqs else None
+
+    def build(self) -> RangeIndex:
+        """
+        Return the searchable index, rebuilding it if subscriptions changed.
+
+        :return: The current RangeIndex.
+        """
+        built = self._built
+        if built is None:
+            built = self._built = RangeIndex(
+                [(seq, low, high, h) for seq, (low, high, h) in self._entries.items()]
+            )
+        return built
+
+    def handlers(self) -> Tuple[EventHandler, ...]:
+        """
+        Return the subscribed handlers in subscription order.
+
+        :return: Tuple of handlers, with duplicates repeated.
+        """
+        return tuple(h for _low, _high, h in self._entries.values())
+
+    @property
+    def async_count(self) -> int:
+        """
+        Number of range subscriptions whose handler is async.
+
+        :return: Count of async subscriptions.
+        """
+        return self._async_count
+
+    def __len__(self) -> int:
+        """
+        Total number of range subscriptions.
+
+        :return: Number of subscriptions.
+        """
+        return len(self._entries)
@@ -0,0 +1,166 @@
+import itertools
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from .handler import EventHandler
+
+
+class HandlerRegistry:
+    """
+    Insertion-ordered, hash-indexed storage for subscribed handlers.
+
+    Every subscription gets a monotonically increasing sequence number. The
+    ``_entries`` dict maps sequence numbers to handlers and preserves
+    subscription order, while ``_index`` maps each distinct handler (hashed by
+    ``EventHandler._hash``) to the sequence numbers of its subscriptions. The
+    length of that list is the handler's multiplicity when duplicates are
+    allowed.
+
+    This makes subscribe, unsubscribe and eviction O(1) while emission order
+    matches the order a plain list would give, including for duplicates.
+
+    Several registries can draw sequence numbers from one shared counter, so
+    that their entries can be merged back into a single global order.
+
+    The registry is not synchronized; the owning Event serializes mutations.
+    """
+
+    __slots__ = ("_entries", "_index", "_seq", "_snapshot")
+
+    def __init__(self, sequence: Optional[Iterator[int]] = None) -> None:
+        """
+        Initialize an empty registry.
+
+        :param sequence: Shared source of sequence numbers, or None for a
+                         private counter.
+        """
+        self._entries: Dict[int, EventHandler] = {}
+        self._index: Dict[EventHandler, List[int]] = {}
+        self._seq = sequence if sequence is not None else itertools.count()
+        self._snapshot: Optional[Tuple[EventHandler, ...]] = ()
+
+    def add(
+        self, handler: EventHandler, allow_duplicates: bool
+    ) -> Tuple[bool, EventHandler]:
+        """
+        Append a subscription for a handler.
+
+        Equal handlers share one canonical EventHandler object, so identity
+        lookups (as done by eviction) find every occurrence.
+
+        :param handler: Handler to subscribe.
+        :param allow_duplicates: If False, an already present handler is ignored.
+        :return: Tuple of (is_new, canonical handler). ``is_new`` is True when
+                 the handler was not present before this call.
+        """
+        seqs = self._index.get(handler)
+        if seqs is None:
+            seqs = self._index[handler] = []
+            canonical = handler
+        elif not allow_duplicates:
+            return False, handler
+        else:
+            canonical = self._entries[seqs[0]]
+
+        seq = next(self._seq)
+        seqs.append(seq)
+        self._entries[seq] = canonical
+        self._snapshot = None
+        return len(seqs) == 1, canonical
+
+    def canonical(self, handler: EventHandler) -> Optional[EventHandler]:
+        """
+        Look up the canonical object of a subscribed handler.
+
+        :param handler: Handler equal to a subscribed one.
+        :return: The canonical handler, or None if not subscribed.
+        """
+        seqs = self._index.get(handler)
+        return self._entries[seqs[0]] if seqs else None
+
+    def remove(self, handler: EventHandler) -> Optional[EventHandler]:
+        """
+        Remove the earliest subscription of a handler.
+
+        :param handler: Handler equal to a subscribed one.
+        :return: The canonical handler if this removed its last subscription,
+                 otherwise None (also when the handler was not subscribed).
+        """
+        seqs = self._index.get(handler)
+        if seqs is None:
+            return None
+
+        canonical = self._entries.pop(seqs.pop(0))
+        self._snapshot = None
+        if seqs:
+            return None
+        del self._index[canonical]
+        return canonical
+
+    def evict(self, handler: EventHandler) -> int:
+        """
+        Remove every subscription of a canonical handler by identity.
+
+        Dead handlers no longer compare equal to anything, but dict lookups
+        check identity first, so the canonical object still finds its entry.
+
+        :param handler: The canonical handler returned by :meth:`add`.
+        :return: Number of subscriptions removed.
+        """
+        seqs = self._index.pop(handler, None)
+        if not seqs:
+            return 0
+
+        for seq in seqs:
+            del self._entries[seq]
+        self._snapshot = None
+        return len(seqs)
+
+    def clear(self) -> List[EventHandler]:
+        """
+        Remove all subscriptions.
+
+        :return: The distinct canonical handlers that were subscribed.
+        """
+        handlers = list(self._index)
+        self._entries.clear()
+        self._index.clear()
+        self._snapshot = ()
+        return handlers
+
+    def items(self) -> Tuple[Tuple[int, EventHandler], ...]:
+        """
+        Return (sequence number, handler) pairs in subscription order.
+
+        :return: Tuple of pairs, sorted by sequence number.
+        """
+        return tuple(self._entries.items())
+
+    def snapshot(self) -> Tuple[EventHandler, ...]:
+        """
+        Return the handlers in subscription order as an immutable tuple.
+
+        The tuple is cached until the next mutation.
+
+        :return: Tuple of handlers, with duplicates repeated.
+        """
+        snapshot = self._snapshot
+        if snapshot is None:
+            snapshot = self._snapshot = tuple(self._entries.values())
+        return snapshot
+
+    def __contains__(self, handler: EventHandler) -> bool:
+        """
+        Check whether a handler equal to ``handler`` is subscribed.
+
+        :param handler: Handler to look up.
+        :return: True if subscribed at least once.
+        """
+        return handler in self._index
+
+    def __len__(self) -> int:
+        """
+        Total number of subscriptions, counting duplicates.
+
+        :return: Number of subscriptions.
+        """
+        return len(self._entries)
@@ -0,0 +1,306 @@
+import heapq
+import threading
+import time
+from operator import itemgetter
+from typing import Any, Callable, Hashable, Iterator, List, Optional, Tuple
+
+from .event import Event, _DispatchPlan, P
+from .handler import EventHandler
+from .metrics import _EVICTIONS
+from .registry import HandlerRegistry
+
+
+class _Sequence:
+    """
+    Thread-safe counter shared by the shards of one event.
+
+    ``itertools.count`` is only atomic under the GIL; on free-threaded builds
+    two shards could draw the same number, so a lock guards the increment.
+    """
+
+    __slots__ = ("_lock", "_next")
+
+    def __init__(self) -> None:
+        """
+        Initialize a counter starting at zero.
+        """
+        self._lock = threading.Lock()
+        self._next = 0
+
+    def __iter__(self) -> Iterator[int]:
+        """
+        :return: Self, so the counter can stand in for ``itertools.count``.
+        """
+        return self
+
+    def __next__(self) -> int:
+        """
+        Draw the next number.
+
+        :return: A number never returned before.
+        """
+        with self._lock:
+            value = self._next
+            self._next = value + 1
+        return value
+
+
+class _Shard:
+    """
+    One independently locked segment of a ShardedEvent.
+    """
+
+    __slots__ = ("lock", "registry", "pending")
+
+    def __init__(self, sequence: _Sequence):
+        """
+        Initialize an empty shard.
+
+        :param sequence: Sequence counter shared by all shards of the event.
+        """
+        self.lock = threading.Lock()
+        self.registry = HandlerRegistry(sequence)
+        # Evictions deferred because the lock was busy
+        self.pending: List[EventHandler] = []
+
+
+class ShardedEvent(Event):
+    """
+    Event variant that spreads handlers over independently locked shards.
+
+    Subscribing and unsubscribing only lock the shard that owns the handler
+    (chosen by the handler's hash), so threads churning different handlers
+    rarely contend. Every subscription draws its sequence number from one
+    counter shared by all shards, and the published dispatch plan merges the
+    shards by sequence number: emission order is the global subscription
+    order, exactly as with :class:`Event`.
+
+    Emission is unchanged: emitters read the published plan without locking,
+    and the first emission after a change republishes it. Keyed and range
+    subscriptions are kept in the routing tables of :class:`Event`, under the
+    event lock, and routed on top of the merged plan.
+    """
+
+    __slots__ = ("_shards", "_versions", "_version")
+
+    def __init__(self, *, shards: int = 16, **kwargs: Any):
+        """
+        Initialize a sharded Event with no handlers.
+
+        :param shards: Number of independently locked segments.
+        :param kwargs: Any keyword argument accepted by :class:`Event`.
+        :raises ValueError: If shards is less than 1.
+        """
+        if shards < 1:
+            raise ValueError(f"shards must be >= 1, got {shards}")
+        super().__init__(**kwargs)
+        sequence = _Sequence()
+        self._shards = tuple(_Shard(sequence) for _ in range(shards))
+        # Each change stores a fresh number, so a publisher can tell whether
+        # a shard changed while it was merging
+        self._versions = _Sequence()
+        self._version = next(self._versions)
+
+    def _shard_for(self, handler: EventHandler) -> _Shard:
+        """
+        Return the shard owning a handler; equal handlers share a shard.
+
+        :param handler: Handler to place.
+        :return: The owning shard.
+        """
+        return self._shards[handler._hash % len(self._shards)]
+
+    def _invalidate(self) -> None:
+        """
+        Drop the published plan after a shard changed.
+
+        The version is bumped before the plan is cleared so that a concurrent
+        :meth:`_publish` either sees the new version or has its plan cleared.
+        """
+        self._version = next(self._versions)
+        super()._invalidate()
+
+    def _drain_shard(self, shard: _Shard) -> bool:
+        """
+        Apply evictions deferred on a shard. Must be called with its lock held.
+
+        :param shard: Shard to drain.
+        :return: True if any handler was removed.
+        """
+        removed = 0
+        while shard.pending:
+            removed += bool(shard.registry.evict(shard.pending.pop()))
+        if removed and self._metrics is not None:
+            self._metrics.add(_EVICTIONS, removed)
+        return bool(removed)
+
+    def _evict_handler(self, handler: EventHandler) -> None:
+        """
+        Remove a handler whose bound instance has died from its shard and
+        from the keyed and range tables.
+
+        Like :meth:`Event._evict_handler`, each lock is only tried and the
+        eviction is deferred if it is busy.
+
+        :param handler: The dead EventHandler to remove.
+        """
+        if self._handler_keys or self._ranges:
+            super()._evict_handler(handler)
+        shard = self._shard_for(handler)
+        if not shard.lock.acquire(blocking=False):
+            shard.pending.append(handler)
+            return
+        try:
+            removed = shard.registry.evict(handler)
+        finally:
+            shard.lock.release()
+        if removed:
+            self._invalidate()
+            if self._metrics is not None:
+                self._metrics.add(_EVICTIONS)
+
+    def _publish(self) -> _DispatchPlan:
+        """
+        Merge the shards into a new dispatch plan and publish it.
+
+        Publishers are serialized by the event lock; shard locks are only held
+        while copying each shard. If a shard changed during the merge the plan
+        is still returned but left unpublished, so the next emission merges
+        again.
+
+        :return: The dispatch plan.
+        """
+        held = self._held
+        if held is not None and time.monotonic() < held.retry_at:
+            return held
+        with self._lock:
+            self._drain_evictions()
+            plan = self._plan
+            if plan is not None:
+                return plan
+
+            version = self._version
+            parts = []
+            for shard in self._shards:
+                with shard.lock:
+                    self._drain_shard(shard)
+                    parts.append(shard.registry.items())
+            handlers = tuple(
+                h for _seq, h in heapq.merge(*parts, key=itemgetter(0))
+            )
+            plan = _DispatchPlan(handlers)
+            self._install(plan)
+            if self._version != version:
+                super()._invalidate()
+        return plan
+
+    def subscribe_one(
+        self, handler: Callable[P, None], key: Optional[Hashable] = None
+    ) -> None:
+        """
+        Subscribe a single handler, locking only its shard.
+
+        Keyed subscriptions go to the routing index of :class:`Event` instead,
+        under the event lock.
+
+        :param handler: Callable to subscribe.
+        :param key: Routing key, or None to receive every emission.
+        :raises TypeError: If handler is invalid or incompatible.
+        """
+        if key is not None:
+            super().subscribe_one(handler, key)
+            return
+        self._validate_handler(handler)
+
+        h = handler if isinstance(handler, EventHandler) else EventHandler(handler)
+        shard = self._shard_for(h)
+        with shard.lock:
+            self._drain_shard(shard)
+            is_new, canonical = shard.registry.add(h, self._allow_duplicates)
+            added = is_new or self._allow_duplicates
+            if is_new and not self._watch(canonical):
+                # Instance died before we could watch it
+                shard.registry.evict(canonical)
+        if added:
+            self._invalidate()
+            self._observe_handlers()
+
+    def unsubscribe_one(
+        self, handler: Callable[P, None], key: Optional[Hashable] = None
+    ) -> None:
+        """
+        Unsubscribe a single handler, locking only its shard.
+
+        :param handler: Callable previously subscribed.
+        :param key: Routing key the handler was subscribed with, or None.
+        :raises TypeError: If handler is not callable.
+        """
+        if key is not None:
+            super().unsubscribe_one(handler, key)
+            return
+        if not callable(handler):
+            raise TypeError(f"Handler must be callable, got {type(handler)}")
+
+        h = handler if isinstance(handler, EventHandler) else EventHandler(handler)
+        shard = self._shard_for(h)
+        with shard.lock:
+            self._drain_shard(shard)
+            if h not in shard.registry:
+                return  # Handler not found, ignore silently
+            last = shard.registry.remove(h)
+            if last is not None:
+                self._unwatch(last)
+        self._invalidate()
+
+    def clear(self) -> None:
+        """
+        Remove all subscribed handlers from every shard.
+        """
+        for shard in self._shards:
+            with shard.lock:
+                shard.pending.clear()
+                for h in shard.registry.clear():
+                    self._unwatch(h)
+        super().clear()
+        self._invalidate()
+
+    def handler_count(self) -> int:
+        """
+        Number of currently alive handlers subscribed, across all shards and
+        the keyed and range tables.
+
+        :return: Count of active handlers.
+        """
+        total = super().handler_count()
+        for shard in self._shards:
+            if shard.pending:
+                with shard.lock:
+                    if self._drain_shard(shard):
+                        self._invalidate()
+            total += len(shard.registry)
+        return total
+
+    @classmethod
+    def new(
+        cls, example: Callable[P, None], *, shards: int = 16, **kwargs: Any
+    ) -> Tuple["ShardedEvent", "Event.Listener"]:
+        """
+        Factory method to create a sharded Event with runtime signature checking.
+
+        :param example: Example function whose signature defines allowed handler signature.
+        :param shards: Number of independently locked segments.
+        :param kwargs: Any keyword argument accepted by :meth:`Event.new`.
+        :return: Tuple of (ShardedEvent instance, Listener interface).
+        :raises TypeError: If example is not callable.
+        :raises ValueError: If shards is less than 1 or sync_policy is unknown.
+        """
+        if not callable(example):
+            raise TypeError(f"Example must be callable, got {type(example)}")
+
+        e = cls(shards=shards, **kwargs)
+        e._set_signature(example)
+        return e, e.listener
+
+
+# Factory alias mirroring create_event
+create_sharded_event = ShardedEvent.new
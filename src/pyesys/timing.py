@@ -0,0 +1,239 @@
+import inspect
+import threading
+import time
+from threading import get_ident
+from typing import Any, Coroutine, Dict, List, Optional, Tuple, Type
+
+from .event import Event
+from .handler import EventHandler
+
+# Bucket i counts durations below 2**(_MIN_BITS + i) nanoseconds (about 1 us
+# for the first bucket, doubling up to about 17 s); the last bucket counts
+# everything longer
+_MIN_BITS = 10
+_BUCKETS = 26
+_BOUNDS_NS = tuple(1 << (_MIN_BITS + i) for i in range(_BUCKETS - 1))
+# Slots after the bucket counts in each per-thread shard
+_TOTAL = _BUCKETS
+_MAX = _BUCKETS + 1
+
+
+class LatencyHistogram:
+    """
+    Fixed-bucket, log-scale histogram of handler durations.
+
+    Buckets double in width, from under 1.02 us up to 17.2 s, plus one
+    overflow bucket, so recording is a ``bit_length`` and one increment and
+    memory stays constant however many durations are recorded. Percentiles
+    are estimated as the upper bound of the bucket they fall in.
+
+    Each recording thread updates its own shard (bucket counts, total and
+    maximum), so recording takes no lock and loses no updates; shards are
+    merged by :meth:`snapshot`.
+    """
+
+    __slots__ = ("_shards",)
+
+    def __init__(self) -> None:
+        # Thread identifier -> bucket counts followed by total and max (ns)
+        self._shards: Dict[int, List[int]] = {}
+
+    def record(self, ns: int) -> None:
+        """
+        Record one duration.
+
+        :param ns: Duration in nanoseconds.
+        """
+        shard = self._shards.get(get_ident())
+        if shard is None:
+            shard = self._shards[get_ident()] = [0] * (_BUCKETS + 2)
+        index = ns.bit_length() - _MIN_BITS
+        if index < 0:
+            index = 0
+        elif index >= _BUCKETS:
+            index = _BUCKETS - 1
+        shard[index] += 1
+        shard[_TOTAL] += ns
+        if ns > shard[_MAX]:
+            shard[_MAX] = ns
+
+    def _percentile(self, counts: List[int], count: int, max_ns: int, pct: float) -> float:
+        """
+        Estimate a percentile from bucket counts.
+
+        :param counts: Bucket counts.
+        :param count: Total number of durations.
+        :param max_ns: Longest duration, bounding the estimate.
+        :param pct: Percentile between 0 and 100.
+        :return: Estimate in seconds.
+        """
+        rank = max(1, -(-count * pct // 100))
+        seen = 0
+        for i, n in enumerate(counts):
+            seen += n
+            if seen >= rank:
+                if i < len(_BOUNDS_NS):
+                    return min(_BOUNDS_NS[i], max_ns) / 1e9
+                break
+        return max_ns / 1e9
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Merge the per-thread shards into a summary. Durations recorded while
+        the snapshot is taken may be partially included.
+
+        :return: Dictionary with count, total, mean and max (seconds), p50, p90
+                 and p99 estimates (seconds), and buckets: a list of
+                 (upper bound in seconds, count) pairs, the last one with an
+                 infinite bound.
+        """
+        counts = [0] * _BUCKETS
+        total_ns = max_ns = 0
+        for shard in list(self._shards.values()):
+            shard = list(shard)
+            for i in range(_BUCKETS):
+                counts[i] += shard[i]
+            total_ns += shard[_TOTAL]
+            max_ns = max(max_ns, shard[_MAX])
+        count = sum(counts)
+        bounds = [b / 1e9 for b in _BOUNDS_NS] + [float("inf")]
+        return {
+            "count": count,
+            "total": total_ns / 1e9,
+            "mean": total_ns / count / 1e9 if count else 0.0,
+            "max": max_ns / 1e9,
+            "p50": self._percentile(counts, count, max_ns, 50) if count else 0.0,
+            "p90": self._percentile(counts, count, max_ns, 90) if count else 0.0,
+            "p99": self._percentile(counts, count, max_ns, 99) if count else 0.0,
+            "buckets": list(zip(bounds, counts)),
+        }
+
+
+def _record(
+    timings: Dict[EventHandler, LatencyHistogram], handler: EventHandler, ns: int
+) -> None:
+    """
+    Record one invocation of a handler, creating its histogram on first use.
+
+    :param timings: The event's histograms.
+    :param handler: Handler whose invocation was timed.
+    :param ns: Duration in nanoseconds, excluding error reporting.
+    """
+    histogram = timings.get(handler)
+    if histogram is None:
+        histogram = timings.setdefault(handler, LatencyHistogram())
+    histogram.record(ns)
+
+
+class _TimedEmission:
+    """
+    Handler invocation hooks that time every call.
+
+    :meth:`Event.enable_timing` swaps an event's class to a subclass mixing
+    these in, and :meth:`Event.disable_timing` swaps it back, so events
+    without timing run the untimed hooks unchanged. Only the hooks that
+    invoke handlers are overridden; the emit methods themselves are shared.
+    Time spent reporting a handler's exception is not included. Async handlers are
+    timed from the start of their await to completion, including time spent
+    suspended; sync handlers run by ``emit_async`` are timed on the executor
+    thread.
+    """
+
+    __slots__ = ()
+
+    def _run_sync_batch(
+        self,
+        handlers: Tuple[EventHandler, ...],
+        args: tuple[Any, ...],
+        kwargs: dict[str, Any],
+        errors: Optional[List[Exception]] = None,
+    ) -> None:
+        """
+        Timed variant of :meth:`Event._run_sync_batch`.
+        """
+        timings = self._timings
+        clock = time.perf_counter_ns
+        for h in handlers:
+            start = clock()
+            try:
+                result = h(*args, **kwargs)
+                if inspect.iscoroutine(result):
+                    result.close()
+            except Exception as e:
+                _record(timings, h, clock() - start)
+                self._report_error(e, h, errors)
+            else:
+                _record(timings, h, clock() - start)
+
+    async def _wrap_async_handler(
+        self,
+        coro: Coroutine,
+        handler: EventHandler,
+        errors: Optional[List[Exception]] = None,
+    ) -> None:
+        """
+        Timed variant of :meth:`Event._wrap_async_handler`.
+        """
+        start = time.perf_counter_ns()
+        try:
+            await coro
+        except Exception as e:
+            _record(self._timings, handler, time.perf_counter_ns() - start)
+            self._report_error(e, handler, errors)
+        else:
+            _record(self._timings, handler, time.perf_counter_ns() - start)
+
+    def _wrap_sync_handler(
+        self,
+        handler: EventHandler,
+        args: tuple[Any, ...],
+        kwargs: dict[str, Any],
+        errors: Optional[List[Exception]] = None,
+    ) -> None:
+        """
+        Timed variant of :meth:`Event._wrap_sync_handler`.
+        """
+        start = time.perf_counter_ns()
+        try:
+            handler(*args, **kwargs)
+        except Exception as e:
+            _record(self._timings, handler, time.perf_counter_ns() - start)
+            self._report_error(e, handler, errors)
+        else:
+            _record(self._timings, handler, time.perf_counter_ns() - start)
+
+
+# Event class -> its timed subclass
+_timed_classes: Dict[type, type] = {}
+_timed_classes_lock = threading.Lock()
+
+
+def timed_class(cls: Type[Event]) -> Type[Event]:
+    """
+    Return the timed subclass of an Event class, creating it once.
+
+    The subclass keeps the name of ``cls`` and adds no slots, so instances can
+    switch between the two by assigning ``__class__``.
+
+    :param cls: Event class, or an already timed subclass.
+    :return: The timed subclass.
+    """
+    if issubclass(cls, _TimedEmission):
+        return cls
+    timed = _timed_classes.get(cls)
+    if timed is None:
+        with _timed_classes_lock:
+            timed = _timed_classes.get(cls)
+            if timed is None:
+                timed = type(
+                    cls.__name__,
+                    (_TimedEmission, cls),
+                    {
+                        "__slots__": (),
+                        "__module__": cls.__module__,
+                        "__qualname__": cls.__qualname__,
+                        "_untimed_class": cls,
+                    },
+                )
+                _timed_classes[cls] = timed
+    return timed
@@ -0,0 +1,185 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from pyesys import CircuitBreaker, EventHandler, create_event
+
+
+def failing(x):
+    raise ValueError(f"bad {x}")
+
+
+class FakeClock:
+    """Stand-in for time.monotonic that only moves when told to."""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(time, "monotonic", fake)
+    return fake
+
+
+def breaker_event(**options):
+    errors = []
+    event_obj, listener = create_event(
+        example=lambda x: None,
+        error_handler=lambda e, h: errors.append(e),
+        circuit_breaker=CircuitBreaker(**options),
+    )
+    return event_obj, listener, errors
+
+
+def test_breaker_suspends_handler_after_repeated_failures(clock):
+    event_obj, listener, errors = breaker_event(failures=3, window=10.0, cooloff=30.0)
+    calls = []
+    handler = EventHandler(failing)
+    listener += [handler, lambda x: calls.append(x)]
+
+    for i in range(10):
+        event_obj.emit(i)
+
+    assert len(errors) == 3  # skipped once the breaker opened
+    assert calls == list(range(10))  # other handlers are unaffected
+    info = handler.get_info()["breaker"]
+    assert info["state"] == "open"
+    assert info["trips"] == 1
+    assert info["retry_in"] == pytest.approx(30.0)
+    assert len(event_obj.handlers) == 2  # still subscribed
+
+
+def test_breaker_retries_half_open_and_reopens_on_failure(clock):
+    event_obj, listener, errors = breaker_event(failures=2, window=5.0, cooloff=30.0)
+    handler = EventHandler(failing)
+    listener += handler
+    event_obj.emit(1)
+    event_obj.emit(2)
+    assert handler.get_info()["breaker"]["state"] == "open"
+
+    clock.now += 30.0
+    assert handler.get_info()["breaker"]["state"] == "half_open"
+    event_obj.emit(3)  # one probe call, which fails and reopens at once
+    event_obj.emit(4)
+    assert len(errors) == 3
+    assert handler.get_info()["breaker"]["state"] == "open"
+    assert handler.get_info()["breaker"]["trips"] == 2
+
+
+def test_breaker_closes_after_quiet_half_open_window(clock):
+    event_obj, listener, errors = breaker_event(failures=1, window=5.0, cooloff=10.0)
+    state = {"fail": True}
+
+    def flaky(x):
+        if state["fail"]:
+            raise ConnectionError(x)
+
+    handler = EventHandler(flaky)
+    listener += handler
+    event_obj.emit(1)
+    assert handler.get_info()["breaker"]["state"] == "open"
+
+    state["fail"] = False
+    clock.now += 10.0
+    event_obj.emit(2)
+    clock.now += 5.0
+    assert handler.get_info()["breaker"]["state"] == "closed"
+    assert len(errors) == 1
+
+
+def test_failures_outside_the_window_do_not_open_the_breaker(clock):
+    event_obj, listener, errors = breaker_event(failures=2, window=5.0, cooloff=30.0)
+    handler = EventHandler(failing)
+    listener += handler
+    for i in range(4):
+        event_obj.emit(i)
+        clock.now += 6.0
+    assert len(errors) == 4
+    assert handler.get_info()["breaker"] == {
+        "state": "closed", "failures": 1, "trips": 0, "retry_in": None
+    }
+
+
+def test_breaker_applies_to_keyed_handlers_and_emit_async(clock):
+    event_obj, listener, errors = breaker_event(failures=1, window=5.0, cooloff=30.0)
+    event_obj.subscribe_one(failing, key="a")
+    event_obj.emit("a")
+    event_obj.emit("a")
+    assert len(errors) == 1
+
+    async_errors = []
+    async_event, async_listener = create_event(
+        example=lambda x: None,
+        error_handler=lambda e, h: async_errors.append(e),
+        circuit_breaker=CircuitBreaker(failures=1, cooloff=30.0),
+    )
+
+    async def failing_async(x):
+        raise ValueError(x)
+
+    async_listener += failing_async
+    for _ in range(3):
+        asyncio.run(async_event.emit_async(1, ordered=True))
+    assert len(async_errors) == 1
+
+
+def test_breaker_suspends_range_handlers_on_range_only_events(clock):
+    event_obj, listener, errors = breaker_event(failures=2, window=5.0, cooloff=30.0)
+    handler = EventHandler(failing)
+    event_obj.subscribe_range(handler, 0, 10)
+    for i in range(6):
+        event_obj.emit(i)
+    assert len(errors) == 2
+    assert handler.get_info()["breaker"]["state"] == "open"
+
+    clock.now += 30.0
+    event_obj.emit(1)  # half-open probe
+    assert len(errors) == 3
+
+
+def test_breaker_state_is_locked_per_handler():
+    policy = CircuitBreaker(failures=100000, window=1000.0)
+    first, second = EventHandler(failing), EventHandler(lambda x: None)
+
+    def record():
+        for _ in range(1000):
+            first._record_failure(policy, time.monotonic())
+            second._record_failure(policy, time.monotonic())
+
+    threads = [threading.Thread(target=record) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert first.get_info()["breaker"]["failures"] == 8000
+    assert second.get_info()["breaker"]["failures"] == 8000
+    assert first._breaker.lock is not second._breaker.lock
+
+
+def test_events_without_breaker_keep_calling_failing_handlers():
+    errors = []
+    event_obj, listener = create_event(
+        example=lambda x: None, error_handler=lambda e, h: errors.append(e)
+    )
+    handler = EventHandler(failing)
+    listener += handler
+    for i in range(20):
+        event_obj.emit(i)
+    assert len(errors) == 20
+    assert handler.get_info()["breaker"]["state"] == "closed"
+
+
+def test_invalid_breaker_policy_raises():
+    with pytest.raises(ValueError):
+        CircuitBreaker(failures=0)
+    with pytest.raises(ValueError):
+        CircuitBreaker(window=0)
+    with pytest.raises(ValueError):
+        CircuitBreaker(cooloff=-1)
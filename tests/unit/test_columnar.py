@@ -0,0 +1,144 @@
+import array
+
+import pytest
+
+from pyesys import columnar
+from pyesys.event import create_event
+from pyesys.handler import EventHandler, batch_handler, vectorized_handler
+
+
+def test_vectorized_handler_requires_columnar_event():
+    event_obj, listener = create_event(example=lambda t, v: None)
+
+    @vectorized_handler
+    def on_samples(t, v):
+        pass
+
+    with pytest.raises(TypeError):
+        listener += on_samples
+
+
+def test_vectorized_handler_signature_is_validated():
+    event_obj, listener = create_event(example=lambda t, v: None, columnar=True)
+
+    @vectorized_handler
+    def wrong(t):
+        pass
+
+    @vectorized_handler
+    async def not_sync(t, v):
+        pass
+
+    with pytest.raises(TypeError):
+        listener += wrong
+    with pytest.raises(TypeError):
+        listener += not_sync
+    with pytest.raises(TypeError):
+        listener += batch_handler(vectorized_handler(lambda batch: None))
+
+
+def test_emit_columns_requires_columnar_event():
+    event_obj, listener = create_event(example=lambda t, v: None)
+    with pytest.raises(RuntimeError):
+        event_obj.emit_columns([1], [2])
+
+
+def test_emit_columns_rejects_ragged_columns():
+    event_obj, listener = create_event(example=lambda t, v: None, columnar=True)
+    with pytest.raises(ValueError):
+        event_obj.emit_columns([1, 2], [3])
+
+
+def test_emit_columns_serves_scalar_handlers_per_row():
+    rows = []
+    batches = []
+    event_obj, listener = create_event(example=lambda t, v: None, columnar=True)
+
+    def scalar(t, v):
+        rows.append((t, v))
+
+    @batch_handler
+    def collect(batch):
+        batches.append(batch)
+
+    listener += [scalar, collect]
+    event_obj.emit_columns(array.array("d", [1.0, 2.0]), [10, 20])
+    assert rows == [(1.0, 10), (2.0, 20)]
+    assert batches == [[(1.0, 10), (2.0, 20)]]
+    assert all(type(t) is float for t, _ in rows)
+
+
+def test_vectorized_handler_receives_columns_without_numpy(monkeypatch):
+    monkeypatch.setattr(columnar, "_np", None)
+    seen = []
+    event_obj, listener = create_event(example=lambda t, v: None, columnar=True)
+
+    @vectorized_handler
+    def on_samples(t, v):
+        seen.append((t, v))
+
+    listener += on_samples
+    event_obj.emit_columns(array.array("d", [1.0, 2.0]), [10, 20])
+    t, v = seen[0]
+    assert isinstance(t, memoryview) and t.tolist() == [1.0, 2.0]
+    assert v == (10, 20)
+
+
+def test_vectorized_handler_receives_numpy_arrays():
+    np = pytest.importorskip("numpy")
+    seen = []
+    rows = []
+    event_obj, listener = create_event(example=lambda t, v: None, columnar=True)
+
+    @vectorized_handler
+    def on_samples(t, v):
+        seen.append((t, v))
+
+    def scalar(t, v):
+        rows.append((t, v))
+
+    listener += [on_samples, scalar]
+    ts = np.arange(3.0)
+    event_obj.emit_columns(ts, np.array([5, 6, 7]))
+    t, v = seen[0]
+    assert t is ts
+    assert v.tolist() == [5, 6, 7]
+    assert rows == [(0.0, 5), (1.0, 6), (2.0, 7)]
+    assert len(seen) == 1
+
+
+def test_plain_emit_and_emit_many_pass_columns_to_vectorized_handlers():
+    np = pytest.importorskip("numpy")
+    seen = []
+    event_obj, listener = create_event(example=lambda t, v: None, columnar=True)
+
+    @vectorized_handler
+    def on_samples(t, v):
+        seen.append((t.tolist(), v.tolist()))
+
+    listener += on_samples
+    event_obj.emit(1.0, 2)
+    event_obj.emit_many([(3.0, 4), (5.0, 6)])
+    assert seen == [([1.0], [2]), ([3.0, 5.0], [4, 6])]
+    assert isinstance(event_obj._plan.vector[0], EventHandler)
+
+
+@pytest.mark.asyncio
+async def test_emit_async_runs_vectorized_handlers_with_one_row_columns():
+    lengths = []
+    values = []
+    event_obj, listener = create_event(example=lambda v: None, columnar=True)
+
+    @vectorized_handler
+    def on_samples(v):
+        lengths.append(len(v))
+
+    async def scalar(v):
+        values.append(v)
+
+    listener += [on_samples, scalar]
+    await event_obj.emit_async(9)
+    await event_obj.emit_async(9, ordered=True)
+    await event_obj.emit_many_async([(1,), (2,)])
+    assert lengths == [1, 1, 2]
+    assert values == [9, 9, 1, 2]
@@ -0,0 +1,207 @@
+import asyncio
+import os
+import subprocess
+import sys
+import textwrap
+import threading
+import time
+
+import pytest
+
+from pyesys import event, get_metrics_registry
+from pyesys.dispatcher import AsyncDispatcher, get_dispatcher, shutdown_dispatcher
+
+
+def test_dispatcher_runs_coroutines_on_one_persistent_thread():
+    dispatcher = AsyncDispatcher()
+    threads = []
+
+    async def work(x):
+        threads.append(threading.current_thread())
+        return x * 2
+
+    try:
+        assert dispatcher.submit(work(1)).result(timeout=1) == 2
+        assert dispatcher.submit(work(2)).result(timeout=1) == 4
+    finally:
+        dispatcher.shutdown()
+
+    assert threads[0] is threads[1]
+    assert threads[0] is not threading.current_thread()
+
+
+def test_dispatcher_enforces_concurrency_limit_and_reports_queue_depth():
+    dispatcher = AsyncDispatcher(max_concurrency=2)
+    release = threading.Event()
+    running = 0
+    peak = 0
+
+    async def blocker():
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        while not release.is_set():
+            await asyncio.sleep(0.001)
+        running -= 1
+
+    try:
+        futures = [dispatcher.submit(blocker()) for _ in range(5)]
+        for _ in range(200):
+            stats = dispatcher.stats()
+            if stats["running"] == 2:
+                break
+            threading.Event().wait(0.005)
+        assert stats["running"] == 2
+        assert stats["queue_depth"] == 3
+
+        release.set()
+        for f in futures:
+            f.result(timeout=1)
+    finally:
+        dispatcher.shutdown()
+
+    assert peak == 2
+    stats = dispatcher.stats()
+    assert stats["completed"] == stats["submitted"] == 5
+    assert stats["queue_depth"] == 0
+
+
+def test_dispatcher_shutdown_waits_for_pending_work_and_rejects_new_work():
+    dispatcher = AsyncDispatcher()
+    done = []
+
+    async def slow():
+        await asyncio.sleep(0.01)
+        done.append(True)
+
+    dispatcher.submit(slow())
+    dispatcher.shutdown(wait=True)
+    assert done == [True]
+
+    coro = slow()
+    with pytest.raises(RuntimeError):
+        dispatcher.submit(coro)
+    dispatcher.shutdown()  # idempotent
+
+
+def test_submission_racing_shutdown_is_awaited(monkeypatch):
+    dispatcher = AsyncDispatcher()
+    dispatcher.submit(asyncio.sleep(0)).result(1)  # Starts the loop
+    schedule = asyncio.run_coroutine_threadsafe
+    scheduling = threading.Event()
+    futures = []
+
+    def slow_schedule(coro, loop):
+        if threading.current_thread() is submitter:
+            # Give shutdown() time to run between the closed check and scheduling
+            scheduling.set()
+            time.sleep(0.2)
+        return schedule(coro, loop)
+
+    monkeypatch.setattr(asyncio, "run_coroutine_threadsafe", slow_schedule)
+    submitter = threading.Thread(
+        target=lambda: futures.append(dispatcher.submit(asyncio.sleep(0, "done")))
+    )
+    submitter.start()
+    scheduling.wait()
+    dispatcher.shutdown(wait=True)
+    submitter.join()
+    assert futures[0].result(1) == "done"
+
+
+def test_invalid_concurrency_limit_raises():
+    with pytest.raises(ValueError):
+        AsyncDispatcher(max_concurrency=0)
+
+
+def test_shutdown_dispatcher_replaces_default_on_next_use():
+    first = get_dispatcher()
+    shutdown_dispatcher()
+    second = get_dispatcher()
+    assert first is not second
+    assert second.submit(asyncio.sleep(0, result="ok")).result(timeout=1) == "ok"
+
+
+def test_pending_async_handlers_run_before_interpreter_exit(tmp_path):
+    script = tmp_path / "emit_and_exit.py"
+    script.write_text(
+        textwrap.dedent(
+            """
+            import asyncio
+            from pyesys import event
+
+            @event
+            def on_saved(path):
+                pass
+
+            @on_saved.emitter
+            def save(path):
+                pass
+
+            async def report(path):
+                await asyncio.sleep(0.05)
+                print("reported", path, flush=True)
+
+            on_saved += report
+            save("a.txt")
+            """
+        )
+    )
+    src = os.path.join(os.path.dirname(__file__), os.pardir, os.pardir, "src")
+    env = dict(os.environ, PYTHONPATH=os.path.abspath(src))
+    result = subprocess.run(
+        [sys.executable, str(script)], env=env, capture_output=True, text=True, timeout=30
+    )
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.strip() == "reported a.txt"
+
+
+def test_shutdown_from_the_loop_thread_raises_instead_of_deadlocking():
+    dispatcher = AsyncDispatcher()
+
+    async def shut_down_self():
+        dispatcher.shutdown()
+
+    try:
+        with pytest.raises(RuntimeError):
+            dispatcher.submit(shut_down_self()).result(timeout=1)
+
+        async def shut_down_default():
+            shutdown_dispatcher()
+
+        default = get_dispatcher()
+        with pytest.raises(RuntimeError):
+            default.submit(shut_down_default()).result(timeout=1)
+        assert get_dispatcher() is default
+    finally:
+        dispatcher.shutdown()
+        shutdown_dispatcher()
+
+
+def test_async_pending_metric_is_released_when_submit_fails():
+    registry = get_metrics_registry()
+
+    class Sensor:
+        @event(metrics=True)
+        def on_reading(self, value):
+            pass
+
+        @on_reading.emitter
+        def read(self, value):
+            pass
+
+    async def handler(value):
+        pass
+
+    sensor = Sensor()
+    sensor.on_reading += handler
+    dispatcher = get_dispatcher()
+    dispatcher.shutdown()
+    try:
+        with pytest.raises(RuntimeError):
+            sensor.read(1)
+        owner = f"{Sensor.__module__}.{Sensor.__qualname__}"
+        assert registry.event_metrics("on_reading", owner).collect()["async_pending"] == 0
+    finally:
+        shutdown_dispatcher()
+        registry.clear()
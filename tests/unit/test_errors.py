@@ -0,0 +1,129 @@
+import io
+import threading
+
+import pytest
+
+from pyesys import (
+    QueuedErrorHandler,
+    create_event,
+    get_default_error_handler,
+    set_default_error_handler,
+)
+from pyesys.handler import default_error_handler
+
+
+def failing(x):
+    raise ValueError(f"bad {x}")
+
+
+def other_failing(x):
+    raise KeyError(x)
+
+
+class BlockingStream(io.StringIO):
+    """StringIO whose first write blocks until released."""
+
+    def __init__(self):
+        super().__init__()
+        self.entered = threading.Event()
+        self.release = threading.Event()
+
+    def write(self, s):
+        self.entered.set()
+        self.release.wait()
+        return super().write(s)
+
+
+def test_repeats_within_window_are_counted_not_written():
+    stream = io.StringIO()
+    reporter = QueuedErrorHandler(window=60.0, stream=stream)
+    event_obj, listener = create_event(example=lambda x: None, error_handler=reporter)
+    listener += failing
+
+    for i in range(5):
+        event_obj.emit(i)
+    assert reporter.flush(timeout=5)
+    lines = stream.getvalue().splitlines()
+    assert len(lines) == 1
+    assert "ValueError('bad 0')" in lines[0]
+
+    assert reporter.close(timeout=5)
+    lines = stream.getvalue().splitlines()
+    assert len(lines) == 2
+    assert "raised ValueError 4 more times within 60s" in lines[1]
+    assert reporter.stats()["suppressed"] == 4
+
+
+def test_distinct_handlers_and_exception_types_are_reported_separately():
+    stream = io.StringIO()
+    reporter = QueuedErrorHandler(window=60.0, stream=stream)
+    event_obj, listener = create_event(example=lambda x: None, error_handler=reporter)
+    listener += [failing, other_failing]
+
+    event_obj.emit(1)
+    event_obj.emit(2)
+    assert reporter.close(timeout=5)
+    output = stream.getvalue()
+    assert "ValueError('bad 1')" in output
+    assert "KeyError(1)" in output
+    assert reporter.stats()["written"] == 2
+
+
+def test_zero_window_writes_every_exception():
+    stream = io.StringIO()
+    reporter = QueuedErrorHandler(window=0, stream=stream)
+    for i in range(3):
+        reporter(ValueError(i), failing)
+    assert reporter.close(timeout=5)
+    assert len(stream.getvalue().splitlines()) == 3
+
+
+def test_full_queue_drops_without_blocking_the_caller():
+    stream = BlockingStream()
+    reporter = QueuedErrorHandler(window=0, max_pending=2, stream=stream)
+    reporter(ValueError(0), failing)
+    assert stream.entered.wait(5)  # reporter thread is stuck writing
+
+    for i in range(1, 6):
+        reporter(ValueError(i), failing)  # returns although nothing is written
+    assert reporter.stats()["dropped"] == 3
+
+    stream.release.set()
+    assert reporter.close(timeout=5)
+    lines = stream.getvalue().splitlines()
+    assert len(lines) == 4
+    assert any("3 handler exceptions dropped" in line for line in lines)
+
+
+def test_reporter_restarts_after_close():
+    stream = io.StringIO()
+    reporter = QueuedErrorHandler(stream=stream)
+    reporter(ValueError(1), failing)
+    assert reporter.close(timeout=5)
+    reporter(ValueError(2), failing)
+    assert reporter.close(timeout=5)
+    assert len(stream.getvalue().splitlines()) == 2
+
+
+def test_invalid_arguments_raise():
+    with pytest.raises(ValueError):
+        QueuedErrorHandler(window=-1)
+    with pytest.raises(ValueError):
+        QueuedErrorHandler(max_pending=0)
+
+
+def test_default_error_handler_is_selectable_for_existing_events():
+    errors = []
+    event_obj, listener = create_event(example=lambda x: None)
+    listener += failing
+
+    set_default_error_handler(lambda e, h: errors.append(e))
+    try:
+        event_obj.emit(1)
+    finally:
+        set_default_error_handler(None)
+
+    assert len(errors) == 1
+    assert get_default_error_handler() is default_error_handler
+    with pytest.raises(TypeError):
+        set_default_error_handler(42)
@@ -2,8 +2,10 @@ import gc
 import pytest
 import asyncio
 import inspect
+import threading
 
 from pyesys.event import Event, create_event
+from pyesys.handler import batch_handler
 
 
 # -------------- Factory / Signature‐Checking --------------
@@ -335,3 +337,864 @@ def test_emit_returns_none_even_if_handler_returns_value():
     listener += returns_something
     ret = event_obj.emit(5)
     assert ret is None
+
+
+# -------------- Weakref eviction --------------
+
+def test_dead_bound_method_is_evicted_without_gc(monkeypatch):
+    class Foo:
+        def cb(self, x): pass
+
+    event_obj, listener = create_event(example=lambda x: None)
+    foo = Foo()
+    listener += foo.cb
+    listener += foo.cb
+    assert event_obj.handler_count() == 2
+
+    # Emission and introspection must never trigger a collection
+    def fail_collect(*args):
+        raise AssertionError("gc.collect() called")
+
+    monkeypatch.setattr(gc, "collect", fail_collect)
+    event_obj.emit(1)
+
+    # Dropping the last reference evicts both entries immediately
+    del foo
+    assert event_obj.handler_count() == 0
+    assert event_obj.handlers == []
+
+
+def test_eviction_is_deferred_while_lock_is_held_by_another_thread():
+    import threading
+
+    class Foo:
+        def cb(self, x): pass
+
+    event_obj, listener = create_event(example=lambda x: None)
+    foo = Foo()
+    listener += foo.cb
+
+    locked = threading.Event()
+    release = threading.Event()
+
+    def hold_lock():
+        with event_obj._lock:
+            locked.set()
+            release.wait()
+
+    t = threading.Thread(target=hold_lock)
+    t.start()
+    locked.wait()
+    del foo  # callback cannot take the lock, so it queues the eviction
+    release.set()
+    t.join()
+
+    assert event_obj.handler_count() == 0
+
+
+def test_idle_event_allocates_nothing_until_first_use():
+    import weakref
+
+    event_obj = Event()
+    assert not hasattr(event_obj, "__dict__")
+    assert weakref.ref(event_obj)() is event_obj
+
+    event_obj.emit(1)
+    assert event_obj.handler_count() == 0
+    assert event_obj._registry is None
+    assert event_obj._rlock is None and event_obj._listener is None
+
+    listener = event_obj.listener
+    assert event_obj.listener is listener
+
+    def handler(x): pass
+
+    listener += handler
+    assert event_obj._registry is not None
+    # Function handlers never die, so no watcher reference is needed
+    assert event_obj._evict_weak is None
+
+    event_obj.clear()
+    assert event_obj._registry is None and event_obj.handler_count() == 0
+
+
+def test_non_threadsafe_event_works_without_locking():
+    class Foo:
+        def cb(self, x): calls.append(x)
+
+    calls = []
+    event_obj, listener = create_event(example=lambda x: None, threadsafe=False)
+    assert not isinstance(event_obj._lock, type(threading.RLock()))
+
+    foo = Foo()
+    listener += foo.cb
+    event_obj.emit(1)
+    assert calls == [1]
+
+    del foo
+    gc.collect()
+    assert event_obj.handler_count() == 0
+
+
+def test_thread_check_raises_on_cross_thread_use():
+    event_obj, listener = create_event(
+        example=lambda x: None, threadsafe=False, thread_check=True
+    )
+
+    def handler(x): pass
+
+    listener += handler  # owning thread is fine
+    errors = []
+
+    def worker():
+        try:
+            listener.unsubscribe(handler)
+        except RuntimeError as e:
+            errors.append(e)
+
+    t = threading.Thread(target=worker)
+    t.start()
+    t.join()
+    assert len(errors) == 1
+    assert event_obj.handler_count() == 1
+
+
+def test_thread_check_defers_evictions_from_other_threads():
+    class Foo:
+        def cb(self, x): pass
+
+    event_obj, listener = create_event(
+        example=lambda x: None, threadsafe=False, thread_check=True
+    )
+    foo = Foo()
+    listener += foo.cb
+
+    holder = [foo]
+    del foo
+    # The instance dies on another thread: its eviction is queued, not raised
+    t = threading.Thread(target=holder.clear)
+    t.start()
+    t.join()
+    assert event_obj._pending_evictions
+    assert event_obj.handler_count() == 0
+
+
+def test_unsubscribe_releases_instance_watcher():
+    class Foo:
+        def cb(self, x): pass
+
+    event_obj, listener = create_event(example=lambda x: None)
+    foo = Foo()
+    listener += foo.cb
+    handler = event_obj._registry.snapshot()[0]
+    assert handler._watchers
+
+    listener -= foo.cb
+    assert handler._watchers is None
+
+
+# -------------- Copy-on-write emission --------------
+
+def test_emit_does_not_take_the_subscription_lock():
+    import threading
+
+    calls = []
+    event_obj, listener = create_event(example=lambda x: None)
+
+    def fn(x):
+        calls.append(x)
+
+    listener += fn
+    event_obj.emit(0)  # first emission after a change publishes the tuple
+
+    locked = threading.Event()
+    release = threading.Event()
+
+    def hold_lock():
+        with event_obj._lock:
+            locked.set()
+            release.wait()
+
+    t = threading.Thread(target=hold_lock)
+    t.start()
+    locked.wait()
+    try:
+        # Would deadlock if emit needed the lock held by the other thread
+        event_obj.emit(1)
+        assert event_obj.handler_count() == 1
+    finally:
+        release.set()
+        t.join()
+    assert calls == [0, 1]
+
+
+def test_subscribing_during_emit_takes_effect_on_next_emit():
+    calls = []
+    event_obj, listener = create_event(example=lambda x: None)
+
+    def late(x):
+        calls.append(("late", x))
+
+    def first(x):
+        calls.append(("first", x))
+        listener.subscribe(late)
+
+    listener += first
+    event_obj.emit(1)
+    assert calls == [("first", 1)]
+
+    calls.clear()
+    event_obj.emit(2)
+    assert calls == [("first", 2), ("late", 2)]
+
+
+# -------------- Signature validation cache --------------
+
+def test_signature_cache_hits_for_same_method_on_many_instances():
+    from pyesys.event import signature_cache_info, clear_signature_cache
+
+    class Model:
+        def on_change(self, value): pass
+
+    clear_signature_cache()
+    event_obj, listener = create_event(example=lambda value: None)
+    for _ in range(5):
+        listener += Model().on_change
+
+    info = signature_cache_info()
+    assert info["misses"] == 1
+    assert info["hits"] == 4
+
+
+def test_signature_cache_remembers_incompatible_verdict():
+    from pyesys.event import signature_cache_info, clear_signature_cache
+
+    def wrong(a, b): pass
+
+    clear_signature_cache()
+    event_obj, listener = create_event(example=lambda value: None)
+    for _ in range(2):
+        with pytest.raises(TypeError, match="not compatible"):
+            listener += wrong
+    assert signature_cache_info()["hits"] == 1
+
+
+def test_signature_cache_skips_wrapped_functions():
+    import functools
+    from pyesys.event import signature_cache_info, clear_signature_cache
+
+    def inner(value): pass
+
+    @functools.wraps(inner)
+    def wrapper(*args, **kwargs): pass
+
+    clear_signature_cache()
+    event_obj, listener = create_event(example=lambda value: None)
+    listener += wrapper
+    assert signature_cache_info() == {"hits": 0, "misses": 0, "size": 0, "maxsize": 1024}
+
+
+def test_signature_cache_counts_lookups_from_all_threads():
+    from pyesys.event import signature_cache_info, clear_signature_cache
+
+    class Model:
+        def on_change(self, value): pass
+
+    clear_signature_cache()
+    event_obj, listener = create_event(example=lambda value: None)
+    models = [Model() for _ in range(40)]
+
+    def subscribe(chunk):
+        for m in chunk:
+            listener.subscribe(m.on_change)
+
+    threads = [threading.Thread(target=subscribe, args=(models[i::4],)) for i in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    info = signature_cache_info()
+    assert info["hits"] + info["misses"] == 40
+    assert info["size"] == 1
+
+
+# -------------- Precomputed dispatch plan --------------
+
+@pytest.mark.asyncio
+async def test_emit_async_does_not_rebuild_callbacks_on_success(monkeypatch):
+    from pyesys.handler import EventHandler
+
+    results = []
+
+    class Sink:
+        async def on_async(self, x):
+            results.append(("async", x))
+
+        def on_sync(self, x):
+            results.append(("sync", x))
+
+    sink = Sink()
+    event_obj, listener = create_event(example=lambda x: None)
+    listener += [sink.on_async, sink.on_sync]
+
+    def fail(self):
+        raise AssertionError("get_callback() called on the hot path")
+
+    monkeypatch.setattr(EventHandler, "get_callback", fail)
+    await event_obj.emit_async(1)
+    event_obj.emit(2)
+    assert sorted(results) == [("async", 1), ("sync", 1), ("sync", 2)]
+
+
+def test_dispatch_plan_is_rebuilt_only_after_subscription_changes():
+    event_obj, listener = create_event(example=lambda x: None)
+
+    async def ah(x): pass
+    def sh(x): pass
+
+    listener += [ah, sh]
+    event_obj.emit(0)
+    plan = event_obj._plan
+    assert [h._func for h in plan.async_] == [ah]
+    assert [h._func for h in plan.sync] == [sh]
+
+    event_obj.emit(1)
+    assert event_obj._plan is plan
+
+    listener -= sh
+    event_obj.emit(2)
+    assert event_obj._plan is not plan
+    assert event_obj._plan.sync == ()
+
+
+@pytest.mark.asyncio
+async def test_emit_async_only_skips_sync_handlers():
+    results = []
+    event_obj, listener = create_event(example=lambda x: None)
+
+    async def ah(x):
+        results.append(("async", x))
+
+    def sh(x):
+        results.append(("sync", x))
+
+    listener += [sh, ah]
+    assert event_obj.has_async_handlers()
+    await event_obj.emit_async_only(3)
+    assert results == [("async", 3)]
+
+    listener -= ah
+    assert not event_obj.has_async_handlers()
+
+
+# -------------- Sync handler policies in emit_async --------------
+
+@pytest.mark.asyncio
+async def test_emit_async_uses_event_executor():
+    import threading
+    from concurrent.futures import ThreadPoolExecutor
+
+    seen = []
+    with ThreadPoolExecutor(max_workers=1, thread_name_prefix="custom") as pool:
+        event_obj, listener = create_event(example=lambda x: None, executor=pool)
+
+        def sh(x):
+            seen.append(threading.current_thread().name)
+
+        listener += sh
+        await event_obj.emit_async(1)
+
+    assert seen and seen[0].startswith("custom")
+
+
+@pytest.mark.asyncio
+async def test_emit_async_uses_process_wide_default_executor():
+    import threading
+    from concurrent.futures import ThreadPoolExecutor
+    from pyesys.event import set_default_executor, get_default_executor
+
+    seen = []
+    pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="process-default")
+    set_default_executor(pool)
+    try:
+        assert get_default_executor() is pool
+        event_obj, listener = create_event(example=lambda x: None)
+
+        def sh(x):
+            seen.append(threading.current_thread().name)
+
+        listener += sh
+        await event_obj.emit_async(1)
+    finally:
+        set_default_executor(None)
+        pool.shutdown()
+
+    assert seen[0].startswith("process-default")
+
+
+@pytest.mark.asyncio
+async def test_inline_policy_runs_sync_handlers_on_loop_thread():
+    import threading
+
+    seen = []
+    event_obj, listener = create_event(example=lambda x: None, sync_policy="inline")
+
+    def sh(x):
+        seen.append(threading.current_thread())
+
+    def bad(x):
+        raise ValueError("inline boom")
+
+    listener += [bad, sh]
+    await event_obj.emit_async(1)
+    assert seen == [threading.current_thread()]
+
+
+@pytest.mark.asyncio
+async def test_batched_policy_runs_all_sync_handlers_in_one_job():
+    import threading
+
+    seen = []
+    errors = []
+    event_obj, listener = create_event(
+        example=lambda x: None,
+        sync_policy="batched",
+        error_handler=lambda e, h: errors.append(e),
+    )
+
+    def first(x):
+        seen.append(("first", threading.current_thread()))
+
+    def bad(x):
+        raise ValueError("batched boom")
+
+    def last(x):
+        seen.append(("last", threading.current_thread()))
+
+    listener += [first, bad, last]
+    await event_obj.emit_async(1)
+
+    assert [name for name, _ in seen] == ["first", "last"]
+    assert seen[0][1] is seen[1][1] is not threading.current_thread()
+    assert len(errors) == 1
+
+
+def test_unknown_sync_policy_raises():
+    with pytest.raises(ValueError):
+        create_event(example=lambda x: None, sync_policy="parallel")
+
+
+# -------------- Bounded and ordered emit_async --------------
+
+@pytest.mark.asyncio
+async def test_emit_async_max_concurrency_limits_running_handlers():
+    running = 0
+    peak = 0
+    done = []
+    event_obj, listener = create_event(example=lambda x: None)
+
+    def make_handler(i):
+        async def handler(x):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0)
+            running -= 1
+            done.append(i)
+        return handler
+
+    listener += [make_handler(i) for i in range(20)]
+    await event_obj.emit_async(1, max_concurrency=3)
+    assert peak == 3
+    assert sorted(done) == list(range(20))
+
+
+@pytest.mark.asyncio
+async def test_emit_async_ordered_runs_sequentially_without_tasks():
+    order = []
+    tasks_seen = set()
+    event_obj, listener = create_event(example=lambda x: None, sync_policy="inline")
+
+    async def a1(x):
+        tasks_seen.add(asyncio.current_task())
+        await asyncio.sleep(0.001)
+        order.append("a1")
+
+    def s1(x):
+        order.append("s1")
+
+    async def a2(x):
+        tasks_seen.add(asyncio.current_task())
+        order.append("a2")
+
+    listener += [a1, s1, a2]
+    await event_obj.emit_async(1, ordered=True)
+    assert order == ["a1", "s1", "a2"]
+    # Handlers ran inside the emitting task itself
+    assert tasks_seen == {asyncio.current_task()}
+
+
+@pytest.mark.asyncio
+async def test_bounded_and_ordered_modes_route_errors_to_error_handler():
+    errors = []
+    event_obj, listener = create_event(
+        example=lambda x: None, error_handler=lambda e, h: errors.append(str(e))
+    )
+
+    async def bad(x):
+        raise RuntimeError(f"bad {x}")
+
+    def sync_bad(x):
+        raise RuntimeError(f"sync bad {x}")
+
+    listener += [bad, sync_bad]
+    await event_obj.emit_async(1, ordered=True)
+    await event_obj.emit_async(2, max_concurrency=2)
+    assert sorted(errors) == ["bad 1", "bad 2", "sync bad 1", "sync bad 2"]
+
+
+@pytest.mark.asyncio
+async def test_emit_async_rejects_invalid_max_concurrency():
+    event_obj, listener = create_event(example=lambda x: None)
+
+    async def ah(x): pass
+
+    with pytest.raises(ValueError):
+        await event_obj.emit_async(1, max_concurrency=0)  # No handlers yet
+    with pytest.raises(ValueError):
+        await event_obj.emit_async_only(1, max_concurrency=0)
+
+    listener += ah
+    for emit in (event_obj.emit_async, event_obj.emit_async_only):
+        with pytest.raises(ValueError):
+            await emit(1, max_concurrency=0)
+        with pytest.raises(ValueError):
+            await emit(1, max_concurrency=-1, ordered=True)
+
+
+@pytest.mark.parametrize("name", ["ordered", "max_concurrency", "collect_errors"])
+def test_event_signatures_cannot_use_reserved_emit_options(name):
+    with pytest.raises(TypeError, match=name):
+        create_event(example=eval(f"lambda title, {name}: None"))
+    with pytest.raises(TypeError, match=name):
+        create_event(example=eval(f"lambda title, *, {name}: None"))
+    # Positional-only parameters cannot collide with the keyword
+    create_event(example=eval(f"lambda title, {name}, /: None"))
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("mode", [{}, {"ordered": True}, {"max_concurrency": 2}])
+async def test_async_handler_call_errors_go_to_error_handler(mode):
+    errors = []
+    event_obj = Event(error_handler=lambda e, h: errors.append(type(e)))
+    ran = []
+
+    async def takes_one(x):
+        ran.append(x)
+
+    async def takes_two(x, y):
+        ran.append((x, y))
+
+    event_obj += [takes_one, takes_two]
+    await event_obj.emit_async(1, **mode)
+    assert ran == [1]
+    assert errors == [TypeError]
+
+
+# -------------- Eager async dispatch --------------
+
+requires_eager = pytest.mark.skipif(
+    not hasattr(asyncio, "eager_task_factory"), reason="eager tasks need Python 3.12+"
+)
+
+
+@requires_eager
+@pytest.mark.asyncio
+async def test_eager_emit_async_completes_without_suspending_for_sync_finishers():
+    results = []
+    event_obj, listener = create_event(example=lambda x: None, eager=True)
+
+    async def cached(x):
+        results.append(x)
+
+    listener += cached
+    coro = event_obj.emit_async(1)
+    # Nothing suspended, so the emit finishes in its first step
+    with pytest.raises(StopIteration):
+        coro.send(None)
+    assert results == [1]
+
+
+@requires_eager
+@pytest.mark.asyncio
+async def test_eager_emit_async_still_awaits_handlers_that_suspend():
+    results = []
+    errors = []
+    event_obj, listener = create_event(
+        example=lambda x: None, eager=True, error_handler=lambda e, h: errors.append(e)
+    )
+
+    async def slow(x):
+        await asyncio.sleep(0.001)
+        results.append(x)
+
+    async def bad(x):
+        raise ValueError("eager boom")
+
+    listener += [slow, bad]
+    await event_obj.emit_async(2)
+    assert results == [2]
+    assert len(errors) == 1
+
+
+# -------------- Batched emission --------------
+
+
+def test_emit_many_invokes_handlers_per_item_in_order():
+    calls = []
+    event_obj, listener = create_event(example=lambda x, y: None)
+
+    def first(x, y):
+        calls.append(("first", x, y))
+
+    def second(x, y):
+        calls.append(("second", x, y))
+
+    listener += [first, second]
+    event_obj.emit_many([(1, "a"), (2, "b")])
+    assert calls == [
+        ("first", 1, "a"),
+        ("second", 1, "a"),
+        ("first", 2, "b"),
+        ("second", 2, "b"),
+    ]
+
+
+def test_emit_many_accepts_generators_and_empty_batches():
+    calls = []
+    event_obj, listener = create_event(example=lambda x: None)
+
+    def handler(x):
+        calls.append(x)
+
+    listener += handler
+    event_obj.emit_many([])
+    event_obj.emit_many((i,) for i in range(3))
+    assert calls == [0, 1, 2]
+
+
+def test_emit_many_isolates_errors_per_item():
+    calls = []
+    errors = []
+    event_obj, listener = create_event(
+        example=lambda x: None, error_handler=lambda e, h: errors.append(e)
+    )
+
+    def flaky(x):
+        if x == 1:
+            raise ValueError("bad item")
+        calls.append(x)
+
+    listener += flaky
+    event_obj.emit_many([(0,), (1,), (2,)])
+    assert calls == [0, 2]
+    assert len(errors) == 1
+
+
+def test_batch_handler_receives_whole_batch_once():
+    batches = []
+    singles = []
+    event_obj, listener = create_event(example=lambda x, y: None)
+
+    @batch_handler
+    def collect(batch):
+        batches.append(list(batch))
+
+    def single(x, y):
+        singles.append(x)
+
+    listener += [collect, single]
+    event_obj.emit_many([(1, 2), (3, 4)])
+    assert batches == [[(1, 2), (3, 4)]]
+    assert singles == [1, 3]
+
+    # Regular emits deliver a one-item batch
+    event_obj.emit(5, 6)
+    assert batches[-1] == [(5, 6)]
+
+
+def test_batch_handler_signature_is_validated_against_batch_shape():
+    event_obj, listener = create_event(example=lambda x, y: None)
+
+    @batch_handler
+    def wrong(x, y):
+        pass
+
+    with pytest.raises(TypeError):
+        listener += wrong
+
+
+@pytest.mark.asyncio
+async def test_emit_many_async_streams_items_and_batches():
+    singles = []
+    batches = []
+    event_obj, listener = create_event(example=lambda x: None)
+
+    async def single(x):
+        singles.append(x)
+
+    @batch_handler
+    async def collect(batch):
+        batches.append(list(batch))
+
+    listener += [single, collect]
+    assert event_obj.has_async_handlers()
+    await event_obj.emit_many_async([(1,), (2,), (3,)])
+    assert singles == [1, 2, 3]
+    assert batches == [[(1,), (2,), (3,)]]
+
+    await event_obj.emit_async(4)
+    assert singles[-1] == 4
+    assert batches[-1] == [(4,)]
+
+
+@pytest.mark.asyncio
+async def test_ordered_emit_async_wraps_payload_for_batch_handlers():
+    batches = []
+    event_obj, listener = create_event(example=lambda x: None)
+
+    @batch_handler
+    def collect(batch):
+        batches.append(list(batch))
+
+    listener += collect
+    await event_obj.emit_async(7, ordered=True)
+    await event_obj.emit_async(8, max_concurrency=1)
+    assert batches == [[(7,)], [(8,)]]
+
+
+# -------------- Collected Errors --------------
+
+def test_emit_collect_errors_raises_group_after_all_handlers_ran():
+    reported = []
+    calls = []
+    event_obj, listener = create_event(
+        example=lambda x: None, error_handler=lambda e, h: reported.append(e)
+    )
+
+    def bad(x):
+        raise ValueError(f"bad {x}")
+
+    @batch_handler
+    def bad_batch(batch):
+        raise KeyError(len(batch))
+
+    listener += [bad, lambda x: calls.append(x), bad_batch]
+    with pytest.raises(ExceptionGroup) as info:
+        event_obj.emit(1, collect_errors=True)
+
+    assert calls == [1]  # isolation: the healthy handler still ran
+    assert [type(e) for e in info.value.exceptions] == [ValueError, KeyError]
+    assert reported == []  # collected errors bypass the error handler
+
+    event_obj.emit(2)  # default mode still reports per exception
+    assert len(reported) == 2
+
+
+def test_emit_collect_errors_without_failures_returns_normally():
+    seen = []
+    event_obj = Event()  # no example signature to refuse the name
+    event_obj += lambda x, collect_errors=None: seen.append((x, collect_errors))
+    event_obj.emit(1, collect_errors=True)
+    assert seen == [(1, None)]  # reserved keyword, not passed on
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "options",
+    [{}, {"ordered": True}, {"max_concurrency": 2}],
+    ids=["concurrent", "ordered", "limited"],
+)
+async def test_emit_async_collect_errors_gathers_sync_and_async_failures(options):
+    reported = []
+    event_obj, listener = create_event(
+        example=lambda x: None, error_handler=lambda e, h: reported.append(e)
+    )
+    calls = []
+
+    async def bad(x):
+        raise RuntimeError(f"bad {x}")
+
+    def sync_bad(x):
+        raise ValueError(f"sync bad {x}")
+
+    async def good(x):
+        calls.append(x)
+
+    listener += [bad, sync_bad, good]
+    with pytest.raises(ExceptionGroup) as info:
+        await event_obj.emit_async(1, collect_errors=True, **options)
+
+    assert calls == [1]
+    assert sorted(str(e) for e in info.value.exceptions) == ["bad 1", "sync bad 1"]
+    assert reported == []
+
+
+def test_thread_check_covers_every_public_entry_point():
+    event_obj, listener = create_event(
+        example=lambda x: None, threadsafe=False, thread_check=True
+    )
+    listener += lambda x: None
+    event_obj.emit(1)  # the plan is now published and read without locking
+    assert isinstance(event_obj, Event)
+
+    calls = {
+        "emit": lambda: event_obj.emit(1),
+        "emit_many": lambda: event_obj.emit_many([(1,)]),
+        "emit_async": lambda: event_obj.emit_async(1),
+        "handler_count": event_obj.handler_count,
+        "handlers": lambda: event_obj.handlers,
+        "len": lambda: len(event_obj),
+    }
+    failures = {}
+
+    def worker():
+        for name, call in calls.items():
+            try:
+                call()
+            except RuntimeError:
+                failures[name] = True
+
+    t = threading.Thread(target=worker)
+    t.start()
+    t.join()
+    assert failures == dict.fromkeys(calls, True)
+
+    event_obj.enable_timing()  # timing keeps the check
+    t = threading.Thread(target=worker)
+    failures.clear()
+    t.start()
+    t.join()
+    assert failures == dict.fromkeys(calls, True)
+    event_obj.disable_timing()
+    assert event_obj.timing_enabled is False
+
+
+def test_non_threadsafe_event_defers_evictions_from_other_threads():
+    class Foo:
+        def cb(self, x): pass
+
+    event_obj, listener = create_event(example=lambda x: None, threadsafe=False)
+    foo = Foo()
+    listener += foo.cb
+
+    holder = [foo]
+    del foo
+    t = threading.Thread(target=holder.clear)
+    t.start()
+    t.join()
+    # Not removed from the foreign thread without a lock, but queued
+    assert event_obj._pending_evictions
+    assert event_obj.handler_count() == 0
+    assert not event_obj._pending_evictions
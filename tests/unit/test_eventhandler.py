@@ -1,7 +1,7 @@
 import gc
 import inspect
 import pytest
-from pyesys.handler import EventHandler, default_error_handler
+from pyesys.handler import EventHandler, batch_handler, default_error_handler
 
 
 def test_eventhandler_calls_free_function_correctly():
@@ -144,3 +144,115 @@ def test_eventhandler_get_info_structure():
     assert info["is_bound_method"] is False
     assert info["is_alive"] is True
     assert info["is_async"] is False
+
+
+def test_eventhandler_notifies_watchers_when_instance_dies():
+    import weakref
+
+    class Dummy:
+        def cb(self, v): pass
+
+    class Owner:
+        def __init__(self):
+            self.evicted = []
+
+        def evict(self, handler):
+            self.evicted.append(handler)
+
+    owner = Owner()
+    watcher = weakref.WeakMethod(owner.evict)
+    d = Dummy()
+    handler = EventHandler(d.cb)
+    assert handler._add_watcher(watcher) is True
+
+    del d
+    assert owner.evicted == [handler]
+    assert handler.is_alive() is False
+
+
+def test_eventhandler_add_watcher_ignores_free_functions():
+    import weakref
+
+    class Owner:
+        def evict(self, handler): pass
+
+    owner = Owner()
+    handler = EventHandler(lambda: None)
+    assert handler._add_watcher(weakref.WeakMethod(owner.evict)) is True
+    assert handler._watchers is None
+
+
+def test_eventhandler_watchers_from_many_threads_are_all_notified():
+    import threading
+    import weakref
+
+    class Dummy:
+        def method(self): pass
+
+    class Owner:
+        def __init__(self):
+            self.evicted = []
+
+        def evict(self, handler):
+            self.evicted.append(handler)
+
+    d = Dummy()
+    handler = EventHandler(d.method)
+    owners = [Owner() for _ in range(8)]
+    barrier = threading.Barrier(len(owners))
+
+    def worker(owner):
+        barrier.wait()
+        assert handler._add_watcher(weakref.WeakMethod(owner.evict)) is True
+
+    threads = [threading.Thread(target=worker, args=(o,)) for o in owners]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    del d
+    assert all(owner.evicted == [handler] for owner in owners)
+
+
+def test_instances_dying_while_other_handlers_are_watched_on_many_threads():
+    import threading
+
+    from pyesys import create_event
+
+    class Dummy:
+        def method(self, x): pass
+
+    events = [create_event(example=lambda x: None) for _ in range(4)]
+    barrier = threading.Barrier(len(events))
+
+    def churn(event_obj, listener):
+        barrier.wait()
+        for _ in range(200):
+            dummy = Dummy()
+            listener.subscribe(dummy.method)
+            del dummy  # evicted from this thread's weakref callback
+            keep = Dummy()
+            listener.subscribe(keep.method)
+            listener.unsubscribe(keep.method)
+
+    threads = [threading.Thread(target=churn, args=pair) for pair in events]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join(timeout=10)
+    assert not any(t.is_alive() for t in threads)
+    assert all(event_obj.handler_count() == 0 for event_obj, _ in events)
+
+
+def test_eventhandler_reports_batch_marker():
+    @batch_handler
+    def collect(batch):
+        pass
+
+    def plain(x):
+        pass
+
+    assert EventHandler(collect).is_batch()
+    assert EventHandler(collect).get_info()["is_batch"] is True
+    assert not EventHandler(plain).is_batch()
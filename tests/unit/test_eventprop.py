@@ -2,7 +2,10 @@ import pytest
 import asyncio
 import gc
 import time
+import threading
+import dataclasses
 
+from pyesys.event import Event
 from pyesys.prop import event
 
 
@@ -132,6 +135,33 @@ def test_class_level_events_are_per_instance():
     assert results == [111]
 
 
+def test_concurrent_first_access_creates_one_event_per_instance():
+    button = DummyButton()
+    results = []
+    threads = 8
+    barrier = threading.Barrier(threads)
+
+    def make_handler(i):
+        def handler(value):
+            results.append(i)
+        return handler
+
+    def worker(i):
+        handler = make_handler(i)
+        barrier.wait()
+        button.on_click += handler
+
+    workers = [threading.Thread(target=worker, args=(i,)) for i in range(threads)]
+    for t in workers:
+        t.start()
+    for t in workers:
+        t.join()
+
+    # Every thread subscribed to the same Event, so no subscription was lost
+    button.click(1)
+    assert sorted(results) == list(range(threads))
+
+
 def test_class_level_unsubscribe_works_and_signature_checked():
     b = DummyButton()
     calls = []
@@ -181,6 +211,199 @@ def test_class_level_memory_cleanup_of_bound_handlers():
     assert listener.handler_count() == 0
 
 
+# ---------------- Per-instance storage ----------------
+
+def test_event_is_stored_on_instance_dict():
+    b = DummyButton()
+    b.on_click += lambda v: None
+    assert DummyButton.on_click.storage == "instance"
+    assert isinstance(vars(b)["_pyesys_on_click"], Event)
+    assert b not in DummyButton.on_click._per_instance
+
+
+def test_unhashable_and_frozen_dataclasses_get_events():
+    @dataclasses.dataclass(frozen=True)
+    class Frozen:
+        x: int
+
+        @event
+        def on_change(self, value):
+            pass
+
+        @on_change.emitter
+        def change(self, value):
+            pass
+
+    @dataclasses.dataclass
+    class Model:  # eq=True makes instances unhashable
+        x: int
+
+        @event
+        def on_change(self, value):
+            pass
+
+        @on_change.emitter
+        def change(self, value):
+            pass
+
+    for obj in (Frozen(1), Model(1)):
+        calls = []
+        # Frozen instances refuse the write-back of +=, so subscribe directly
+        obj.on_change.subscribe(lambda v: calls.append(v))
+        obj.change(7)
+        assert calls == [7]
+
+
+def test_declared_slot_stores_event():
+    class Slotted:
+        __slots__ = ("_pyesys_on_change", "__weakref__")
+
+        @event
+        def on_change(self, value):
+            pass
+
+        @on_change.emitter
+        def change(self, value):
+            pass
+
+    assert Slotted.on_change.storage == "instance"
+    obj = Slotted()
+    calls = []
+    obj.on_change += lambda v: calls.append(v)
+    obj.change(3)
+    assert calls == [3]
+    assert isinstance(obj._pyesys_on_change, Event)
+
+
+def test_slotted_class_without_storage_slot_falls_back_to_weak_dict():
+    class Slotted:
+        __slots__ = ("__weakref__",)
+
+        @event
+        def on_change(self, value):
+            pass
+
+        @on_change.emitter
+        def change(self, value):
+            pass
+
+    assert Slotted.on_change.storage == "weakref"
+    obj = Slotted()
+    calls = []
+    obj.on_change += lambda v: calls.append(v)
+    obj.change(4)
+    assert calls == [4]
+    assert obj in Slotted.on_change._per_instance
+
+
+def test_slotted_dataclass_falls_back_to_weak_dict():
+    # dataclass(slots=True) rebuilds the class and calls __set_name__ again
+    @dataclasses.dataclass(slots=True, weakref_slot=True, unsafe_hash=True)
+    class Model:
+        x: int
+
+        @event
+        def on_changed(self, value):
+            pass
+
+        @on_changed.emitter
+        def change(self, value):
+            pass
+
+    assert Model.on_changed.storage == "weakref"
+    obj = Model(1)
+    calls = []
+    obj.on_changed += lambda v: calls.append(v)
+    obj.change(5)
+    assert calls == [5]
+    assert obj in Model.on_changed._per_instance
+
+
+def test_read_only_access_does_not_create_event():
+    b = DummyButton()
+    assert b.on_click.handler_count() == 0
+    b.on_click -= lambda v: None
+    b.on_click.unsubscribe(lambda v: None)
+    b.click(1)  # Emitting with no Event is a no-op
+    assert "_pyesys_on_click" not in vars(b)
+
+    calls = []
+    b.on_click += lambda v: calls.append(v)
+    assert "_pyesys_on_click" in vars(b)
+    assert b.on_click.handler_count() == 1
+    b.click(2)
+    assert calls == [2]
+
+
+def test_pending_listener_still_validates_handlers():
+    b = DummyButton()
+    with pytest.raises(TypeError):
+        b.on_click -= 42
+    with pytest.raises(TypeError):
+        b.on_click += lambda: None
+
+
+def test_instance_events_share_one_signature():
+    b1, b2 = DummyButton(), DummyButton()
+    b1.on_click += lambda v: None
+    b2.on_click += lambda v: None
+    assert b1._pyesys_on_click._sig is b2._pyesys_on_click._sig
+    assert list(b1._pyesys_on_click._sig.parameters) == ["value"]
+
+
+def test_class_event_with_many_parameters():
+    class Sensor:
+        @event
+        def on_sample(self, a, b, c, d):
+            pass
+
+        @on_sample.emitter
+        def sample(self, a, b, c, d):
+            pass
+
+    s = Sensor()
+    calls = []
+    s.on_sample += lambda a, b, c, d: calls.append((a, b, c, d))
+    s.sample(1, 2, 3, 4)
+    assert calls == [(1, 2, 3, 4)]
+
+
+def test_event_decorator_accepts_thread_options():
+    class Widget:
+        @event(threadsafe=False, thread_check=True)
+        def on_change(self, value):
+            pass
+
+        @on_change.emitter
+        def change(self, value):
+            pass
+
+    w = Widget()
+    calls = []
+    w.on_change += lambda v: calls.append(v)
+    w.change(5)
+    assert calls == [5]
+
+    errors = []
+
+    def worker():
+        try:
+            w.on_change += lambda v: None
+        except RuntimeError as e:
+            errors.append(e)
+
+    t = threading.Thread(target=worker)
+    t.start()
+    t.join()
+    assert len(errors) == 1
+
+
+def test_assigning_to_instance_event_raises():
+    b = DummyButton()
+    with pytest.raises(AttributeError):
+        b.on_click = lambda v: None
+
+
 @pytest.mark.asyncio
 async def test_class_level_async_emitter_with_mixed_handlers():
     b = DummyAsyncButton()
@@ -205,3 +428,45 @@ def test_prefixing_subscribe_on_class_directly_raises_attribute_error():
     # Attempting to do DummyButton.on_click += handler should raise
     with pytest.raises(AttributeError):
         DummyButton.on_click += lambda v: None
+
+
+def test_sync_emitter_runs_each_sync_handler_once_with_async_handlers_present():
+    calls = []
+    async_done = threading.Event()
+
+    class Widget:
+        @event
+        def on_change(self, value):
+            pass
+
+        @on_change.emitter
+        def change(self, value):
+            pass
+
+    def sync_h(value):
+        calls.append(("sync", value, threading.current_thread()))
+
+    async def async_h(value):
+        calls.append(("async", value, threading.current_thread()))
+        async_done.set()
+
+    w = Widget()
+    w.on_change += sync_h
+    w.on_change += async_h
+
+    w.change(1)
+    assert async_done.wait(timeout=1)
+    time.sleep(0.02)  # give a stray executor copy of sync_h a chance to show up
+
+    sync_calls = [c for c in calls if c[0] == "sync"]
+    assert len(sync_calls) == 1
+    assert sync_calls[0][2] is threading.current_thread()
+
+
+def test_descriptor_signature_cannot_use_reserved_emit_options():
+    with pytest.raises(TypeError, match="ordered"):
+
+        class Library:
+            @event
+            def on_checkout(self, book, ordered):
+                pass
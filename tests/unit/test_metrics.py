@@ -0,0 +1,175 @@
+import asyncio
+import gc
+import threading
+
+import pytest
+
+from pyesys import (
+    Event,
+    MetricsRegistry,
+    ShardedEvent,
+    create_event,
+    event,
+    get_metrics_registry,
+    render_prometheus,
+)
+from pyesys.metrics import _EMISSIONS
+
+
+@pytest.fixture(autouse=True)
+def registry():
+    registry = get_metrics_registry()
+    registry.clear()
+    yield registry
+    registry.clear()
+
+
+def values(registry, name, owner=""):
+    return registry.event_metrics(name, owner).collect()
+
+
+class Receiver:
+    def on(self, x):
+        pass
+
+
+def test_unnamed_events_are_not_metered(registry):
+    event_obj, listener = create_event(example=lambda x: None)
+    listener += lambda x: None
+    event_obj.emit(1)
+    assert registry.collect() == []
+
+
+def test_emissions_errors_and_handler_high_water_mark(registry):
+    event_obj, listener = create_event(
+        example=lambda x: None, name="orders", error_handler=lambda e, h: None
+    )
+
+    def bad(x):
+        raise ValueError(x)
+
+    handlers = [lambda x: None, lambda x: None, bad]
+    listener += handlers
+    event_obj.emit(1)
+    event_obj.emit_many([(2,), (3,)])
+    listener -= handlers[:2]
+
+    assert values(registry, "orders") == {
+        "emissions": 3,
+        "errors": 3,
+        "evictions": 0,
+        "handlers_max": 3,
+        "async_pending": 0,
+    }
+
+
+def test_counts_from_all_threads_are_merged(registry):
+    event_obj, listener = create_event(example=lambda x: None, name="ticks")
+    listener += lambda x: None
+
+    def emit_many():
+        for i in range(1000):
+            event_obj.emit(i)
+
+    threads = [threading.Thread(target=emit_many) for _ in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert values(registry, "ticks")["emissions"] == 4000
+
+
+def test_evictions_are_counted(registry):
+    event_obj, listener = create_event(example=lambda x: None, name="gc")
+    sharded, sharded_listener = ShardedEvent.new(lambda x: None, shards=2, name="gc")
+    receiver = Receiver()
+    listener += receiver.on
+    sharded_listener += receiver.on
+    del receiver
+    gc.collect()
+    event_obj.emit(1)
+    sharded.emit(1)
+    assert values(registry, "gc")["evictions"] == 2
+    assert values(registry, "gc")["handlers_max"] == 1
+
+
+@pytest.mark.asyncio
+async def test_async_pending_counts_running_dispatches(registry):
+    event_obj, listener = create_event(example=lambda x: None, name="jobs")
+    started = asyncio.Event()
+    release = asyncio.Event()
+
+    async def handler(x):
+        started.set()
+        await release.wait()
+
+    listener += handler
+    task = asyncio.ensure_future(event_obj.emit_async(1))
+    await started.wait()
+    assert values(registry, "jobs")["async_pending"] == 1
+    release.set()
+    await task
+    assert values(registry, "jobs")["async_pending"] == 0
+    assert values(registry, "jobs")["emissions"] == 1
+
+
+def test_descriptor_events_report_owner_and_name(registry):
+    class Sensor:
+        @event(metrics=True)
+        def on_reading(self, value):
+            pass
+
+        @on_reading.emitter
+        def read(self, value):
+            pass
+
+    a, b = Sensor(), Sensor()
+    a.on_reading += lambda value: None
+    b.on_reading += [lambda value: None, lambda value: None]
+    a.read(1)
+    b.read(2)
+    b.read(3)
+
+    owner = f"{Sensor.__module__}.{Sensor.__qualname__}"
+    assert [(o, n) for o, n, _ in registry.collect()] == [(owner, "on_reading")]
+    snapshot = values(registry, "on_reading", owner)
+    assert snapshot["emissions"] == 3
+    assert snapshot["handlers_max"] == 2
+
+
+def test_module_level_descriptor_is_named_after_its_function(registry):
+    @event(metrics=True)
+    def on_saved(path):
+        pass
+
+    on_saved += lambda path: None
+    on_saved._global_event.emit("a")
+    (owner, name, snapshot), = registry.collect()
+    assert owner == __name__
+    assert name.endswith("on_saved")
+    assert snapshot["emissions"] == 1
+
+
+def test_render_prometheus_text_format():
+    registry = MetricsRegistry()
+    metrics = registry.event_metrics('say "hi"\\', owner="app.Chat")
+    metrics.add(_EMISSIONS, 5)
+    text = render_prometheus(registry)
+
+    assert text.endswith("\n")
+    assert "# TYPE pyesys_event_emissions_total counter" in text
+    assert "# TYPE pyesys_event_handlers_max gauge" in text
+    assert (
+        'pyesys_event_emissions_total{owner="app.Chat",event="say \\"hi\\"\\\\"} 5'
+        in text.splitlines()
+    )
+    assert render_prometheus(MetricsRegistry()).count("# TYPE") == 5
+
+
+def test_named_events_share_metrics(registry):
+    first = Event(name="shared")
+    second = Event(name="shared")
+    first.emit()
+    second.emit()
+    assert first._metrics is second._metrics
+    assert values(registry, "shared")["emissions"] == 2
@@ -0,0 +1,184 @@
+import gc
+
+import pytest
+
+from pyesys import ranges
+from pyesys.event import create_event
+from pyesys.handler import EventHandler
+
+
+def _h(x):
+    pass
+
+
+def _other(x):
+    pass
+
+
+@pytest.fixture(params=["numpy", "bisect"])
+def index_backend(request, monkeypatch):
+    if request.param == "numpy":
+        pytest.importorskip("numpy")
+    else:
+        monkeypatch.setattr(ranges, "_np", None)
+    return request.param
+
+
+def test_range_index_matches_inclusive_bounds_in_subscription_order(index_backend):
+    a, b, c = EventHandler(_h), EventHandler(_other), EventHandler(lambda x: None)
+    index = ranges.RangeIndex(
+        [(0, 10.0, 20.0, a), (1, 0.0, 15.0, b), (2, 30.0, 40.0, c)]
+    )
+    assert index.match(12) == (a, b)
+    assert index.match(20.0) == (a,)
+    assert index.match(0) == (b,)
+    assert index.match(25) == ()
+    assert index.match(-1) == ()
+    assert index.match(float("nan")) == ()
+
+
+def test_range_index_agrees_with_brute_force(index_backend):
+    import random
+
+    rng = random.Random(7)
+    entries = []
+    for seq in range(500):
+        low = rng.uniform(0, 1000)
+        width = rng.choice([0.0, rng.uniform(0, 1), rng.uniform(0, 100), float("inf")])
+        entries.append((seq, low, low + width, EventHandler(lambda x, s=seq: s)))
+    index = ranges.RangeIndex(entries)
+
+    for value in [rng.uniform(-10, 1100) for _ in range(200)] + [entries[0][1]]:
+        expected = tuple(h for _, low, high, h in entries if low <= value <= high)
+        assert index.match(value) == expected
+
+
+def test_range_registry_remove_and_evict():
+    reg = ranges.RangeRegistry()
+    h = EventHandler(_h)
+    assert reg.add(h, 0.0, 1.0, allow_duplicates=False)
+    assert not reg.add(EventHandler(_h), 0.0, 1.0, allow_duplicates=False)
+    assert reg.add(EventHandler(_h), 2.0, 3.0, allow_duplicates=False)
+    assert len(reg) == 2
+
+    assert reg.remove(EventHandler(_h), 5.0, 6.0) == (False, None)
+    assert reg.remove(EventHandler(_h), 0.0, 1.0) == (True, None)
+    removed, last = reg.remove(EventHandler(_h), 2.0, 3.0)
+    assert removed and last is h
+    assert len(reg) == 0
+
+
+def test_subscribe_range_only_calls_matching_handlers(index_backend):
+    calls = []
+    event_obj, listener = create_event(example=lambda price: None)
+
+    def low(price):
+        calls.append(("low", price))
+
+    def high(price):
+        calls.append(("high", price))
+
+    def every(price):
+        calls.append(("all", price))
+
+    listener.subscribe_range(low, 0, 100)
+    listener.subscribe_range(high, 90, 200)
+    listener += every
+
+    event_obj.emit(95)
+    event_obj.emit(150)
+    event_obj.emit(500)
+    assert calls == [
+        ("all", 95),
+        ("low", 95),
+        ("high", 95),
+        ("all", 150),
+        ("high", 150),
+        ("all", 500),
+    ]
+    assert listener.handler_count() == 3
+
+
+def test_subscribe_range_validates_bounds_and_unsubscribes():
+    calls = []
+    event_obj, listener = create_event(example=lambda price: None)
+
+    def handler(price):
+        calls.append(price)
+
+    with pytest.raises(ValueError):
+        listener.subscribe_range(handler, 5, 1)
+    with pytest.raises(TypeError):
+        listener.subscribe_range(lambda a, b: None, 0, 1)
+
+    listener.subscribe_range(handler, 0, 10)
+    listener.unsubscribe_range(handler, 0, 5)  # Different range: no-op
+    event_obj.emit(3)
+    listener.unsubscribe_range(handler, 0, 10)
+    event_obj.emit(4)
+    assert calls == [3]
+    assert listener.handler_count() == 0
+    assert not event_obj._routing
+
+
+def test_range_handlers_are_evicted_with_their_instance():
+    calls = []
+    event_obj, listener = create_event(example=lambda price: None)
+
+    class Alert:
+        def fire(self, price):
+            calls.append(price)
+
+    alert = Alert()
+    listener.subscribe_range(alert.fire, 0, 10)
+    listener.subscribe(alert.fire, key=5)
+    event_obj.emit(5)
+    assert calls == [5, 5]
+
+    del alert
+    gc.collect()
+    assert listener.handler_count() == 0
+    event_obj.emit(5)
+    assert calls == [5, 5]
+
+
+def test_range_plans_are_cached_per_match_set():
+    calls = []
+    event_obj, listener = create_event(example=lambda price: None)
+    listener += lambda price: calls.append("all")
+    listener.subscribe_range(lambda price: calls.append("low"), 0, 10)
+    listener.subscribe_range(lambda price: calls.append("high"), 5, 20)
+
+    plan = event_obj._publish()
+    assert event_obj._route(plan, (1,), {}) is event_obj._route(plan, (2,), {})
+    assert event_obj._route(plan, (6,), {}) is not event_obj._route(plan, (1,), {})
+    assert event_obj._route(plan, (30,), {}) is plan
+    assert len(event_obj._ranges.build().plans) == 2
+
+    listener += lambda price: calls.append("late")
+    event_obj.emit(6)
+    assert calls == ["all", "late", "low", "high"]
+
+
+def test_clear_removes_range_subscriptions():
+    event_obj, listener = create_event(example=lambda price: None)
+    listener.subscribe_range(_h, 0, 1)
+    event_obj.clear()
+    assert listener.handler_count() == 0
+    assert event_obj.handlers == []
+
+
+@pytest.mark.asyncio
+async def test_emit_async_dispatches_matching_async_range_handlers():
+    calls = []
+    event_obj, listener = create_event(example=lambda price: None)
+
+    async def alert(price):
+        calls.append(price)
+
+    listener.subscribe_range(alert, 10, 20)
+    assert event_obj.has_async_handlers()
+    await event_obj.emit_async(15)
+    await event_obj.emit_async(25)
+    await event_obj.emit_async_only(12, ordered=True)
+    assert calls == [15, 12]
@@ -0,0 +1,75 @@
+from pyesys.handler import EventHandler
+from pyesys.registry import HandlerRegistry
+
+
+def _fn_a(x): pass
+def _fn_b(x): pass
+
+
+def test_registry_preserves_subscription_order_with_duplicates():
+    reg = HandlerRegistry()
+    a, b = EventHandler(_fn_a), EventHandler(_fn_b)
+    reg.add(a, allow_duplicates=True)
+    reg.add(b, allow_duplicates=True)
+    reg.add(EventHandler(_fn_a), allow_duplicates=True)
+
+    assert reg.snapshot() == (a, b, a)
+    assert len(reg) == 3
+
+    # Removing drops the earliest occurrence, like list.remove
+    assert reg.remove(EventHandler(_fn_a)) is None
+    assert reg.snapshot() == (b, a)
+    assert reg.remove(EventHandler(_fn_a)) is a
+    assert reg.snapshot() == (b,)
+
+
+def test_registry_duplicates_share_canonical_handler():
+    reg = HandlerRegistry()
+    first = EventHandler(_fn_a)
+    second = EventHandler(_fn_a)
+
+    assert reg.add(first, allow_duplicates=True) == (True, first)
+    assert reg.add(second, allow_duplicates=True) == (False, first)
+    assert all(h is first for h in reg.snapshot())
+
+
+def test_registry_rejects_duplicates_when_disallowed():
+    reg = HandlerRegistry()
+    reg.add(EventHandler(_fn_a), allow_duplicates=False)
+    reg.add(EventHandler(_fn_a), allow_duplicates=False)
+    assert len(reg) == 1
+
+
+def test_registry_evict_removes_all_occurrences_of_dead_handler():
+    class Foo:
+        def cb(self, x): pass
+
+    reg = HandlerRegistry()
+    foo = Foo()
+    _, canonical = reg.add(EventHandler(foo.cb), allow_duplicates=True)
+    reg.add(EventHandler(foo.cb), allow_duplicates=True)
+    reg.add(EventHandler(_fn_b), allow_duplicates=True)
+
+    del foo
+    assert reg.evict(canonical) == 2
+    assert len(reg) == 1
+    assert EventHandler(_fn_b) in reg
+
+
+def test_registry_snapshot_is_cached_until_mutation():
+    reg = HandlerRegistry()
+    reg.add(EventHandler(_fn_a), allow_duplicates=True)
+    snap = reg.snapshot()
+    assert reg.snapshot() is snap
+
+    reg.add(EventHandler(_fn_b), allow_duplicates=True)
+    assert reg.snapshot() is not snap
+    assert reg.clear() and reg.snapshot() == ()
+
+
+def test_registry_canonical_returns_shared_object():
+    reg = HandlerRegistry()
+    first = EventHandler(_fn_a)
+    reg.add(first, allow_duplicates=True)
+    assert reg.canonical(EventHandler(_fn_a)) is first
+    assert reg.canonical(EventHandler(_fn_b)) is None
@@ -0,0 +1,270 @@
+import gc
+
+import pytest
+
+from pyesys.event import Event, create_event
+from pyesys.handler import batch_handler
+from pyesys.prop import event
+
+
+def test_keyed_handlers_only_see_their_key():
+    calls = []
+    event_obj, listener = create_event(example=lambda symbol, price: None)
+
+    def aapl(symbol, price):
+        calls.append(("aapl", price))
+
+    def msft(symbol, price):
+        calls.append(("msft", price))
+
+    def every(symbol, price):
+        calls.append(("all", symbol))
+
+    listener.subscribe(aapl, key="AAPL")
+    listener.subscribe(msft, key="MSFT")
+    listener += every
+
+    event_obj.emit("AAPL", 1.0)
+    event_obj.emit("GOOG", 2.0)
+    # Unkeyed handlers run first, then the key's bucket
+    assert calls == [("all", "AAPL"), ("aapl", 1.0), ("all", "GOOG")]
+    assert listener.handler_count() == 3
+
+
+def test_custom_key_extractor_and_extractor_errors():
+    calls = []
+    errors = []
+    event_obj, listener = create_event(
+        example=lambda order: None,
+        key_extractor=lambda order: order["venue"],
+        error_handler=lambda e, h: errors.append(e),
+    )
+
+    def on_xnys(order):
+        calls.append(order["id"])
+
+    def every(order):
+        calls.append("all")
+
+    listener.subscribe(on_xnys, key="XNYS")
+    listener += every
+    event_obj.emit({"venue": "XNYS", "id": 1})
+    event_obj.emit({"id": 2})  # Extractor fails: routed to unkeyed handlers only
+    assert calls == ["all", 1, "all"]
+    assert len(errors) == 1 and isinstance(errors[0], KeyError)
+
+
+def test_keyed_unsubscribe_and_clear():
+    calls = []
+    event_obj, listener = create_event(example=lambda symbol: None)
+
+    def handler(symbol):
+        calls.append(symbol)
+
+    listener.subscribe([handler], key="A")
+    listener.subscribe(handler, key="B")
+    listener.unsubscribe(handler, key="A")
+    event_obj.emit("A")
+    event_obj.emit("B")
+    assert calls == ["B"]
+
+    # Unsubscribing without the key does not touch keyed buckets
+    listener -= handler
+    assert listener.handler_count() == 1
+
+    event_obj.clear()
+    event_obj.emit("B")
+    assert calls == ["B"]
+    assert listener.handler_count() == 0
+    assert not event_obj._keyed
+
+
+def test_keyed_duplicates_follow_allow_duplicates():
+    event_obj, listener = create_event(
+        example=lambda symbol: None, allow_duplicates=False
+    )
+
+    def handler(symbol):
+        pass
+
+    listener.subscribe(handler, key="A")
+    listener.subscribe(handler, key="A")
+    listener.subscribe(handler, key="B")
+    assert listener.handler_count() == 2
+
+
+def test_handlers_subscribed_unkeyed_and_routed_run_once_without_duplicates():
+    calls = []
+    event_obj, listener = create_event(
+        example=lambda price: None, allow_duplicates=False
+    )
+
+    def handler(price):
+        calls.append(price)
+
+    listener += handler
+    listener.subscribe(handler, key=5)
+    listener.subscribe_range(handler, 0, 10)
+    event_obj.emit(5)
+    assert calls == [5]
+
+    calls.clear()
+    dup_event, dup_listener = create_event(example=lambda price: None)
+    dup_listener += handler
+    dup_listener.subscribe(handler, key=5)
+    dup_event.emit(5)
+    assert calls == [5, 5]
+
+
+def test_keyed_bound_handlers_are_evicted_when_instance_dies():
+    calls = []
+    event_obj, listener = create_event(example=lambda symbol: None)
+
+    class Subscriber:
+        def on_tick(self, symbol):
+            calls.append(symbol)
+
+    sub = Subscriber()
+    listener.subscribe(sub.on_tick, key="A")
+    listener.subscribe(sub.on_tick, key="B")
+    listener += sub.on_tick
+    # One canonical handler, watched once, across all buckets
+    canonical = next(iter(event_obj._handler_keys))
+    assert event_obj._registry.canonical(canonical) is canonical
+    assert len(canonical._watchers) == 1
+
+    event_obj.emit("A")
+    assert calls == ["A", "A"]
+
+    del sub
+    gc.collect()
+    assert listener.handler_count() == 0
+    assert not event_obj._keyed and event_obj._handler_keys == {}
+
+
+def test_batch_handlers_cannot_be_keyed():
+    event_obj, listener = create_event(example=lambda symbol: None)
+
+    @batch_handler
+    def collect(batch):
+        pass
+
+    with pytest.raises(TypeError):
+        listener.subscribe(collect, key="A")
+
+
+def test_keyed_routing_rebuilds_merged_plan_after_changes():
+    calls = []
+    event_obj, listener = create_event(example=lambda symbol: None)
+
+    def keyed(symbol):
+        calls.append("keyed")
+
+    def late(symbol):
+        calls.append("late")
+
+    listener.subscribe(keyed, key="A")
+    event_obj.emit("A")
+    listener += late
+    event_obj.emit("A")
+    assert calls == ["keyed", "late", "keyed"]
+
+
+def test_emit_many_routes_each_payload():
+    calls = []
+    event_obj, listener = create_event(example=lambda symbol, qty: None)
+
+    def on_a(symbol, qty):
+        calls.append(qty)
+
+    listener.subscribe(on_a, key="A")
+    event_obj.emit_many([("A", 1), ("B", 2), ("A", 3)])
+    assert calls == [1, 3]
+
+
+@pytest.mark.asyncio
+async def test_emit_async_routes_to_keyed_async_handlers():
+    calls = []
+    event_obj, listener = create_event(example=lambda symbol: None)
+
+    async def on_a(symbol):
+        calls.append(("async", symbol))
+
+    def on_b(symbol):
+        calls.append(("sync", symbol))
+
+    listener.subscribe(on_a, key="A")
+    listener.subscribe(on_b, key="B")
+    assert event_obj.has_async_handlers()
+
+    await event_obj.emit_async("A")
+    await event_obj.emit_async("B", ordered=True)
+    await event_obj.emit_async_only("B")
+    await event_obj.emit_many_async([("A",), ("C",)])
+    assert calls == [("async", "A"), ("sync", "B"), ("async", "A")]
+
+
+class Ticker:
+    @event
+    def on_tick(self, symbol, price):
+        pass
+
+    @on_tick.emitter
+    def tick(self, symbol, price):
+        pass
+
+
+def test_keyed_routing_through_event_descriptor():
+    calls = []
+    t1, t2 = Ticker(), Ticker()
+
+    def on_aapl(symbol, price):
+        calls.append(price)
+
+    t1.on_tick.subscribe(on_aapl, key="AAPL")
+    t1.tick("AAPL", 1.0)
+    t1.tick("MSFT", 2.0)
+    t2.tick("AAPL", 3.0)
+    assert calls == [1.0]
+
+
+def test_default_key_is_read_from_keyword_emissions():
+    calls = []
+    errors = []
+    event_obj, listener = create_event(
+        example=lambda symbol, price: None, error_handler=lambda e, h: errors.append(e)
+    )
+    listener.subscribe(lambda symbol, price: calls.append(price), key="AAPL")
+    event_obj.emit(symbol="AAPL", price=1.0)
+    event_obj.emit(price=2.0, symbol="AAPL")
+    event_obj.emit("AAPL", price=3.0)
+    assert calls == [1.0, 2.0, 3.0]
+    assert errors == []
+
+
+def test_keyword_emission_without_signature_reports_a_clear_error():
+    errors = []
+    event_obj = Event(error_handler=lambda e, h: errors.append(e))
+    event_obj.listener.subscribe(lambda symbol: None, key="AAPL")
+    event_obj.emit(symbol="AAPL")
+    assert len(errors) == 1
+    assert isinstance(errors[0], TypeError) and "key_extractor" in str(errors[0])
+
+
+class Venue:
+    @event(key_extractor=lambda order: order["venue"])
+    def on_order(self, order):
+        pass
+
+    @on_order.emitter
+    def submit(self, order):
+        pass
+
+
+def test_event_descriptor_accepts_a_key_extractor():
+    calls = []
+    venue = Venue()
+    venue.on_order.subscribe(lambda order: calls.append(order["id"]), key="XNYS")
+    venue.submit({"venue": "XNYS", "id": 1})
+    venue.submit({"venue": "XLON", "id": 2})
+    assert calls == [1]
@@ -0,0 +1,146 @@
+import gc
+import threading
+
+import pytest
+
+from pyesys.sharded import ShardedEvent, create_sharded_event
+
+
+def _make_handler(i, calls):
+    def handler(x):
+        calls.append(i)
+
+    return handler
+
+
+def _make_handlers(n, calls):
+    return [_make_handler(i, calls) for i in range(n)]
+
+
+def test_sharded_event_emits_in_global_subscription_order():
+    calls = []
+    event_obj, listener = create_sharded_event(example=lambda x: None, shards=4)
+    handlers = _make_handlers(50, calls)
+    listener += handlers
+    assert sum(1 for shard in event_obj._shards if len(shard.registry)) > 1
+
+    event_obj.emit(0)
+    assert calls == list(range(50))
+    assert listener.handler_count() == 50
+
+
+def test_sharded_event_duplicates_and_unsubscribe():
+    calls = []
+    event_obj, listener = create_sharded_event(example=lambda x: None, shards=3)
+    a, b = _make_handlers(2, calls)
+    listener += [a, b, a]
+    event_obj.emit(0)
+    assert calls == [0, 1, 0]
+
+    listener -= a  # Drops the earliest occurrence
+    calls.clear()
+    event_obj.emit(0)
+    assert calls == [1, 0]
+
+    event_obj.clear()
+    assert listener.handler_count() == 0
+    event_obj.emit(0)
+    assert calls == [1, 0]
+
+
+def test_sharded_event_respects_allow_duplicates_false():
+    event_obj, listener = create_sharded_event(
+        example=lambda x: None, allow_duplicates=False
+    )
+
+    def handler(x):
+        pass
+
+    listener += [handler, handler]
+    assert listener.handler_count() == 1
+
+
+def test_sharded_event_evicts_dead_bound_handlers():
+    calls = []
+    event_obj, listener = create_sharded_event(example=lambda x: None)
+
+    class Sub:
+        def on(self, x):
+            calls.append(x)
+
+    sub = Sub()
+    listener += sub.on
+    event_obj.emit(1)
+    del sub
+    gc.collect()
+    assert listener.handler_count() == 0
+    event_obj.emit(2)
+    assert calls == [1]
+
+
+def test_sharded_event_routes_keyed_and_range_subscriptions():
+    calls = []
+    event_obj, listener = create_sharded_event(example=lambda x: None, shards=4)
+    listener += lambda x: calls.append(("all", x))
+    listener.subscribe(lambda x: calls.append(("key", x)), key=2)
+    in_range = lambda x: calls.append(("range", x))
+    listener.subscribe_range(in_range, 1, 3)
+    assert listener.handler_count() == 3
+
+    event_obj.emit(2)
+    event_obj.emit(5)
+    assert calls == [("all", 2), ("key", 2), ("range", 2), ("all", 5)]
+
+    calls.clear()
+    listener.unsubscribe_range(in_range, 1, 3)
+    event_obj.emit(2)
+    assert calls == [("all", 2), ("key", 2)]
+    with pytest.raises(ValueError):
+        ShardedEvent(shards=0)
+
+
+def test_sharded_event_evicts_dead_keyed_and_range_handlers():
+    class Receiver:
+        def on(self, x):
+            calls.append(x)
+
+    calls = []
+    event_obj, listener = create_sharded_event(example=lambda x: None, shards=2)
+    receiver = Receiver()
+    listener += receiver.on
+    listener.subscribe(receiver.on, key=1)
+    listener.subscribe_range(receiver.on, 0, 2)
+    event_obj.emit(1)
+    assert calls == [1, 1, 1]
+
+    del receiver
+    gc.collect()
+    assert listener.handler_count() == 0
+    event_obj.emit(1)
+    assert calls == [1, 1, 1]
+
+
+def test_sharded_event_concurrent_churn_keeps_plan_consistent():
+    event_obj, listener = create_sharded_event(example=lambda x: None, shards=8)
+    keep = _make_handlers(16, [])
+    errors = []
+
+    def worker(handler):
+        try:
+            for _ in range(200):
+                listener.subscribe(handler)
+                event_obj.emit(0)
+                listener.unsubscribe(handler)
+            listener.subscribe(handler)
+        except Exception as e:  # pragma: no cover - surfaced by the assert
+            errors.append(e)
+
+    threads = [threading.Thread(target=worker, args=(h,)) for h in keep]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert errors == []
+    assert listener.handler_count() == 16
+    assert sorted(map(id, event_obj.handlers)) == sorted(map(id, keep))
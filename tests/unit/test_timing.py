@@ -0,0 +1,155 @@
+import asyncio
+import time
+
+import pytest
+
+from pyesys import Event, EventHandler, LatencyHistogram, ShardedEvent, create_event
+from pyesys.handler import batch_handler
+
+
+def test_enable_timing_swaps_in_timed_methods_and_back():
+    event_obj, listener = create_event(example=lambda x: None)
+    untimed_run = type(event_obj)._run_sync_batch
+    assert not event_obj.timing_enabled
+
+    event_obj.enable_timing()
+    assert event_obj.timing_enabled
+    assert isinstance(event_obj, Event)
+    assert type(event_obj).__name__ == "Event"
+    assert type(event_obj)._run_sync_batch is not untimed_run
+    assert type(event_obj).emit is Event.emit  # emit methods are shared
+
+    event_obj.disable_timing()
+    assert type(event_obj) is Event
+    assert not event_obj.timing_enabled
+
+
+def test_emit_records_one_duration_per_handler_invocation():
+    event_obj, listener = create_event(example=lambda x: None)
+    fast = EventHandler(lambda x: None)
+
+    def slow(x):
+        time.sleep(0.002)
+
+    @batch_handler
+    def rows(batch):
+        pass
+
+    listener += [fast, slow, rows]
+    event_obj.emit(1)  # not timed yet
+    event_obj.enable_timing()
+    for i in range(3):
+        event_obj.emit(i)
+    event_obj.emit_many([(1,), (2,)])
+
+    timings = event_obj.handler_timings()
+    assert timings[fast]["count"] == 5
+    assert timings[EventHandler(slow)]["count"] == 5
+    assert timings[EventHandler(slow)]["function_name"] == "slow"
+    assert timings[EventHandler(slow)]["p50"] >= 0.002
+    assert timings[EventHandler(rows)]["count"] == 4  # three singles, one batch
+
+
+def test_errors_are_timed_and_still_reported():
+    errors = []
+    event_obj, listener = create_event(
+        example=lambda x: None, error_handler=lambda e, h: errors.append(e)
+    )
+
+    def bad(x):
+        raise ValueError(x)
+
+    listener += bad
+    event_obj.enable_timing()
+    event_obj.emit(1)
+    with pytest.raises(ExceptionGroup):
+        event_obj.emit(2, collect_errors=True)
+    assert len(errors) == 1
+    assert event_obj.handler_timings()[EventHandler(bad)]["count"] == 2
+
+
+def test_error_reporting_is_not_timed():
+    event_obj, listener = create_event(
+        example=lambda x: None, error_handler=lambda e, h: time.sleep(0.01)
+    )
+
+    def bad(x):
+        raise ValueError(x)
+
+    async def async_bad(x):
+        raise ValueError(x)
+
+    listener += [bad, async_bad]
+    event_obj.enable_timing()
+    event_obj.emit(1)
+    asyncio.run(event_obj.emit_async(2))
+    timings = event_obj.handler_timings()
+    assert timings[EventHandler(bad)]["count"] == 2
+    assert timings[EventHandler(bad)]["max"] < 0.01
+    assert timings[EventHandler(async_bad)]["max"] < 0.01
+
+
+@pytest.mark.asyncio
+async def test_emit_async_times_async_handlers_until_completion():
+    event_obj, listener = create_event(example=lambda x: None)
+
+    async def waits(x):
+        await asyncio.sleep(0.005)
+
+    def sync(x):
+        pass
+
+    listener += [waits, sync]
+    event_obj.enable_timing()
+    await event_obj.emit_async(1)
+    await event_obj.emit_async(2, ordered=True)
+
+    timings = event_obj.handler_timings()
+    assert timings[EventHandler(waits)]["count"] == 2
+    assert timings[EventHandler(waits)]["max"] >= 0.005
+    assert timings[EventHandler(sync)]["count"] == 2
+
+
+def test_snapshot_reset_and_disable():
+    event_obj, listener = create_event(example=lambda x: None)
+    handler = EventHandler(lambda x: None)
+    listener += handler
+    event_obj.enable_timing()
+    event_obj.emit(1)
+
+    assert event_obj.handler_timings(reset=True)[handler]["count"] == 1
+    assert event_obj.handler_timings() == {}
+
+    event_obj.emit(2)
+    event_obj.disable_timing()
+    event_obj.emit(3)
+    assert event_obj.handler_timings()[handler]["count"] == 1  # kept, not extended
+    event_obj.reset_timings()
+    assert event_obj.handler_timings() == {}
+
+
+def test_sharded_events_can_be_timed():
+    event_obj, listener = ShardedEvent.new(lambda x: None, shards=2)
+    handler = EventHandler(lambda x: None)
+    listener += handler
+    event_obj.enable_timing()
+    event_obj.emit(1)
+    assert isinstance(event_obj, ShardedEvent)
+    assert event_obj.handler_timings()[handler]["count"] == 1
+    event_obj.disable_timing()
+    assert type(event_obj) is ShardedEvent
+
+
+def test_histogram_buckets_are_log_scale():
+    histogram = LatencyHistogram()
+    for ns in (100, 1_500, 1_500, 3_000, 10**12):
+        histogram.record(ns)
+    snapshot = histogram.snapshot()
+    counts = {bound: n for bound, n in snapshot["buckets"] if n}
+
+    assert counts == {1024e-9: 1, 2048e-9: 2, 4096e-9: 1, float("inf"): 1}
+    assert snapshot["count"] == 5
+    assert snapshot["max"] == 1000.0
+    assert snapshot["p50"] == 2048e-9  # upper bound of the median's bucket
+    assert snapshot["p99"] == 1000.0
+    assert LatencyHistogram().snapshot()["p50"] == 0.0
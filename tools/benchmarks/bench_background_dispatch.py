@@ -0,0 +1,74 @@
+"""
+Sync emitters with async handlers: per-emit event loops vs the shared dispatcher.
+
+Sync ``@event`` emitters hand async handlers to a long-lived dispatcher loop.
+The "loop per emit" row reproduces the earlier approach, which created and
+closed a fresh event loop on a 4-worker thread pool for every emission.
+"""
+
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import common  # noqa: F401  (puts src/ on sys.path)
+from common import print_table
+
+from pyesys import get_dispatcher, shutdown_dispatcher
+
+EMITS = 5_000
+
+
+def run(submit) -> float:
+    remaining = EMITS
+    done = threading.Event()
+    lock = threading.Lock()
+
+    async def handler() -> None:
+        nonlocal remaining
+        with lock:
+            remaining -= 1
+            if remaining == 0:
+                done.set()
+
+    start = time.perf_counter()
+    for _ in range(EMITS):
+        submit(handler)
+    done.wait()
+    return EMITS / (time.perf_counter() - start)
+
+
+def main() -> None:
+    pool = ThreadPoolExecutor(max_workers=4)
+
+    def loop_per_emit(handler) -> None:
+        def run_async() -> None:
+            loop = asyncio.new_event_loop()
+            try:
+                loop.run_until_complete(handler())
+            finally:
+                loop.close()
+
+        pool.submit(run_async)
+
+    legacy = run(loop_per_emit)
+    pool.shutdown()
+
+    dispatcher = get_dispatcher()
+    shared = run(lambda handler: dispatcher.submit(handler()))
+    stats = dispatcher.stats()
+    shutdown_dispatcher()
+
+    print(f"Background async handler dispatch ({EMITS:,} emits)\n")
+    print_table(
+        ["strategy", "emits/s"],
+        [
+            ["loop per emit (4 workers)", f"{legacy:,.0f}"],
+            ["shared dispatcher loop", f"{shared:,.0f}"],
+        ],
+    )
+    print(f"\ndispatcher: {stats}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+"""
+Emit throughput while a handler fails on every call, with and without a
+circuit breaker.
+
+Without a breaker every emission calls the failing handler, catches its
+exception and reports it. With one, the handler is skipped once its breaker
+opened, so emission only pays for the healthy handlers. A run without the
+failing handler is the baseline. Errors go to a no-op error handler so the
+numbers measure dispatch, not reporting.
+"""
+
+import common  # noqa: F401  (puts src/ on sys.path)
+from common import print_table, throughput
+
+from pyesys import CircuitBreaker, create_event
+
+EMITS = 50_000
+HEALTHY = 4
+
+
+def failing(value):
+    raise ConnectionError("downstream unavailable")
+
+
+def ignore(exception, handler):
+    pass
+
+
+def run(breaker, with_failing: bool = True) -> float:
+    event, listener = create_event(
+        example=lambda value: None, error_handler=ignore, circuit_breaker=breaker
+    )
+    for _ in range(HEALTHY):
+        listener += lambda value: None
+    if with_failing:
+        listener += failing
+    return throughput(lambda: event.emit(1), EMITS)
+
+
+def main() -> None:
+    rows = [
+        ["healthy handlers only", f"{run(None, with_failing=False):,.0f}"],
+        ["failing handler, no breaker", f"{run(None):,.0f}"],
+        ["failing handler, CircuitBreaker()", f"{run(CircuitBreaker()):,.0f}"],
+    ]
+    print(f"Emits/s with {HEALTHY} healthy handlers\n")
+    print_table(["configuration", "emits/s"], rows)
+
+
+if __name__ == "__main__":
+    main()
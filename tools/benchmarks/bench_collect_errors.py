@@ -0,0 +1,60 @@
+"""
+Cost of handler failures: per-exception error handler versus
+``collect_errors=True``.
+
+By default each failure rebuilds the handler's callback (a new bound method
+for method handlers) and calls the error handler. Collect mode only appends
+the exception to a list and raises one ExceptionGroup after dispatch. The
+failing handlers are bound methods, and the error handler is a no-op, so the
+difference is the reporting path itself. A run without failures shows the
+cost of the ``collect_errors`` keyword on the success path.
+"""
+
+import common  # noqa: F401  (puts src/ on sys.path)
+from common import print_table, throughput
+
+from pyesys import create_event
+
+EMITS = 20_000
+HANDLERS = 16
+FAILING = (0, 4, 16)
+
+
+class Sink:
+    def ok(self, value):
+        pass
+
+    def broken(self, value):
+        raise ConnectionError("downstream unavailable")
+
+
+def ignore(exception, handler):
+    pass
+
+
+def bench(failing: int) -> list:
+    event, listener = create_event(example=lambda value: None, error_handler=ignore)
+    sinks = [Sink() for _ in range(HANDLERS)]
+    for i, sink in enumerate(sinks):
+        listener += sink.broken if i < failing else sink.ok
+
+    def collected():
+        try:
+            event.emit(1, collect_errors=True)
+        except ExceptionGroup:
+            pass
+
+    return [
+        f"{throughput(lambda: event.emit(1), EMITS):,.0f}",
+        f"{throughput(collected, EMITS):,.0f}",
+    ]
+
+
+def main() -> None:
+    rows = [[f"{n}/{HANDLERS}"] + bench(n) for n in FAILING]
+    print("Emits/s by number of failing handlers\n")
+    print_table(["failing", "error_handler", "collect_errors"], rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""
+Columnar emission: per-sample ``emit()`` versus one ``emit_columns()`` call.
+
+A telemetry producer that emits one event per sample pays a Python call per
+sample and handler. With ``columnar=True`` a vectorized handler receives whole
+NumPy columns instead; scalar handlers on the same event still work through a
+per-row fallback, which is shown for comparison.
+"""
+
+import sys
+
+import common  # noqa: F401  (puts src/ on sys.path)
+from common import measure, percentile, print_table
+
+from pyesys import create_event, vectorized_handler
+
+SAMPLES = 100_000
+REPEAT = 10
+
+
+def main() -> None:
+    try:
+        import numpy as np
+    except ImportError:
+        print("This benchmark needs NumPy: pip install pyesys[numpy]")
+        sys.exit(0)
+
+    ts = np.arange(SAMPLES, dtype=np.float64)
+    values = np.random.default_rng(0).random(SAMPLES)
+    rows = list(zip(ts.tolist(), values.tolist()))
+    state = {"sum": 0.0}
+
+    def scalar(t, v):
+        state["sum"] += v
+
+    @vectorized_handler
+    def vectorized(t, v):
+        state["sum"] += float(v.sum())
+
+    scalar_event, scalar_listener = create_event(
+        example=lambda t, v: None, columnar=True
+    )
+    scalar_listener += scalar
+    vector_event, vector_listener = create_event(
+        example=lambda t, v: None, columnar=True
+    )
+    vector_listener += vectorized
+
+    def per_sample():
+        emit = scalar_event.emit
+        for t, v in rows:
+            emit(t, v)
+
+    cases = [
+        ("emit() per sample, scalar handler", per_sample),
+        ("emit_columns(), scalar fallback", lambda: scalar_event.emit_columns(ts, values)),
+        ("emit_columns(), vectorized handler", lambda: vector_event.emit_columns(ts, values)),
+    ]
+
+    baseline = None
+    table = []
+    for label, fn in cases:
+        t = percentile(measure(fn, repeat=REPEAT), 50)
+        baseline = baseline or t
+        table.append([label, f"{t * 1e3:.2f}ms", f"{SAMPLES / t / 1e6:.1f}M/s", f"{baseline / t:.1f}x"])
+
+    print(f"{SAMPLES} samples, one handler\n")
+    print_table(["mode", "median", "samples/s", "speedup"], table)
+
+
+if __name__ == "__main__":
+    main()
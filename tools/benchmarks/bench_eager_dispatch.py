@@ -0,0 +1,63 @@
+"""
+Eager versus scheduled dispatch of async handlers.
+
+With ``eager=True`` each async handler runs until its first suspension inside
+the emit call, and only handlers that actually suspend become scheduled
+tasks. This helps handlers that usually return without awaiting, e.g. on a
+cache hit. Eager tasks require Python 3.12+.
+"""
+
+import asyncio
+import sys
+import time
+
+import common  # noqa: F401  (puts src/ on sys.path)
+from common import print_table
+
+from pyesys import create_event
+
+HANDLERS = 20
+EMITS = 2_000
+
+
+async def immediate(value: int) -> None:
+    return None
+
+
+async def suspending(value: int) -> None:
+    await asyncio.sleep(0)
+
+
+async def run(handler, eager: bool) -> float:
+    event, listener = create_event(
+        example=lambda value: None, eager=eager, allow_duplicates=True
+    )
+    for _ in range(HANDLERS):
+        listener += handler
+
+    await event.emit_async(0)
+    start = time.perf_counter()
+    for i in range(EMITS):
+        await event.emit_async(i)
+    return (time.perf_counter() - start) / EMITS
+
+
+async def main() -> None:
+    if not hasattr(asyncio, "eager_task_factory"):
+        print(f"Eager tasks need Python 3.12+, running {sys.version.split()[0]}")
+        return
+
+    rows = []
+    for label, handler in [("completes immediately", immediate), ("suspends", suspending)]:
+        scheduled = await run(handler, eager=False)
+        eager = await run(handler, eager=True)
+        rows.append(
+            [label, f"{scheduled * 1e6:.1f}us", f"{eager * 1e6:.1f}us", f"{scheduled / eager:.2f}x"]
+        )
+
+    print(f"emit_async latency, {HANDLERS} async handlers ({EMITS} emits)\n")
+    print_table(["handler", "scheduled", "eager", "speedup"], rows)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,82 @@
+"""
+emit_async cost with 1,000 mixed sync/async handlers.
+
+Handlers are classified once when subscriptions change, so emit_async goes
+straight to task creation and executor submission. The "per-emit
+classification" row reproduces the earlier loop, which rebuilt each bound
+method and ran ``inspect.iscoroutinefunction`` on every emit.
+"""
+
+import asyncio
+import inspect
+import time
+
+import common  # noqa: F401  (puts src/ on sys.path)
+from common import print_table
+
+from pyesys import create_event
+
+HANDLERS = 1_000
+EMITS = 50
+
+
+class Subscriber:
+    async def on_async(self, value: int) -> None:
+        pass
+
+    def on_sync(self, value: int) -> None:
+        pass
+
+
+async def legacy_emit_async(event, *args, **kwargs) -> None:
+    """The pre-plan emit_async loop, for comparison."""
+    plan = event._plan or event._publish()
+    loop = asyncio.get_running_loop()
+    tasks = []
+    for h in plan.handlers:
+        callback = h.get_callback()
+        if callback is None:
+            continue
+        if inspect.iscoroutinefunction(callback) or (
+            hasattr(callback, "__func__")
+            and inspect.iscoroutinefunction(callback.__func__)
+        ):
+            coroutine = callback(*args, **kwargs)
+            tasks.append(loop.create_task(event._wrap_async_handler(coroutine, h)))
+        else:
+            tasks.append(
+                loop.run_in_executor(None, event._wrap_sync_handler, h, args, kwargs)
+            )
+    if tasks:
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+
+async def run(emit) -> float:
+    await emit(0)  # warm up executor threads and the dispatch plan
+    start = time.perf_counter()
+    for i in range(EMITS):
+        await emit(i)
+    return (time.perf_counter() - start) / EMITS
+
+
+async def main() -> None:
+    event, listener = create_event(example=lambda value: None)
+    subscribers = [Subscriber() for _ in range(HANDLERS // 2)]
+    for sub in subscribers:
+        listener += [sub.on_async, sub.on_sync]
+
+    legacy = await run(lambda v: legacy_emit_async(event, v))
+    planned = await run(event.emit_async)
+
+    print(f"emit_async with {HANDLERS:,} mixed handlers ({EMITS} emits)\n")
+    print_table(
+        ["dispatch", "per emit"],
+        [
+            ["per-emit classification", f"{legacy * 1e3:.2f}ms"],
+            ["precomputed plan", f"{planned * 1e3:.2f}ms"],
+        ],
+    )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
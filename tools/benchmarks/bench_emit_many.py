@@ -0,0 +1,67 @@
+"""
+Batched emission: a loop of ``emit()`` calls versus one ``emit_many()``.
+
+``emit_many`` resolves the handler set once per batch instead of once per
+payload. A handler marked with ``@batch_handler`` goes further and is called
+once with the whole batch, which is where most of the per-call overhead goes.
+"""
+
+import common  # noqa: F401  (puts src/ on sys.path)
+from common import measure, percentile, print_table
+
+from pyesys import batch_handler, create_event
+
+BATCH = 10_000
+HANDLERS = 4
+REPEAT = 20
+
+
+def build(batched: bool):
+    event, listener = create_event(example=lambda a, b: None)
+    total = [0]
+
+    def per_item(a, b):
+        total[0] += a
+
+    @batch_handler
+    def per_batch(batch):
+        acc = 0
+        for a, _b in batch:
+            acc += a
+        total[0] += acc
+
+    for _ in range(HANDLERS):
+        listener += per_batch if batched else per_item
+    return event
+
+
+def main() -> None:
+    items = [(i, i) for i in range(BATCH)]
+    rows = []
+    for label, batched in [("per-item handlers", False), ("batch handlers", True)]:
+        event = build(batched)
+
+        def loop():
+            for args in items:
+                event.emit(*args)
+
+        def many():
+            event.emit_many(items)
+
+        t_loop = percentile(measure(loop, repeat=REPEAT), 50)
+        t_many = percentile(measure(many, repeat=REPEAT), 50)
+        rows.append(
+            [
+                label,
+                f"{t_loop / BATCH * 1e9:.0f}ns",
+                f"{t_many / BATCH * 1e9:.0f}ns",
+                f"{t_loop / t_many:.2f}x",
+            ]
+        )
+
+    print(f"Per-payload cost, {HANDLERS} handlers, batches of {BATCH}\n")
+    print_table(["handlers", "emit() loop", "emit_many()", "speedup"], rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""
+Multi-threaded emit throughput.
+
+Emitters read the published handler tuple without taking the Event lock, so
+adding emitting threads should not add lock contention. On a GIL build the
+aggregate throughput stays roughly flat; on a free-threaded build it should
+scale with the number of cores.
+"""
+
+import threading
+import time
+
+import common  # noqa: F401  (puts src/ on sys.path)
+from common import print_table
+
+from pyesys import create_event
+
+THREAD_COUNTS = [1, 2, 4, 8]
+EMITS_PER_THREAD = 50_000
+HANDLERS = 8
+
+
+def run(thread_count: int) -> float:
+    event, listener = create_event(example=lambda value: None)
+    for _ in range(HANDLERS):
+        listener += lambda value: None
+
+    barrier = threading.Barrier(thread_count + 1)
+
+    def worker() -> None:
+        emit = event.emit
+        barrier.wait()
+        for i in range(EMITS_PER_THREAD):
+            emit(i)
+
+    threads = [threading.Thread(target=worker) for _ in range(thread_count)]
+    for t in threads:
+        t.start()
+    barrier.wait()
+    start = time.perf_counter()
+    for t in threads:
+        t.join()
+    elapsed = time.perf_counter() - start
+    return thread_count * EMITS_PER_THREAD / elapsed
+
+
+def main() -> None:
+    baseline = None
+    rows = []
+    for count in THREAD_COUNTS:
+        rate = run(count)
+        baseline = baseline or rate
+        rows.append([count, f"{rate:,.0f}", f"{rate / baseline:.2f}x"])
+
+    print(f"Aggregate emit throughput, {HANDLERS} handlers per event\n")
+    print_table(["threads", "emits/s", "vs 1 thread"], rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+"""
+Emit throughput while a handler fails on every call.
+
+With the default error handler each failure is formatted and written to
+stderr inside ``emit``. QueuedErrorHandler only enqueues the exception; a
+background thread writes the first one per window and counts the repeats.
+stderr is redirected to a temporary file so the storm stays off the terminal
+while still paying for real writes.
+"""
+
+import contextlib
+import tempfile
+
+import common  # noqa: F401  (puts src/ on sys.path)
+from common import print_table, throughput
+
+from pyesys import QueuedErrorHandler, create_event
+
+EMITS = 20_000
+
+
+def failing(value):
+    raise ConnectionError("downstream unavailable")
+
+
+def run(error_handler) -> float:
+    event, listener = create_event(example=lambda value: None, error_handler=error_handler)
+    listener += failing
+    return throughput(lambda: event.emit(1), EMITS)
+
+
+def main() -> None:
+    rows = []
+    with tempfile.TemporaryFile("w") as sink, contextlib.redirect_stderr(sink):
+        rows.append(["default_error_handler", f"{run(None):,.0f}"])
+        reporter = QueuedErrorHandler(window=1.0)
+        rows.append(["QueuedErrorHandler", f"{run(reporter):,.0f}"])
+        reporter.close()
+        stats = reporter.stats()
+
+    print(f"Emits/s with one handler failing on every call\n")
+    print_table(["error handler", "emits/s"], rows)
+    print(f"\nQueuedErrorHandler wrote {stats['written']} report(s), "
+          f"counted {stats['suppressed']:,} repeat(s), dropped {stats['dropped']:,}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""
+Latency of ``obj.on_x`` attribute access for per-instance ``@event``s.
+
+Compares the two storage modes of EventDescriptor: the Event kept on the
+instance (in ``__dict__`` or a declared slot) and the WeakKeyDictionary
+fallback used by classes that allow neither. Each access goes through the
+descriptor; the weak-dict mode additionally hashes the instance and builds a
+weak reference per lookup.
+"""
+
+import common  # noqa: F401  (puts src/ on sys.path)
+from common import measure, percentile, print_table
+
+from pyesys import event
+
+ACCESSES = 10_000
+REPEAT = 50
+
+
+class DictModel:
+    @event
+    def on_changed(self, value):
+        pass
+
+
+class SlotModel:
+    __slots__ = ("_pyesys_on_changed", "__weakref__")
+
+    @event
+    def on_changed(self, value):
+        pass
+
+
+class WeakModel:
+    __slots__ = ("__weakref__",)
+
+    @event
+    def on_changed(self, value):
+        pass
+
+
+def bench(model_cls: type) -> float:
+    obj = model_cls()
+    obj.on_changed  # create the Event outside the timed loop
+
+    def access() -> None:
+        for _ in range(ACCESSES):
+            obj.on_changed
+
+    return percentile(measure(access, REPEAT), 50) / ACCESSES
+
+
+def main() -> None:
+    rows = []
+    for label, cls in (
+        ("instance __dict__", DictModel),
+        ("declared slot", SlotModel),
+        ("weak dict fallback", WeakModel),
+    ):
+        assert cls.on_changed.storage == ("weakref" if cls is WeakModel else "instance")
+        rows.append([label, f"{bench(cls) * 1e9:,.0f}"])
+
+    print("Per-access latency of obj.on_changed (median)\n")
+    print_table(["storage", "ns/access"], rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""
+Memory footprint of Event objects, measured with tracemalloc.
+
+Reports the bytes retained per idle event (never subscribed to), per event
+with one function handler, and per event with one bound-method handler, so
+footprint regressions show up across releases.
+"""
+
+import tracemalloc
+from typing import Callable, List
+
+import common  # noqa: F401  (puts src/ on sys.path)
+from common import print_table
+
+from pyesys import Event
+
+EVENTS = 20_000
+
+
+def handler(value):
+    pass
+
+
+class Owner:
+    def method(self, value):
+        pass
+
+
+def bytes_per_event(setup: Callable[[Event], None]) -> float:
+    events: List[Event] = []
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    for _ in range(EVENTS):
+        e = Event()
+        setup(e)
+        events.append(e)
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    # Subtract the list holding the events
+    return (after - before) / EVENTS - 8
+
+
+def main() -> None:
+    owner = Owner()
+    rows = []
+    for label, setup in (
+        ("idle", lambda e: None),
+        ("one function handler", lambda e: e.subscribe_one(handler)),
+        ("one bound-method handler", lambda e: e.subscribe_one(owner.method)),
+    ):
+        rows.append([label, f"{bytes_per_event(setup):,.0f}"])
+
+    print(f"Retained memory per Event over {EVENTS:,} events (tracemalloc)\n")
+    print_table(["event", "bytes/event"], rows)
+
+
+if __name__ == "__main__":
+    main()
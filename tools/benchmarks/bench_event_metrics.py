@@ -0,0 +1,66 @@
+"""
+Overhead of per-event metrics.
+
+Unnamed events are not metered and pay one attribute check per emission.
+Named events (and descriptor events declared with ``metrics=True``) add one
+increment of the calling thread's counter shard; scraping merges the shards
+and renders the Prometheus text without pausing emitters.
+"""
+
+import common  # noqa: F401  (puts src/ on sys.path)
+from common import measure, percentile, print_table
+
+from pyesys import create_event, event, get_metrics_registry, render_prometheus
+
+OPS = 20_000
+REPEAT = 15
+HANDLERS = 4
+EVENTS = 200
+
+
+def per_emit(emit) -> float:
+    def run() -> None:
+        for i in range(OPS):
+            emit(i)
+
+    return percentile(measure(run, REPEAT), 50) / OPS * 1e9
+
+
+def make_event(**options):
+    event_obj, listener = create_event(example=lambda value: None, **options)
+    for _ in range(HANDLERS):
+        listener += lambda value: None
+    return event_obj
+
+
+class Sensor:
+    @event(metrics=True)
+    def on_reading(self, value):
+        pass
+
+
+def main() -> None:
+    unnamed = make_event()
+    named = make_event(name="bench")
+    sensor = Sensor()
+    for _ in range(HANDLERS):
+        sensor.on_reading += lambda value: None
+    descriptor = Sensor.on_reading._instance_event(sensor)
+
+    rows = [
+        ["unnamed (not metered)", f"{per_emit(unnamed.emit):,.0f}"],
+        ["named", f"{per_emit(named.emit):,.0f}"],
+        ["descriptor, metrics=True", f"{per_emit(descriptor.emit):,.0f}"],
+    ]
+    print(f"Median ns per emit, {HANDLERS} handlers\n")
+    print_table(["event", "ns/emit"], rows)
+
+    for i in range(EVENTS):
+        make_event(name=f"event_{i}").emit(i)
+    scrape = percentile(measure(render_prometheus, REPEAT), 50)
+    count = len(get_metrics_registry().collect())
+    print(f"\nrender_prometheus over {count} events: {scrape * 1e6:,.0f} us")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""
+Peak task count and memory of emit_async fan-out modes.
+
+One emission to 5,000 async subscribers, with the default unbounded fan-out,
+a worker-slot pool (``max_concurrency=64``) and sequential ``ordered=True``
+dispatch.
+"""
+
+import asyncio
+import time
+import tracemalloc
+
+import common  # noqa: F401  (puts src/ on sys.path)
+from common import print_table
+
+from pyesys import create_event
+
+SUBSCRIBERS = 5_000
+
+
+async def run(**mode) -> tuple:
+    live_tasks = peak_tasks = 0
+
+    def on_done(_task: asyncio.Task) -> None:
+        nonlocal live_tasks
+        live_tasks -= 1
+
+    def counting_factory(loop, coro, **kwargs) -> asyncio.Task:
+        nonlocal live_tasks, peak_tasks
+        task = asyncio.Task(coro, loop=loop, **kwargs)
+        live_tasks += 1
+        peak_tasks = max(peak_tasks, live_tasks)
+        task.add_done_callback(on_done)
+        return task
+
+    async def handler(value: int) -> None:
+        await asyncio.sleep(0)
+
+    asyncio.get_running_loop().set_task_factory(counting_factory)
+
+    event, listener = create_event(example=lambda value: None, allow_duplicates=True)
+    for _ in range(SUBSCRIBERS):
+        listener += handler
+    await event.emit_async(0, **mode)  # publish the plan before measuring
+
+    peak_tasks = 0
+    tracemalloc.start()
+    start = time.perf_counter()
+    await event.emit_async(1, **mode)
+    elapsed = time.perf_counter() - start
+    _, peak_bytes = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    asyncio.get_running_loop().set_task_factory(None)
+    return peak_tasks, peak_bytes, elapsed
+
+
+async def main() -> None:
+    rows = []
+    for label, mode in [
+        ("unbounded", {}),
+        ("max_concurrency=64", {"max_concurrency": 64}),
+        ("ordered", {"ordered": True}),
+    ]:
+        tasks, peak, elapsed = await run(**mode)
+        rows.append([label, f"{tasks:,}", f"{peak / 1024:,.0f} KiB", f"{elapsed * 1e3:.1f}ms"])
+
+    print(f"One emit_async to {SUBSCRIBERS:,} async handlers\n")
+    print_table(["mode", "peak tasks", "peak memory", "time"], rows)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
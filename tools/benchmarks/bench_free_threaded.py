@@ -0,0 +1,109 @@
+"""
+Multi-core scaling of emit and subscribe/unsubscribe.
+
+Runs each workload with 1, 2, 4 ... up to ``os.cpu_count()`` threads and
+reports aggregate throughput relative to one thread. Emitters read the
+published dispatch plan without locking, and ShardedEvent subscribers only
+lock their own shard, so on a free-threaded build (``python3.13t`` and later)
+both workloads should scale with the number of cores. On a GIL build the
+numbers stay roughly flat; the header says which build is running.
+"""
+
+import os
+import sys
+import threading
+import time
+from typing import Callable, List
+
+import common  # noqa: F401  (puts src/ on sys.path)
+from common import print_table
+
+from pyesys import create_event, create_sharded_event
+
+EMITS_PER_THREAD = 50_000
+CHURN_PER_THREAD = 5_000
+HANDLERS = 8
+
+
+def thread_counts() -> List[int]:
+    cores = os.cpu_count() or 1
+    counts = [1]
+    while counts[-1] * 2 <= cores:
+        counts.append(counts[-1] * 2)
+    if counts[-1] != cores:
+        counts.append(cores)
+    return counts
+
+
+def run_threads(thread_count: int, work: Callable[[int], None]) -> float:
+    barrier = threading.Barrier(thread_count + 1)
+
+    def worker(index: int) -> None:
+        barrier.wait()
+        work(index)
+
+    threads = [
+        threading.Thread(target=worker, args=(i,)) for i in range(thread_count)
+    ]
+    for t in threads:
+        t.start()
+    barrier.wait()
+    start = time.perf_counter()
+    for t in threads:
+        t.join()
+    return time.perf_counter() - start
+
+
+def emit_rate(thread_count: int) -> float:
+    event, listener = create_event(example=lambda value: None)
+    for _ in range(HANDLERS):
+        listener += lambda value: None
+
+    def work(_index: int) -> None:
+        emit = event.emit
+        for i in range(EMITS_PER_THREAD):
+            emit(i)
+
+    elapsed = run_threads(thread_count, work)
+    return thread_count * EMITS_PER_THREAD / elapsed
+
+
+def churn_rate(thread_count: int) -> float:
+    event, listener = create_sharded_event(example=lambda value: None)
+    handlers = [
+        [(lambda value: None) for _ in range(16)] for _ in range(thread_count)
+    ]
+
+    def work(index: int) -> None:
+        own = handlers[index]
+        for i in range(CHURN_PER_THREAD):
+            h = own[i % len(own)]
+            listener.subscribe(h)
+            listener.unsubscribe(h)
+
+    elapsed = run_threads(thread_count, work)
+    return thread_count * CHURN_PER_THREAD / elapsed
+
+
+def main() -> None:
+    is_gil_enabled = getattr(sys, "_is_gil_enabled", lambda: True)
+    build = "GIL enabled" if is_gil_enabled() else "free-threaded"
+    print(f"Python {sys.version.split()[0]} ({build}), {os.cpu_count()} cores\n")
+
+    for title, fn, unit in (
+        (f"emit, {HANDLERS} handlers", emit_rate, "emits/s"),
+        ("subscribe+unsubscribe, ShardedEvent", churn_rate, "pairs/s"),
+    ):
+        baseline = None
+        rows = []
+        for count in thread_counts():
+            rate = fn(count)
+            baseline = baseline or rate
+            rows.append([count, f"{rate:,.0f}", f"{rate / baseline:.2f}x"])
+        print(title)
+        print_table(["threads", unit, "vs 1 thread"], rows)
+        print()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+"""
+Overhead of per-handler latency histograms.
+
+``Event.enable_timing`` switches an event to timed handler-invocation
+hooks, so an event that never enabled timing, or disabled it again, must
+emit as fast as before. With timing on, each handler invocation adds two clock reads and one
+histogram update.
+"""
+
+import common  # noqa: F401  (puts src/ on sys.path)
+from common import measure, percentile, print_table
+
+from pyesys import create_event
+
+OPS = 20_000
+REPEAT = 15
+HANDLERS = 8
+
+
+def per_emit(event) -> float:
+    emit = event.emit
+
+    def run() -> None:
+        for i in range(OPS):
+            emit(i)
+
+    return percentile(measure(run, REPEAT), 50) / OPS * 1e9
+
+
+def make_event():
+    event, listener = create_event(example=lambda value: None)
+    for _ in range(HANDLERS):
+        listener += lambda value: None
+    return event
+
+
+def main() -> None:
+    never = make_event()
+    disabled = make_event()
+    disabled.enable_timing()
+    disabled.disable_timing()
+    enabled = make_event()
+    enabled.enable_timing()
+
+    rows = [
+        ["timing never enabled", f"{per_emit(never):,.0f}"],
+        ["timing enabled, then disabled", f"{per_emit(disabled):,.0f}"],
+        ["timing enabled", f"{per_emit(enabled):,.0f}"],
+    ]
+    print(f"Median ns per emit, {HANDLERS} handlers\n")
+    print_table(["event", "ns/emit"], rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""
+Keyed routing versus handlers that filter on their own argument.
+
+With N per-symbol subscribers, an unkeyed event calls all N handlers per
+emission and each one checks whether the symbol is its own. Subscribing with
+``key=symbol`` routes each emission to one bucket instead, so its cost no
+longer grows with N.
+"""
+
+import common  # noqa: F401  (puts src/ on sys.path)
+from common import measure, percentile, print_table
+
+from pyesys import create_event
+
+EMITS = 200
+
+
+def make_filtering(symbol, hits):
+    def handler(sym, price):
+        if sym == symbol:
+            hits[0] += 1
+
+    return handler
+
+
+def make_keyed(hits):
+    def handler(sym, price):
+        hits[0] += 1
+
+    return handler
+
+
+def main() -> None:
+    rows = []
+    for n in (100, 1_000, 20_000):
+        symbols = [f"SYM{i}" for i in range(n)]
+        targets = [symbols[(i * 7919) % n] for i in range(EMITS)]
+        hits = [0]
+
+        filtering, f_listener = create_event(example=lambda sym, price: None)
+        for s in symbols:
+            f_listener += make_filtering(s, hits)
+
+        keyed, k_listener = create_event(example=lambda sym, price: None)
+        for s in symbols:
+            k_listener.subscribe(make_keyed(hits), key=s)
+
+        def run(ev):
+            emit = ev.emit
+            for s in targets:
+                emit(s, 1.0)
+
+        t_filter = percentile(measure(lambda: run(filtering), repeat=5), 50) / EMITS
+        t_keyed = percentile(measure(lambda: run(keyed), repeat=5), 50) / EMITS
+        rows.append(
+            [
+                str(n),
+                f"{t_filter * 1e6:.1f}us",
+                f"{t_keyed * 1e6:.2f}us",
+                f"{t_filter / t_keyed:.0f}x",
+            ]
+        )
+
+    print(f"Per-emission latency, one matching subscriber per symbol ({EMITS} emits)\n")
+    print_table(["subscribers", "self-filtering", "keyed", "speedup"], rows)
+
+
+if __name__ == "__main__":
+    main()
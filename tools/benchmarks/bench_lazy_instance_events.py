@@ -0,0 +1,60 @@
+"""
+Memory and time cost of per-instance ``@event``s that are only queried.
+
+Model objects are often checked (``obj.on_changed.handler_count()``) far more
+often than anyone subscribes to them. Per-instance Events are created on
+first subscription, so read-only access should allocate nothing that
+outlives the call. The script reports the memory retained by touching many
+objects, and the cost of the first subscription, which builds the Event from
+the descriptor's shared signature.
+"""
+
+import time
+import tracemalloc
+
+import common  # noqa: F401  (puts src/ on sys.path)
+from common import print_table
+
+from pyesys import event
+
+OBJECTS = 100_000
+
+
+class Model:
+    @event
+    def on_changed(self, name, value):
+        pass
+
+
+def handler(name, value):
+    pass
+
+
+def retained_bytes(action) -> float:
+    objects = [Model() for _ in range(OBJECTS)]
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    start = time.perf_counter()
+    for obj in objects:
+        action(obj)
+    elapsed = time.perf_counter() - start
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return (after - before) / OBJECTS, elapsed / OBJECTS
+
+
+def main() -> None:
+    rows = []
+    for label, action in (
+        ("handler_count()", lambda obj: obj.on_changed.handler_count()),
+        ("first subscribe", lambda obj: obj.on_changed.subscribe(handler)),
+    ):
+        per_object, per_call = retained_bytes(action)
+        rows.append([label, f"{per_object:,.0f}", f"{per_call * 1e6:.2f}"])
+
+    print(f"Retained memory over {OBJECTS:,} objects (tracemalloc)\n")
+    print_table(["access", "bytes/object", "us/call"], rows)
+
+
+if __name__ == "__main__":
+    main()
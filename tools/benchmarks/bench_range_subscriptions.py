@@ -0,0 +1,88 @@
+"""
+Range subscriptions versus threshold handlers that filter on their own.
+
+Each of N alert handlers wants ticks whose price lies in its own ``[a, b]``
+band. Unkeyed, every tick calls all N handlers. With ``subscribe_range`` the
+bounds go into a sorted interval index and only the matching handlers are
+called, found with binary searches per width class plus a NumPy compare of
+large candidate windows (a Python scan when NumPy is not installed).
+"""
+
+import random
+
+import common  # noqa: F401  (puts src/ on sys.path)
+from common import measure, percentile, print_table
+
+from pyesys import create_event, ranges
+
+RANGES = 100_000
+TICKS = 200
+MAX_WIDTH = 20.0
+PRICE_SPAN = 100_000.0
+
+
+def make_filtering(low, high, hits):
+    def handler(price):
+        if low <= price <= high:
+            hits[0] += 1
+
+    return handler
+
+
+def make_alert(hits):
+    def handler(price):
+        hits[0] += 1
+
+    return handler
+
+
+def build_ranged(bands, hits):
+    event, listener = create_event(example=lambda price: None)
+    for low, high in bands:
+        listener.subscribe_range(make_alert(hits), low, high)
+    event.emit(-1.0)  # Build the interval index outside the timed loop
+    return event
+
+
+def run(event, ticks):
+    emit = event.emit
+    for price in ticks:
+        emit(price)
+
+
+def main() -> None:
+    rng = random.Random(42)
+    bands = []
+    for _ in range(RANGES):
+        low = rng.uniform(0, PRICE_SPAN)
+        bands.append((low, low + rng.uniform(0, MAX_WIDTH)))
+    ticks = [rng.uniform(0, PRICE_SPAN) for _ in range(TICKS)]
+
+    rows = []
+    hits = [0]
+    filtering, listener = create_event(example=lambda price: None)
+    for low, high in bands:
+        listener += make_filtering(low, high, hits)
+    t = percentile(measure(lambda: run(filtering, ticks[:20]), repeat=3), 50) / 20
+    rows.append(["handlers filter themselves", f"{t * 1e6:.0f}us", "1x"])
+    baseline = t
+
+    backends = [("range index, NumPy", ranges._np)]
+    if ranges._np is not None:
+        backends.append(("range index, no NumPy", None))
+    saved = ranges._np
+    for label, np_module in backends:
+        ranges._np = np_module
+        try:
+            ranged = build_ranged(bands, hits)
+            t = percentile(measure(lambda: run(ranged, ticks), repeat=5), 50) / TICKS
+        finally:
+            ranges._np = saved
+        rows.append([label, f"{t * 1e6:.0f}us", f"{baseline / t:.0f}x"])
+
+    print(f"Per-tick latency, {RANGES} ranges of width <= {MAX_WIDTH:g}\n")
+    print_table(["mode", "per tick", "speedup"], rows)
+
+
+if __name__ == "__main__":
+    main()
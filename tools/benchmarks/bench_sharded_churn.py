@@ -0,0 +1,84 @@
+"""
+Subscription churn under contention: Event versus ShardedEvent.
+
+Every thread repeatedly subscribes and unsubscribes its own short-lived
+handlers on one shared event. A plain Event serializes all of them on its
+single lock; a ShardedEvent only locks the shard owning each handler. The
+table reports aggregate subscribe/unsubscribe operations per second.
+
+On a GIL build the interpreter lock bounds throughput either way and both
+variants perform about the same; the sharded event pays off on free-threaded
+builds, where threads on different shards proceed in parallel.
+"""
+
+import sys
+import threading
+import time
+
+import common  # noqa: F401  (puts src/ on sys.path)
+from common import print_table
+
+from pyesys import create_event, create_sharded_event
+
+THREAD_COUNTS = [1, 2, 4, 8, 16, 32, 64]
+OPS_PER_THREAD = 2_000
+HANDLERS_PER_THREAD = 4
+SHARDS = 32
+
+
+def make_handler():
+    def handler(value):
+        pass
+
+    return handler
+
+
+def run(factory, thread_count: int) -> float:
+    event, listener = factory()
+    # Long-lived subscribers that stay on the event throughout
+    for _ in range(64):
+        listener += make_handler()
+
+    barrier = threading.Barrier(thread_count + 1)
+
+    def worker() -> None:
+        handlers = [make_handler() for _ in range(HANDLERS_PER_THREAD)]
+        subscribe, unsubscribe = listener.subscribe, listener.unsubscribe
+        barrier.wait()
+        for i in range(OPS_PER_THREAD // 2):
+            h = handlers[i % HANDLERS_PER_THREAD]
+            subscribe(h)
+            unsubscribe(h)
+
+    threads = [threading.Thread(target=worker) for _ in range(thread_count)]
+    for t in threads:
+        t.start()
+    barrier.wait()
+    start = time.perf_counter()
+    for t in threads:
+        t.join()
+    elapsed = time.perf_counter() - start
+    return thread_count * OPS_PER_THREAD / elapsed
+
+
+def main() -> None:
+    if hasattr(sys, "_is_gil_enabled"):
+        build = "GIL" if sys._is_gil_enabled() else "free-threaded"
+    else:
+        build = "GIL"
+
+    plain = lambda: create_event(example=lambda value: None)
+    sharded = lambda: create_sharded_event(example=lambda value: None, shards=SHARDS)
+
+    rows = []
+    for n in THREAD_COUNTS:
+        a = run(plain, n)
+        b = run(sharded, n)
+        rows.append([str(n), f"{a / 1e3:.0f}k ops/s", f"{b / 1e3:.0f}k ops/s", f"{b / a:.2f}x"])
+
+    print(f"Subscribe/unsubscribe churn, {OPS_PER_THREAD} ops per thread ({build} build)\n")
+    print_table(["threads", "Event", f"ShardedEvent({SHARDS})", "ratio"], rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""
+Subscription cost with the signature validation cache.
+
+Subscribing the same method of many freshly created objects repeats the
+same signature check. With the verdict cache, only the first subscription
+inspects the signature and the rest are a dict lookup.
+"""
+
+import inspect
+import time
+
+import common  # noqa: F401  (puts src/ on sys.path)
+from common import print_table
+
+from pyesys import create_event, signature_cache_info, clear_signature_cache
+from pyesys.event import Event
+
+OBJECTS = 100_000
+
+
+class Model:
+    def on_change(self, value: int) -> None:
+        pass
+
+
+def uncached_validate(self, handler) -> None:
+    """The pre-cache validation path, for comparison."""
+    full_sig = inspect.signature(handler.__func__)
+    params = list(full_sig.parameters.values())[1:]
+    handler_sig = full_sig.replace(parameters=params)
+    if not Event._is_signature_compatible(handler_sig, self._sig):
+        raise TypeError("incompatible")
+
+
+def subscribe_all() -> float:
+    event, listener = create_event(example=lambda value: None)
+    models = [Model() for _ in range(OBJECTS)]
+    start = time.perf_counter()
+    for model in models:
+        listener += model.on_change
+    return (time.perf_counter() - start) / OBJECTS
+
+
+def main() -> None:
+    clear_signature_cache()
+    cached = subscribe_all()
+    info = signature_cache_info()
+
+    original = Event._validate_handler
+    Event._validate_handler = uncached_validate
+    try:
+        uncached = subscribe_all()
+    finally:
+        Event._validate_handler = original
+
+    print(f"Subscribing one method of {OBJECTS:,} objects\n")
+    print_table(
+        ["validation", "per subscribe"],
+        [
+            ["inspect.signature", f"{uncached * 1e6:.2f}us"],
+            ["verdict cache", f"{cached * 1e6:.2f}us"],
+        ],
+    )
+    print(f"\ncache: hits={info['hits']:,} misses={info['misses']:,}")
+
+
+if __name__ == "__main__":
+    main()
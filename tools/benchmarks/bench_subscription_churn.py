@@ -0,0 +1,50 @@
+"""
+Subscribe/unsubscribe cost versus handler count.
+
+Handlers are stored in a hash-indexed registry, so subscribing and
+unsubscribing one handler should cost the same whether the event already has
+a hundred or fifty thousand subscribers.
+"""
+
+import time
+
+import common  # noqa: F401  (puts src/ on sys.path)
+from common import print_table
+
+from pyesys import create_event
+
+SIZES = [100, 10_000, 50_000]
+CHURN = 5_000
+
+
+class Subscriber:
+    def on_value(self, value: int) -> None:
+        pass
+
+
+def main() -> None:
+    rows = []
+    for size in SIZES:
+        event, listener = create_event(example=lambda value: None)
+        keep = [Subscriber() for _ in range(size)]
+        start = time.perf_counter()
+        for sub in keep:
+            listener += sub.on_value
+        fill = (time.perf_counter() - start) / size
+
+        churners = [Subscriber() for _ in range(CHURN)]
+        start = time.perf_counter()
+        for sub in churners:
+            listener += sub.on_value
+            listener -= sub.on_value
+        churn = (time.perf_counter() - start) / CHURN
+
+        event.emit(0)
+        rows.append([f"{size:,}", f"{fill * 1e6:.2f}us", f"{churn * 1e6:.2f}us"])
+
+    print("Per-operation subscription cost\n")
+    print_table(["handlers", "subscribe (fill)", "subscribe+unsubscribe"], rows)
+
+
+if __name__ == "__main__":
+    main()
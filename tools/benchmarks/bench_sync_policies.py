@@ -0,0 +1,49 @@
+"""
+emit_async sync-handler policies: executor, inline and batched.
+
+"executor" submits one executor job per sync handler, "batched" submits one
+job per emission, and "inline" calls the handlers on the loop thread.
+"""
+
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import common  # noqa: F401  (puts src/ on sys.path)
+from common import print_table
+
+from pyesys import create_event
+
+HANDLER_COUNTS = [1, 10, 100]
+EMITS = 200
+
+
+async def run(policy: str, handlers: int, pool: ThreadPoolExecutor) -> float:
+    event, listener = create_event(
+        example=lambda value: None, executor=pool, sync_policy=policy
+    )
+    for _ in range(handlers):
+        listener += lambda value: None
+
+    await event.emit_async(0)  # warm up
+    start = time.perf_counter()
+    for i in range(EMITS):
+        await event.emit_async(i)
+    return (time.perf_counter() - start) / EMITS
+
+
+async def main() -> None:
+    rows = []
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        for handlers in HANDLER_COUNTS:
+            row = [handlers]
+            for policy in ("executor", "batched", "inline"):
+                row.append(f"{await run(policy, handlers, pool) * 1e6:,.1f}us")
+            rows.append(row)
+
+    print(f"emit_async latency with cheap sync handlers ({EMITS} emits)\n")
+    print_table(["handlers", "executor", "batched", "inline"], rows)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,66 @@
+"""
+Cost of locking: thread-safe events versus ``threadsafe=False``.
+
+Emission reads the published dispatch plan without locking in every mode,
+so plain ``emit`` should be unaffected. Subscription changes, and the first
+emission after each change (which rebuilds the plan under the lock), are
+where the lock-free mode saves time. ``thread_check=True`` adds one thread
+identity check per locked operation.
+"""
+
+import common  # noqa: F401  (puts src/ on sys.path)
+from common import measure, percentile, print_table
+
+from pyesys import create_event
+
+OPS = 5_000
+REPEAT = 20
+HANDLERS = 8
+
+MODES = (
+    ("threadsafe", {}),
+    ("threadsafe=False", {"threadsafe": False}),
+    ("thread_check", {"threadsafe": False, "thread_check": True}),
+)
+
+
+def per_op(fn) -> float:
+    return percentile(measure(fn, REPEAT), 50) / OPS * 1e9
+
+
+def bench(options: dict) -> list:
+    event, listener = create_event(example=lambda value: None, **options)
+    for _ in range(HANDLERS):
+        listener += lambda value: None
+
+    def extra(value):
+        pass
+
+    subscribe, unsubscribe, emit = event.subscribe_one, event.unsubscribe_one, event.emit
+
+    def churn() -> None:
+        for _ in range(OPS):
+            subscribe(extra)
+            unsubscribe(extra)
+
+    def emits() -> None:
+        for i in range(OPS):
+            emit(i)
+
+    def churn_and_emit() -> None:
+        for i in range(OPS):
+            subscribe(extra)
+            emit(i)
+            unsubscribe(extra)
+
+    return [f"{per_op(fn):,.0f}" for fn in (churn, emits, churn_and_emit)]
+
+
+def main() -> None:
+    rows = [[label] + bench(options) for label, options in MODES]
+    print(f"Median ns per operation, {HANDLERS} handlers\n")
+    print_table(["mode", "sub+unsub", "emit", "sub+emit+unsub"], rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+"""
+Shared helpers for the PyESys benchmark scripts.
+
+Each ``bench_*.py`` script in this directory is standalone and can be run with
+``python tools/benchmarks/bench_<name>.py`` from the repository root. The
+scripts prefer the in-tree sources under ``src/`` so they measure the working
+copy rather than an installed release.
+"""
+
+import os
+import sys
+import time
+import statistics
+from typing import Callable, Iterable, List, Sequence
+
+_SRC = os.path.join(os.path.dirname(__file__), os.pardir, os.pardir, "src")
+if os.path.isdir(_SRC):
+    sys.path.insert(0, os.path.abspath(_SRC))
+
+
+def measure(fn: Callable[[], object], repeat: int) -> List[float]:
+    """
+    Time ``repeat`` individual calls of ``fn``.
+
+    :param fn: Zero-argument callable to time.
+    :param repeat: Number of timed calls.
+    :return: Per-call durations in seconds.
+    """
+    samples = []
+    perf = time.perf_counter
+    for _ in range(repeat):
+        start = perf()
+        fn()
+        samples.append(perf() - start)
+    return samples
+
+
+def throughput(fn: Callable[[], object], count: int) -> float:
+    """
+    Call ``fn`` ``count`` times and return calls per second.
+
+    :param fn: Zero-argument callable to run.
+    :param count: Number of calls.
+    :return: Calls per second.
+    """
+    start = time.perf_counter()
+    for _ in range(count):
+        fn()
+    return count / (time.perf_counter() - start)
+
+
+def percentile(samples: Sequence[float], pct: float) -> float:
+    """
+    Nearest-rank percentile of a sample set.
+
+    :param samples: Sample values.
+    :param pct: Percentile between 0 and 100.
+    :return: The percentile value.
+    """
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, max(0, round(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+def summarize_us(samples: Sequence[float]) -> str:
+    """
+    Format latency samples as microsecond p50/p99/max.
+
+    :param samples: Durations in seconds.
+    :return: Human-readable summary.
+    """
+    return (
+        f"p50={statistics.median(samples) * 1e6:9.2f}us "
+        f"p99={percentile(samples, 99) * 1e6:9.2f}us "
+        f"max={max(samples) * 1e6:9.2f}us"
+    )
+
+
+def print_table(headers: Sequence[str], rows: Iterable[Sequence[object]]) -> None:
+    """
+    Print rows as a fixed-width text table.
+
+    :param headers: Column titles.
+    :param rows: Row values; formatted with ``str``.
+    """
+    rows = [[str(c) for c in row] for row in rows]
+    widths = [len(h) for h in headers]
+    for row in rows:
+        widths = [max(w, len(c)) for w, c in zip(widths, row)]
+    print("  ".join(h.ljust(w) for h, w in zip(headers, widths)))
+    print("  ".join("-" * w for w in widths))
+    for row in rows:
+        print("  ".join(c.ljust(w) for c, w in zip(row, widths)))